@@ -0,0 +1,46 @@
+"""Shared response classes for the API."""
+
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse, StreamingResponse
+
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Handles numpy scalars/arrays and non-string dict keys natively,
+    which the analytics endpoints return frequently.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+def stream_json_list(
+    fields: dict[str, Any], key: str, items: Iterable[Any]
+) -> StreamingResponse:
+    """
+    Stream ``{**fields, key: [*items]}`` as one JSON document.
+
+    Each item is serialized and sent as soon as it is produced, so the
+    rendered payload never sits in memory at once. Load any data before
+    calling this: once streaming starts the 200 status is already sent,
+    so a failure can no longer become an error response.
+    """
+    def body() -> Iterator[bytes]:
+        head = orjson.dumps(fields, option=ORJSON_OPTIONS)
+        # Reopen the object to append the streamed list
+        prefix = head[:-1] + (b"," if fields else b"")
+        yield prefix + orjson.dumps(key) + b":["
+        separator = b""
+        for item in items:
+            yield separator + orjson.dumps(item, option=ORJSON_OPTIONS)
+            separator = b","
+        yield b"]}"
+
+    return StreamingResponse(body(), media_type="application/json")
@@ -3,6 +3,7 @@
 import logging
 from fastapi import APIRouter, Depends, HTTPException, Query
 
+from app.api.responses import ORJSONResponse, stream_json_list
 from app.dependencies import get_telemetry_service, get_fetcher, get_telemetry_repository, get_session_repository
 from app.services import TelemetryService
 from app.ingestion import FastF1Fetcher
@@ -57,7 +58,11 @@ async def get_available_telemetry(
     }
 
 
-@router.get("/{session_id}/{driver_id}/{lap_number}/speed-trace", response_model=SpeedTraceResponse)
+@router.get(
+    "/{session_id}/{driver_id}/{lap_number}/speed-trace",
+    response_class=ORJSONResponse,
+    responses={200: {"model": SpeedTraceResponse}},
+)
 async def get_speed_trace(
     session_id: str,
     driver_id: str,
@@ -75,12 +80,15 @@ async def get_speed_trace(
     if not trace:
         raise HTTPException(status_code=404, detail="Speed trace not available")
 
-    return SpeedTraceResponse(
-        session_id=session_id,
-        driver_id=driver_id,
-        lap_number=lap_number,
-        points=trace,
-    )
+    # Rendered directly rather than through a response_model: re-validating
+    # one dict per point against SpeedTraceResponse costs more than
+    # serializing them. The schema is only declared for the OpenAPI docs
+    return ORJSONResponse({
+        "session_id": session_id,
+        "driver_id": driver_id,
+        "lap_number": lap_number,
+        "points": trace,
+    })
 
 
 @router.get("/{session_id}/{driver_id}/{lap_number}/gear-changes")
@@ -105,7 +113,10 @@ async def get_gear_changes(
     }
 
 
-@router.post("/{session_id}/compare", response_model=TelemetryComparisonResponse)
+@router.post(
+    "/{session_id}/compare",
+    responses={200: {"model": TelemetryComparisonResponse}},
+)
 async def compare_telemetry(
     session_id: str,
     comparisons: list[dict],  # [{"driver_id": "VER", "lap_number": 10}, ...]
@@ -151,9 +162,12 @@ async def compare_telemetry(
     comparison_tuples = [
         (c["driver_id"], c["lap_number"]) for c in comparisons
     ]
-    results = await telemetry_service.compare_laps(session_id, comparison_tuples)
 
-    return TelemetryComparisonResponse(
-        session_id=session_id,
-        laps=results,
+    # Read every frame before responding so a failed read is still an
+    # error response; only the serialization is streamed, a lap at a time
+    frames = await telemetry_service.get_compare_frames(session_id, comparison_tuples)
+    return stream_json_list(
+        {"session_id": session_id},
+        "laps",
+        telemetry_service.iter_compare_laps(frames),
     )
@@ -28,9 +28,38 @@ from app.services import (
     StrategyService,
     TelemetryService,
 )
+from app.services.result_cache import ResultCache
 
 
 # Repository Dependencies
+#
+# File repositories keep an in-process entity cache, so a single instance
+# per data directory is shared across requests instead of one per request.
+
+@lru_cache
+def _file_session_repository(data_dir: Path) -> FileSessionRepository:
+    return FileSessionRepository(data_dir)
+
+
+@lru_cache
+def _file_lap_repository(data_dir: Path) -> FileLapRepository:
+    return FileLapRepository(data_dir)
+
+
+@lru_cache
+def _file_driver_repository(data_dir: Path) -> FileDriverRepository:
+    return FileDriverRepository(data_dir)
+
+
+@lru_cache
+def _file_stint_repository(data_dir: Path) -> FileStintRepository:
+    return FileStintRepository(data_dir)
+
+
+@lru_cache
+def _file_telemetry_repository(data_dir: Path) -> FileTelemetryRepository:
+    return FileTelemetryRepository(data_dir)
+
 
 def get_session_repository(
     settings: Settings = Depends(get_settings),
@@ -39,7 +68,7 @@ def get_session_repository(
     if settings.storage_backend == StorageBackend.DYNAMODB:
         # Future: return DynamoDBSessionRepository(settings.dynamodb_config)
         raise NotImplementedError("DynamoDB backend not yet implemented")
-    return FileSessionRepository(settings.data_dir)
+    return _file_session_repository(settings.data_dir)
 
 
 def get_lap_repository(
@@ -48,7 +77,7 @@ def get_lap_repository(
     """Get lap repository based on storage backend."""
     if settings.storage_backend == StorageBackend.DYNAMODB:
         raise NotImplementedError("DynamoDB backend not yet implemented")
-    return FileLapRepository(settings.data_dir)
+    return _file_lap_repository(settings.data_dir)
 
 
 def get_driver_repository(
@@ -57,7 +86,7 @@ def get_driver_repository(
     """Get driver repository based on storage backend."""
     if settings.storage_backend == StorageBackend.DYNAMODB:
         raise NotImplementedError("DynamoDB backend not yet implemented")
-    return FileDriverRepository(settings.data_dir)
+    return _file_driver_repository(settings.data_dir)
 
 
 def get_stint_repository(
@@ -66,7 +95,7 @@ def get_stint_repository(
     """Get stint repository based on storage backend."""
     if settings.storage_backend == StorageBackend.DYNAMODB:
         raise NotImplementedError("DynamoDB backend not yet implemented")
-    return FileStintRepository(settings.data_dir)
+    return _file_stint_repository(settings.data_dir)
 
 
 def get_telemetry_repository(
@@ -75,11 +104,23 @@ def get_telemetry_repository(
     """Get telemetry repository based on storage backend."""
     if settings.storage_backend == StorageBackend.DYNAMODB:
         raise NotImplementedError("DynamoDB backend not yet implemented")
-    return FileTelemetryRepository(settings.data_dir)
+    return _file_telemetry_repository(settings.data_dir)
 
 
 # Service Dependencies
 
+@lru_cache
+def _lap_result_cache(data_dir: Path) -> ResultCache:
+    """Lap analysis results, shared across requests like the repositories."""
+    return ResultCache()
+
+
+@lru_cache
+def _strategy_result_cache(data_dir: Path) -> ResultCache:
+    """Strategy summaries, shared across requests like the repositories."""
+    return ResultCache()
+
+
 def get_session_service(
     session_repo: ISessionRepository = Depends(get_session_repository),
 ) -> SessionService:
@@ -88,18 +129,22 @@ def get_session_service(
 
 
 def get_lap_service(
+    settings: Settings = Depends(get_settings),
     lap_repo: ILapRepository = Depends(get_lap_repository),
 ) -> LapService:
     """Get lap service."""
-    return LapService(lap_repo)
+    return LapService(lap_repo, _lap_result_cache(settings.data_dir))
 
 
 def get_strategy_service(
+    settings: Settings = Depends(get_settings),
     stint_repo: IStintRepository = Depends(get_stint_repository),
     lap_repo: ILapRepository = Depends(get_lap_repository),
 ) -> StrategyService:
     """Get strategy service."""
-    return StrategyService(stint_repo, lap_repo)
+    return StrategyService(
+        stint_repo, lap_repo, _strategy_result_cache(settings.data_dir)
+    )
 
 
 def get_telemetry_service(
@@ -131,6 +176,8 @@ def get_ingestion_service(
     driver_repo: IDriverRepository = Depends(get_driver_repository),
     stint_repo: IStintRepository = Depends(get_stint_repository),
     telemetry_repo: ITelemetryRepository = Depends(get_telemetry_repository),
+    lap_service: LapService = Depends(get_lap_service),
+    strategy_service: StrategyService = Depends(get_strategy_service),
 ) -> IngestionService:
     """Get ingestion service."""
     fetcher = FastF1Fetcher(settings.fastf1_cache_dir)
@@ -141,4 +188,6 @@ def get_ingestion_service(
         driver_repo=driver_repo,
         stint_repo=stint_repo,
         telemetry_repo=telemetry_repo,
+        lap_service=lap_service,
+        strategy_service=strategy_service,
     )
@@ -19,10 +19,11 @@ class TireCompound(str, Enum):
         """Convert FastF1 compound string to enum."""
         if compound is None:
             return cls.UNKNOWN
-        try:
-            return cls(compound.upper())
-        except ValueError:
-            return cls.UNKNOWN
+        # FastF1 reports upper-case names, so the first lookup usually hits
+        member = _BY_VALUE.get(compound)
+        if member is None:
+            member = _BY_VALUE.get(compound.upper(), cls.UNKNOWN)
+        return member
 
     @property
     def color(self) -> str:
@@ -42,3 +43,7 @@ class TireCompound(str, Enum):
     def short_name(self) -> str:
         """Get single letter abbreviation."""
         return self.value[0] if self != self.UNKNOWN else "?"
+
+
+# Built once at import; TireCompound.from_fastf1 is a plain dict lookup
+_BY_VALUE = {compound.value: compound for compound in TireCompound}
@@ -17,25 +17,7 @@ class SessionType(str, Enum):
     @classmethod
     def from_fastf1(cls, session_name: str) -> "SessionType":
         """Convert FastF1 session name to enum."""
-        mapping = {
-            "Practice 1": cls.PRACTICE_1,
-            "Practice 2": cls.PRACTICE_2,
-            "Practice 3": cls.PRACTICE_3,
-            "Qualifying": cls.QUALIFYING,
-            "Sprint Shootout": cls.SPRINT_SHOOTOUT,
-            "Sprint Qualifying": cls.SPRINT_SHOOTOUT,
-            "Sprint": cls.SPRINT,
-            "Race": cls.RACE,
-            "FP1": cls.PRACTICE_1,
-            "FP2": cls.PRACTICE_2,
-            "FP3": cls.PRACTICE_3,
-            "Q": cls.QUALIFYING,
-            "SQ": cls.SPRINT_SHOOTOUT,
-            "SS": cls.SPRINT_SHOOTOUT,
-            "S": cls.SPRINT,
-            "R": cls.RACE,
-        }
-        return mapping.get(session_name, cls.RACE)
+        return _FASTF1_NAMES.get(session_name, cls.RACE)
 
     @property
     def display_name(self) -> str:
@@ -51,7 +33,44 @@ class SessionType(str, Enum):
         }
         return names.get(self, self.value)
 
+    @property
+    def order(self) -> int:
+        """Chronological position of the session within an event weekend."""
+        return _SESSION_ORDER[self]
+
     @property
     def is_race(self) -> bool:
         """Check if this is a race session (Race or Sprint)."""
         return self in (self.RACE, self.SPRINT)
+
+
+# Built once at import; SessionType.from_fastf1 is a plain dict lookup
+_FASTF1_NAMES = {
+    "Practice 1": SessionType.PRACTICE_1,
+    "Practice 2": SessionType.PRACTICE_2,
+    "Practice 3": SessionType.PRACTICE_3,
+    "Qualifying": SessionType.QUALIFYING,
+    "Sprint Shootout": SessionType.SPRINT_SHOOTOUT,
+    "Sprint Qualifying": SessionType.SPRINT_SHOOTOUT,
+    "Sprint": SessionType.SPRINT,
+    "Race": SessionType.RACE,
+    "FP1": SessionType.PRACTICE_1,
+    "FP2": SessionType.PRACTICE_2,
+    "FP3": SessionType.PRACTICE_3,
+    "Q": SessionType.QUALIFYING,
+    "SQ": SessionType.SPRINT_SHOOTOUT,
+    "SS": SessionType.SPRINT_SHOOTOUT,
+    "S": SessionType.SPRINT,
+    "R": SessionType.RACE,
+}
+
+# Built once at import; SessionType.order is a plain dict lookup
+_SESSION_ORDER = {
+    SessionType.PRACTICE_1: 1,
+    SessionType.PRACTICE_2: 2,
+    SessionType.PRACTICE_3: 3,
+    SessionType.SPRINT_SHOOTOUT: 4,
+    SessionType.SPRINT: 5,
+    SessionType.QUALIFYING: 6,
+    SessionType.RACE: 7,
+}
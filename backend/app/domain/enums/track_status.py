@@ -1,6 +1,7 @@
 """Track status enumeration."""
 
 from enum import Enum
+from functools import lru_cache
 
 
 class TrackStatus(str, Enum):
@@ -18,20 +19,7 @@ class TrackStatus(str, Enum):
         """Convert FastF1 track status to enum."""
         if status is None:
             return cls.GREEN
-        # FastF1 can return combined statuses like "14" (Green + SC)
-        # We take the highest priority status
-        status_str = str(status)
-        if "5" in status_str:
-            return cls.RED
-        if "4" in status_str:
-            return cls.SC
-        if "6" in status_str:
-            return cls.VSC
-        if "7" in status_str:
-            return cls.VSC_ENDING
-        if "2" in status_str:
-            return cls.YELLOW
-        return cls.GREEN
+        return _status_from_code(str(status))
 
     @property
     def display_name(self) -> str:
@@ -63,3 +51,22 @@ class TrackStatus(str, Enum):
     def affects_lap_time(self) -> bool:
         """Check if this status typically affects lap times."""
         return self not in (self.GREEN,)
+
+
+# A session only uses a handful of distinct codes, so each is resolved once
+@lru_cache(maxsize=256)
+def _status_from_code(status_str: str) -> TrackStatus:
+    """Resolve a FastF1 track status code to its highest priority flag."""
+    # FastF1 can return combined statuses like "14" (Green + SC)
+    # We take the highest priority status
+    if "5" in status_str:
+        return TrackStatus.RED
+    if "4" in status_str:
+        return TrackStatus.SC
+    if "6" in status_str:
+        return TrackStatus.VSC
+    if "7" in status_str:
+        return TrackStatus.VSC_ENDING
+    if "2" in status_str:
+        return TrackStatus.YELLOW
+    return TrackStatus.GREEN
@@ -4,7 +4,11 @@ from app.domain.models.driver import Driver
 from app.domain.models.lap import Lap
 from app.domain.models.session import Session
 from app.domain.models.team import Team
-from app.domain.models.telemetry import TelemetryFrame, TelemetryPoint
+from app.domain.models.telemetry import (
+    TelemetryColumns,
+    TelemetryFrame,
+    TelemetryPoint,
+)
 from app.domain.models.tire import PitStop, TireStint
 from app.domain.models.weather import Weather
 
@@ -14,6 +18,7 @@ __all__ = [
     "PitStop",
     "Session",
     "Team",
+    "TelemetryColumns",
     "TelemetryFrame",
     "TelemetryPoint",
     "TireStint",
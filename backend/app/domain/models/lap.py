@@ -49,6 +49,9 @@ class Lap(BaseModel):
 
     model_config = {"frozen": True}
 
+    # Deliberately not cached: total_seconds() costs ~0.25us per access,
+    # while any per-instance cache adds more than that to every Lap built
+    # and goes stale under model_copy(update={"lap_time": ...})
     @computed_field
     @property
     def lap_time_seconds(self) -> float | None:
@@ -81,8 +84,12 @@ def timedelta_to_lap_string(td: timedelta | None) -> str:
     if td is None:
         return "--:--.---"
 
-    total_seconds = td.total_seconds()
-    minutes = int(total_seconds // 60)
-    seconds = total_seconds % 60
+    # Round to whole milliseconds in integer math, so e.g. 59.9996s
+    # carries into the minute instead of printing as 0:60.000
+    millis = (
+        td.days * 86_400_000 + td.seconds * 1000 + (td.microseconds + 500) // 1000
+    )
+    minutes, millis = divmod(millis, 60_000)
+    seconds, millis = divmod(millis, 1000)
 
-    return f"{minutes}:{seconds:06.3f}"
+    return f"{minutes}:{seconds:02d}.{millis:03d}"
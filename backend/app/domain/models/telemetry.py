@@ -1,8 +1,10 @@
 """Telemetry domain models."""
 
+from dataclasses import dataclass
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class TelemetryPoint(BaseModel):
@@ -47,6 +49,56 @@ class TelemetryPoint(BaseModel):
         return self.drs >= 10
 
 
+@dataclass(frozen=True, eq=False)
+class TelemetryColumns:
+    """Read-only column arrays of a frame's telemetry points."""
+
+    distance: np.ndarray
+    speed: np.ndarray
+    gear: np.ndarray
+    throttle: np.ndarray
+    brake: np.ndarray
+    drs: np.ndarray
+    # Missing coordinates are NaN
+    x: np.ndarray
+    y: np.ndarray
+    z: np.ndarray
+
+    @classmethod
+    def from_points(cls, points: list[TelemetryPoint]) -> "TelemetryColumns":
+        """Build the column arrays in one pass over the points."""
+        n = len(points)
+        columns = cls(
+            distance=np.fromiter((p.distance for p in points), dtype=np.float64, count=n),
+            speed=np.fromiter((p.speed for p in points), dtype=np.float64, count=n),
+            gear=np.fromiter((p.gear for p in points), dtype=np.int8, count=n),
+            throttle=np.fromiter((p.throttle for p in points), dtype=np.float64, count=n),
+            brake=np.fromiter((p.brake for p in points), dtype=np.bool_, count=n),
+            drs=np.fromiter((p.drs for p in points), dtype=np.int16, count=n),
+            x=np.array([p.x for p in points], dtype=np.float64),
+            y=np.array([p.y for p in points], dtype=np.float64),
+            z=np.array([p.z for p in points], dtype=np.float64),
+        )
+        for array in vars(columns).values():
+            array.setflags(write=False)
+        return columns
+
+
+@dataclass(frozen=True)
+class _CachedColumns:
+    """A frame's column arrays with the points list they were built from."""
+
+    points: list[TelemetryPoint]
+    columns: TelemetryColumns
+
+    def __eq__(self, other: object) -> bool:
+        # Derived data: frame equality (which compares private attributes)
+        # must not depend on whether the columns were built yet
+        return other is None or isinstance(other, _CachedColumns)
+
+    __hash__ = None
+
+
 class TelemetryFrame(BaseModel):
     """Complete telemetry data for a lap."""
 
@@ -63,8 +115,26 @@ class TelemetryFrame(BaseModel):
         default_factory=list, description="Telemetry data points"
     )
 
+    _columns: _CachedColumns | None = PrivateAttr(default=None)
+
     model_config = {"frozen": True}
 
+    @property
+    def columns(self) -> TelemetryColumns:
+        """
+        Telemetry points as column arrays, built on first use.
+
+        The arrays are cached with the points list they were built from,
+        so a model_copy that replaces points rebuilds them.
+        """
+        cached = self._columns
+        if cached is None or cached.points is not self.points:
+            cached = _CachedColumns(
+                self.points, TelemetryColumns.from_points(self.points)
+            )
+            self._columns = cached
+        return cached.columns
+
     @property
     def point_count(self) -> int:
         """Get number of telemetry points."""
@@ -75,20 +145,20 @@ class TelemetryFrame(BaseModel):
         """Get maximum speed in this lap."""
         if not self.points:
             return 0.0
-        return max(p.speed for p in self.points)
+        return float(self.columns.speed.max())
 
     @property
     def track_length(self) -> float:
         """Get approximate track length from telemetry."""
         if not self.points:
             return 0.0
-        return max(p.distance for p in self.points)
+        return float(self.columns.distance.max())
 
     def get_at_distance(self, distance: float) -> TelemetryPoint | None:
         """Get telemetry point closest to given distance."""
         if not self.points:
             return None
-        return min(self.points, key=lambda p: abs(p.distance - distance))
+        return self.points[int(np.argmin(np.abs(self.columns.distance - distance)))]
 
     @classmethod
     def create_id(cls, session_id: str, driver_id: str, lap_number: int) -> str:
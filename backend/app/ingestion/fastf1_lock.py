@@ -0,0 +1,9 @@
+"""Process-wide lock around FastF1 loads."""
+
+import threading
+
+# FastF1 does not document its on-disk cache as thread-safe, and ingestion
+# and model training share one cache directory. Schedule fetches and
+# session loads, which download and write cache files, hold this lock so
+# they run one at a time; transforming the loaded data does not.
+FASTF1_LOCK = threading.Lock()
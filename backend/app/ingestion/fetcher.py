@@ -1,6 +1,8 @@
 """FastF1 data fetcher - retrieves and transforms F1 data."""
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator, Iterator
 from pathlib import Path
 from typing import Any
 
@@ -8,6 +10,7 @@ import fastf1
 import pandas as pd
 
 from app.domain.models import Driver, Lap, Session, TelemetryFrame, TireStint
+from app.ingestion.fastf1_lock import FASTF1_LOCK
 from app.ingestion.transformers import (
     transform_driver,
     transform_lap,
@@ -39,6 +42,11 @@ class FastF1Fetcher:
         fastf1.Cache.enable_cache(str(cache_dir))
         logger.info(f"FastF1 cache enabled at: {cache_dir}")
 
+    # FastF1 loading and the pandas transforms are blocking, so the async
+    # fetch methods run them in a worker thread to keep the event loop free
+    # while concurrent ingestions are in progress. The loads themselves
+    # hold FASTF1_LOCK; only the transforms run concurrently.
+
     def get_schedule(self, year: int) -> pd.DataFrame:
         """
         Get the event schedule for a year.
@@ -49,7 +57,8 @@ class FastF1Fetcher:
         Returns:
             DataFrame with event schedule
         """
-        return fastf1.get_event_schedule(year)
+        with FASTF1_LOCK:
+            return fastf1.get_event_schedule(year)
 
     def get_event(self, year: int, event: str | int) -> Any:
         """
@@ -62,7 +71,8 @@ class FastF1Fetcher:
         Returns:
             FastF1 Event object
         """
-        return fastf1.get_event(year, event)
+        with FASTF1_LOCK:
+            return fastf1.get_event(year, event)
 
     async def fetch_session(
         self,
@@ -74,6 +84,29 @@ class FastF1Fetcher:
         """
         Fetch session data from FastF1.
 
+        Args:
+            year: Season year
+            event: Event name or round number
+            session_type: Session type (FP1, FP2, FP3, Q, S, R)
+            load_telemetry: Whether to load telemetry data
+
+        Returns:
+            Tuple of (Session, list of Laps, list of Drivers)
+        """
+        return await asyncio.to_thread(
+            self._fetch_session_sync, year, event, session_type, load_telemetry
+        )
+
+    def _fetch_session_sync(
+        self,
+        year: int,
+        event: str | int,
+        session_type: str,
+        load_telemetry: bool = False
+    ) -> tuple[Session, list[Lap], list[Driver]]:
+        """
+        Load and transform a session (blocking).
+
         Args:
             year: Season year
             event: Event name or round number
@@ -86,13 +119,14 @@ class FastF1Fetcher:
         logger.info(f"Fetching session: {year} {event} {session_type}")
 
         # Get session from FastF1
-        ff1_session = fastf1.get_session(year, event, session_type)
-        ff1_session.load(
-            laps=True,
-            telemetry=load_telemetry,
-            weather=True,
-            messages=True
-        )
+        with FASTF1_LOCK:
+            ff1_session = fastf1.get_session(year, event, session_type)
+            ff1_session.load(
+                laps=True,
+                telemetry=load_telemetry,
+                weather=True,
+                messages=True
+            )
 
         # Transform session
         session = transform_session(ff1_session)
@@ -175,6 +209,32 @@ class FastF1Fetcher:
         """
         Fetch telemetry for a specific lap.
 
+        Args:
+            year: Season year
+            event: Event name or round number
+            session_type: Session type
+            driver: Driver abbreviation
+            lap_number: Lap number
+
+        Returns:
+            TelemetryFrame or None if not available
+        """
+        return await asyncio.to_thread(
+            self._fetch_telemetry_sync,
+            year, event, session_type, driver, lap_number,
+        )
+
+    def _fetch_telemetry_sync(
+        self,
+        year: int,
+        event: str | int,
+        session_type: str,
+        driver: str,
+        lap_number: int
+    ) -> TelemetryFrame | None:
+        """
+        Load and transform telemetry for a specific lap (blocking).
+
         Args:
             year: Season year
             event: Event name or round number
@@ -190,8 +250,9 @@ class FastF1Fetcher:
             f"{driver} lap {lap_number}"
         )
 
-        ff1_session = fastf1.get_session(year, event, session_type)
-        ff1_session.load(laps=True, telemetry=True)
+        with FASTF1_LOCK:
+            ff1_session = fastf1.get_session(year, event, session_type)
+            ff1_session.load(laps=True, telemetry=True)
 
         # Get the specific lap
         driver_laps = ff1_session.laps.pick_drivers(driver)
@@ -249,6 +310,9 @@ class FastF1Fetcher:
         """
         Fetch telemetry for all laps by a driver.
 
+        Prefer iter_all_telemetry_for_driver when frames can be processed
+        incrementally, as this holds every frame in memory at once.
+
         Args:
             year: Season year
             event: Event name or round number
@@ -258,17 +322,75 @@ class FastF1Fetcher:
         Returns:
             List of TelemetryFrame models
         """
+        return [
+            frame
+            async for frame in self.iter_all_telemetry_for_driver(
+                year, event, session_type, driver
+            )
+        ]
+
+    async def iter_all_telemetry_for_driver(
+        self,
+        year: int,
+        event: str | int,
+        session_type: str,
+        driver: str
+    ) -> AsyncIterator[TelemetryFrame]:
+        """
+        Yield telemetry for all laps by a driver, one lap at a time.
+
+        Each lap is transformed in a worker thread only when requested,
+        so at most one frame is built ahead of the consumer.
+
+        Args:
+            year: Season year
+            event: Event name or round number
+            session_type: Session type
+            driver: Driver abbreviation
+
+        Yields:
+            TelemetryFrame models
+        """
+        frames = self._iter_telemetry_sync(year, event, session_type, driver)
+        step: asyncio.Future | None = None
+        try:
+            while True:
+                step = asyncio.ensure_future(asyncio.to_thread(next, frames, None))
+                # Shielded so a cancelled consumer leaves the worker thread's
+                # next() running to completion rather than abandoning it
+                frame = await asyncio.shield(step)
+                if frame is None:
+                    break
+                yield frame
+        finally:
+            if step is not None and not step.done():
+                # Closing a generator mid-next raises ValueError and would
+                # mask the cancellation, so wait for the thread first
+                await asyncio.wait([step])
+                if not step.cancelled():
+                    step.exception()
+            frames.close()
+
+    def _iter_telemetry_sync(
+        self,
+        year: int,
+        event: str | int,
+        session_type: str,
+        driver: str
+    ) -> Iterator[TelemetryFrame]:
+        """Load a session and transform a driver's laps lazily (blocking)."""
         logger.info(
             f"Fetching all telemetry for {driver}: {year} {event} {session_type}"
         )
 
-        ff1_session = fastf1.get_session(year, event, session_type)
-        ff1_session.load(laps=True, telemetry=True)
+        with FASTF1_LOCK:
+            ff1_session = fastf1.get_session(year, event, session_type)
+            ff1_session.load(laps=True, telemetry=True)
 
         session = transform_session(ff1_session)
         driver_laps = ff1_session.laps.pick_drivers(driver)
 
-        frames = []
+        count = 0
         for _, lap in driver_laps.iterrows():
             try:
                 car_data = lap.get_car_data().add_distance()
@@ -296,14 +418,15 @@ class FastF1Fetcher:
                     int(lap["LapNumber"]),
                     lap_time_ms
                 )
-                frames.append(frame)
             except Exception as e:
                 logger.warning(
                     f"Failed to get telemetry for lap {lap['LapNumber']}: {e}"
                 )
+                continue
+            count += 1
+            yield frame
 
-        logger.info(f"Fetched {len(frames)} telemetry frames for {driver}")
-        return frames
+        logger.info(f"Fetched {count} telemetry frames for {driver}")
 
     def get_available_sessions(self, year: int, event: str | int) -> list[str]:
         """
@@ -321,7 +444,8 @@ class FastF1Fetcher:
 
         for session_name in ["FP1", "FP2", "FP3", "Q", "S", "SS", "R"]:
             try:
-                session = fastf1.get_session(year, event, session_name)
+                with FASTF1_LOCK:
+                    session = fastf1.get_session(year, event, session_name)
                 if session is not None:
                     sessions.append(session_name)
             except Exception:
@@ -7,10 +7,11 @@ from pathlib import Path
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 
+from app.api.responses import ORJSONResponse
 from app.config import get_settings
+from app.middleware.request_cache import RequestCacheMiddleware
 from app.middleware.security import (
     APIKeyMiddleware,
     RateLimitMiddleware,
@@ -59,9 +60,12 @@ def create_app() -> FastAPI:
         docs_url=docs_url,
         redoc_url=redoc_url,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
-    # Global exception handler - hide internal errors in production
+    # Global exception handler - hide internal errors in production.
+    # HTTPException and validation errors are answered by FastAPI's own
+    # handlers before reaching this one, so it only sees genuine bugs.
     @app.exception_handler(Exception)
     async def global_exception_handler(request: Request, exc: Exception):
         """Handle uncaught exceptions without exposing internal details."""
@@ -69,13 +73,13 @@ def create_app() -> FastAPI:
 
         if settings.is_development:
             # In development, show the error
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=500,
                 content={"detail": str(exc)},
             )
         else:
             # In production, hide internal details
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=500,
                 content={"detail": "An internal error occurred. Please try again later."},
             )
@@ -114,6 +118,9 @@ def create_app() -> FastAPI:
         allow_headers=settings.cors_allow_headers,
     )
 
+    # Per-request repository read cache
+    app.add_middleware(RequestCacheMiddleware)
+
     # API routes
     app.include_router(v1_router, prefix=settings.api_v1_prefix)
 
@@ -1,5 +1,6 @@
 """Middleware modules for the F1-Dash API."""
 
+from app.middleware.request_cache import RequestCacheMiddleware
 from app.middleware.security import (
     APIKeyMiddleware,
     RateLimitMiddleware,
@@ -13,5 +14,6 @@ __all__ = [
     "APIKeyMiddleware",
     "RateLimitMiddleware",
     "RequestValidationMiddleware",
+    "RequestCacheMiddleware",
     "generate_api_key",
 ]
@@ -0,0 +1,28 @@
+"""Middleware that scopes repository read caching to one request."""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.repositories.request_cache import begin_request_cache, end_request_cache
+
+
+class RequestCacheMiddleware:
+    """
+    Give every HTTP request its own repository read cache.
+
+    Implemented as plain ASGI middleware so the context variable is set
+    before any BaseHTTPMiddleware copies the context for the endpoint.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = begin_request_cache()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            end_request_cache(token)
@@ -1,21 +1,52 @@
 """Base file repository implementation."""
 
 import asyncio
-import json
 import logging
+import os
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from pathlib import Path
 from typing import Generic, TypeVar
 
+import orjson
 from pydantic import BaseModel
 
+from app.repositories.request_cache import clear_request_cache
+
 T = TypeVar("T", bound=BaseModel)
 logger = logging.getLogger(__name__)
 
 # Pattern for valid entity IDs (alphanumeric, underscore, hyphen only)
 VALID_ENTITY_ID_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+$")
 
+# Upper bound on concurrent file reads issued by a single bulk lookup
+MAX_CONCURRENT_READS = 32
+
+# Upper bound on concurrent file writes issued by a single bulk insert
+MAX_CONCURRENT_WRITES = 32
+
+# Dedicated pool for blocking filesystem work, shared by all file
+# repositories so bursts of reads don't queue behind the default executor
+_IO_POOL = ThreadPoolExecutor(max_workers=32, thread_name_prefix="repo-io")
+
+# Default number of parsed entities kept in each repository's LRU cache
+DEFAULT_CACHE_SIZE = 4096
+
+
+def _tmp_path(file_path: Path) -> Path:
+    """
+    Sibling temp file for an atomic replace of file_path.
+
+    Named per process and thread, so concurrent writes of one file never
+    share (and then race to rename) a temp file.
+    """
+    return file_path.with_name(
+        f"{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+
 
 def json_serializer(obj: object) -> str:
     """Custom JSON serializer for non-standard types."""
@@ -87,8 +118,15 @@ class FileRepository(Generic[T]):
 
     Stores entities as JSON files with optional indexing for
     efficient queries.
+
+    Subclasses for small entity types can set ``_preload = True`` to have
+    every entity and index loaded into memory on first use; reads are then
+    served from RAM while writes still go to disk.
     """
 
+    _io_pool = _IO_POOL
+    _preload = False
+
     def __init__(self, data_dir: Path, model_class: type[T], entity_name: str):
         """
         Initialize the file repository.
@@ -101,6 +139,13 @@ class FileRepository(Generic[T]):
         self._data_dir = data_dir / entity_name
         self._index_dir = data_dir / "indexes" / entity_name
         self._model_class = model_class
+        # Parsed entities by ID; models are frozen so sharing them is safe
+        self._cache: OrderedDict[str, T] = OrderedDict()
+        self._cache_max = DEFAULT_CACHE_SIZE
+        # In-memory copy of all entities and indexes (preloaded repos only)
+        self._by_id: dict[str, T] | None = None
+        self._indexes: dict[str, list[str]] = {}
+        self._load_lock = asyncio.Lock()
         self._data_dir.mkdir(parents=True, exist_ok=True)
         self._index_dir.mkdir(parents=True, exist_ok=True)
 
@@ -166,91 +211,255 @@ class FileRepository(Generic[T]):
         return file_path
 
     async def _read_file(self, file_path: Path) -> dict | None:
-        """Read and parse a JSON file."""
-        if not file_path.exists():
-            return None
+        """
+        Read and parse a JSON file, or return None if it is missing.
 
+        The existence check, read and decode all happen in one pool task
+        so the event loop never blocks on a stat call.
+        """
         def read():
-            with open(file_path, "r") as f:
-                return json.load(f)
+            try:
+                with open(file_path, "rb") as f:
+                    data = orjson.loads(f.read())
+            except FileNotFoundError:
+                return None
+            return timedelta_decoder(data) if data else None
 
-        loop = asyncio.get_event_loop()
-        data = await loop.run_in_executor(None, read)
-        return timedelta_decoder(data) if data else None
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_pool, read)
 
     async def _write_file(self, file_path: Path, data: dict) -> None:
-        """Write data to a JSON file."""
+        """
+        Write data to a JSON file atomically.
+
+        The payload is written compactly to a sibling temp file and then
+        swapped in with os.replace, so readers never see a partial file.
+        """
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
         def write():
-            with open(file_path, "w") as f:
-                json.dump(data, f, default=json_serializer, indent=2)
+            self._write_bytes_sync(
+                file_path, orjson.dumps(data, default=json_serializer)
+            )
 
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, write)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._io_pool, write)
+
+    @staticmethod
+    def _write_bytes_sync(file_path: Path, payload: bytes) -> None:
+        """Atomically replace file_path with payload (blocking)."""
+        tmp_path = _tmp_path(file_path)
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, file_path)
 
     async def _delete_file(self, file_path: Path) -> bool:
         """Delete a file if it exists."""
-        if not file_path.exists():
-            return False
-
-        def delete():
-            file_path.unlink()
+        def delete() -> bool:
+            try:
+                file_path.unlink()
+            except FileNotFoundError:
+                return False
+            return True
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_pool, delete)
+
+    def _index_path(self, index_name: str) -> Path:
+        """Path of an index log (newline-delimited IDs)."""
+        return self._index_dir / f"{index_name}.idx"
+
+    def _legacy_index_path(self, index_name: str) -> Path:
+        """Path of an index stored in the older JSON-list format."""
+        return self._index_dir / f"{index_name}.json"
+
+    def _migrate_legacy_index(self, index_name: str) -> None:
+        """Convert a JSON-list index into an index log (blocking)."""
+        legacy_path = self._legacy_index_path(index_name)
+        if self._index_path(index_name).exists() or not legacy_path.exists():
+            return
+        with open(legacy_path, "rb") as f:
+            ids = orjson.loads(f.read())
+        self._write_index_sync(index_name, ids)
+
+    def _write_index_sync(self, index_name: str, entity_ids: list[str]) -> None:
+        """Atomically replace an index log (blocking)."""
+        index_path = self._index_path(index_name)
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = _tmp_path(index_path)
+        with open(tmp_path, "wb") as f:
+            f.write("".join(f"{i}\n" for i in entity_ids).encode())
+        os.replace(tmp_path, index_path)
+        self._legacy_index_path(index_name).unlink(missing_ok=True)
+
+    @staticmethod
+    def _parse_index_log(raw: bytes) -> list[str]:
+        """
+        Parse an index log.
 
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, delete)
-        return True
+        Logs may contain repeated IDs (appends are not checked), so
+        entries are de-duplicated preserving first-seen order.
+        """
+        return list(dict.fromkeys(line for line in raw.decode().splitlines() if line))
+
+    async def _ensure_loaded(self) -> None:
+        """Load all entities and indexes into memory (once)."""
+        if self._by_id is not None:
+            return
+        async with self._load_lock:
+            if self._by_id is not None:
+                return
+
+            def load():
+                by_id: dict[str, T] = {}
+                for path in self._data_dir.rglob("*.json"):
+                    with open(path, "rb") as f:
+                        data = orjson.loads(f.read())
+                    if data:
+                        by_id[path.stem] = self._model_class.model_validate(
+                            timedelta_decoder(data)
+                        )
+                indexes: dict[str, list[str]] = {}
+                for path in self._index_dir.glob("*.json"):
+                    with open(path, "rb") as f:
+                        indexes[path.stem] = orjson.loads(f.read())
+                for path in self._index_dir.glob("*.idx"):
+                    indexes[path.stem] = self._parse_index_log(path.read_bytes())
+                return by_id, indexes
+
+            loop = asyncio.get_running_loop()
+            by_id, indexes = await loop.run_in_executor(self._io_pool, load)
+            self._indexes = indexes
+            self._by_id = by_id
 
     async def _read_index(self, index_name: str) -> list[str]:
-        """Read an index file."""
-        index_path = self._index_dir / f"{index_name}.json"
-        if not index_path.exists():
-            return []
+        """Read an index."""
+        if self._preload:
+            await self._ensure_loaded()
+            return list(self._indexes.get(index_name, ()))
+
+        index_path = self._index_path(index_name)
+        legacy_path = self._legacy_index_path(index_name)
 
         def read():
-            with open(index_path, "r") as f:
-                return json.load(f)
+            if index_path.exists():
+                return self._parse_index_log(index_path.read_bytes())
+            if legacy_path.exists():
+                with open(legacy_path, "rb") as f:
+                    return orjson.loads(f.read())
+            return []
 
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, read)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_pool, read)
 
     async def _write_index(self, index_name: str, entity_ids: list[str]) -> None:
-        """Write an index file."""
-        index_path = self._index_dir / f"{index_name}.json"
-        index_path.parent.mkdir(parents=True, exist_ok=True)
-
-        def write():
-            with open(index_path, "w") as f:
-                json.dump(entity_ids, f)
+        """Replace the contents of an index (duplicates are dropped)."""
+        entity_ids = list(dict.fromkeys(entity_ids))
+        if self._preload:
+            await self._ensure_loaded()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            self._io_pool, self._write_index_sync, index_name, entity_ids
+        )
+        clear_request_cache()
+        if self._preload:
+            self._indexes[index_name] = entity_ids
+
+    async def _append_to_index(
+        self, index_name: str, entity_ids: list[str]
+    ) -> None:
+        """Append entity IDs to an index with a single O_APPEND write."""
+        if not entity_ids:
+            return
+        if self._preload:
+            await self._ensure_loaded()
+        index_path = self._index_path(index_name)
+        payload = "".join(f"{i}\n" for i in entity_ids).encode()
+
+        def append():
+            self._migrate_legacy_index(index_name)
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(index_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, payload)
+            finally:
+                os.close(fd)
 
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, write)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._io_pool, append)
+        clear_request_cache()
+        if self._preload:
+            existing = self._indexes.get(index_name, ())
+            self._indexes[index_name] = list(dict.fromkeys([*existing, *entity_ids]))
 
     async def _add_to_index(self, index_name: str, entity_id: str) -> None:
         """Add an entity ID to an index."""
-        ids = await self._read_index(index_name)
-        if entity_id not in ids:
-            ids.append(entity_id)
-            await self._write_index(index_name, ids)
+        await self._append_to_index(index_name, [entity_id])
 
     async def _list_all_files(self) -> list[Path]:
         """List all entity files."""
         def list_files():
             return list(self._data_dir.rglob("*.json"))
 
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, list_files)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_pool, list_files)
+
+    def _cache_get(self, entity_id: str) -> T | None:
+        """Return a cached entity and mark it as recently used."""
+        entity = self._cache.get(entity_id)
+        if entity is not None:
+            self._cache.move_to_end(entity_id)
+        return entity
+
+    def _cache_put(self, entity_id: str, entity: T) -> None:
+        """Store an entity, evicting the least recently used if full."""
+        self._cache[entity_id] = entity
+        self._cache.move_to_end(entity_id)
+        if len(self._cache) > self._cache_max:
+            self._cache.popitem(last=False)
+
+    def _cache_invalidate(self, entity_id: str) -> None:
+        """Drop an entity from the cache."""
+        self._cache.pop(entity_id, None)
 
     async def get_by_id(self, entity_id: str) -> T | None:
         """Get an entity by ID."""
+        if self._preload:
+            self._validate_entity_id(entity_id)
+            await self._ensure_loaded()
+            return self._by_id.get(entity_id)
+        cached = self._cache_get(entity_id)
+        if cached is not None:
+            return cached
         file_path = self._get_file_path(entity_id)
         data = await self._read_file(file_path)
         if data is None:
             return None
-        return self._model_class.model_validate(data)
+        entity = self._model_class.model_validate(data)
+        self._cache_put(entity_id, entity)
+        return entity
+
+    async def _get_many(self, entity_ids: list[str]) -> list[T]:
+        """
+        Load several entities concurrently.
+
+        Reads are fanned out to the executor, capped at
+        MAX_CONCURRENT_READS in flight. Missing entities are skipped.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_READS)
+
+        async def load(entity_id: str) -> T | None:
+            async with semaphore:
+                return await self.get_by_id(entity_id)
+
+        results = await asyncio.gather(*(load(i) for i in entity_ids))
+        return [entity for entity in results if entity is not None]
 
     async def get_all(self) -> list[T]:
         """Get all entities."""
+        if self._preload:
+            await self._ensure_loaded()
+            return list(self._by_id.values())
         files = await self._list_all_files()
         entities = []
         for file_path in files:
@@ -259,12 +468,64 @@ class FileRepository(Generic[T]):
                 entities.append(self._model_class.model_validate(data))
         return entities
 
-    async def add(self, entity: T) -> T:
-        """Add an entity."""
+    async def _add_raw(self, entity: T) -> None:
+        """Write an entity file without touching any index."""
         entity_dict = entity.model_dump(mode="json")
         entity_id = entity_dict.get("id")
         file_path = self._get_file_path(entity_id)
+        if self._preload:
+            await self._ensure_loaded()
         await self._write_file(file_path, entity_dict)
+        self._cache_invalidate(entity_id)
+        clear_request_cache()
+        if self._preload:
+            self._by_id[entity_id] = entity
+
+    async def _add_many_raw(self, entities: list[T]) -> None:
+        """
+        Write several entity files without touching indexes.
+
+        Entities are serialized up front and the files are written in at
+        most MAX_CONCURRENT_WRITES pool tasks, each writing its share in
+        sequence, rather than one pool round trip per file.
+        """
+        if not entities:
+            return
+        if self._preload:
+            await self._ensure_loaded()
+
+        # The last copy of a repeated entity wins, written once
+        entities = list({entity.id: entity for entity in entities}.values())
+
+        writes = []
+        for entity in entities:
+            entity_dict = entity.model_dump(mode="json")
+            file_path = self._get_file_path(entity_dict.get("id"))
+            writes.append(
+                (file_path, orjson.dumps(entity_dict, default=json_serializer))
+            )
+        for directory in {file_path.parent for file_path, _ in writes}:
+            directory.mkdir(parents=True, exist_ok=True)
+
+        def write_batch(batch: list[tuple[Path, bytes]]) -> None:
+            for file_path, payload in batch:
+                self._write_bytes_sync(file_path, payload)
+
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(
+            loop.run_in_executor(self._io_pool, write_batch, writes[i::MAX_CONCURRENT_WRITES])
+            for i in range(min(MAX_CONCURRENT_WRITES, len(writes)))
+        ))
+
+        for entity in entities:
+            self._cache_invalidate(entity.id)
+            if self._preload:
+                self._by_id[entity.id] = entity
+        clear_request_cache()
+
+    async def add(self, entity: T) -> T:
+        """Add an entity."""
+        await self._add_raw(entity)
         return entity
 
     async def add_many(self, entities: list[T]) -> list[T]:
@@ -280,14 +541,26 @@ class FileRepository(Generic[T]):
     async def delete(self, entity_id: str) -> bool:
         """Delete an entity."""
         file_path = self._get_file_path(entity_id)
+        self._cache_invalidate(entity_id)
+        clear_request_cache()
+        if self._preload:
+            await self._ensure_loaded()
+            self._by_id.pop(entity_id, None)
         return await self._delete_file(file_path)
 
     async def exists(self, entity_id: str) -> bool:
         """Check if an entity exists."""
         file_path = self._get_file_path(entity_id)
-        return file_path.exists()
+        if self._preload:
+            await self._ensure_loaded()
+            return entity_id in self._by_id
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_pool, file_path.exists)
 
     async def count(self) -> int:
         """Count all entities."""
+        if self._preload:
+            await self._ensure_loaded()
+            return len(self._by_id)
         files = await self._list_all_files()
         return len(files)
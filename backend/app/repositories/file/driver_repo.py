@@ -1,5 +1,7 @@
 """File-based driver repository implementation."""
 
+import re
+from collections import defaultdict
 from pathlib import Path
 
 from app.domain.models import Driver
@@ -10,30 +12,39 @@ from app.repositories.file.base import FileRepository
 class FileDriverRepository(FileRepository[Driver], IDriverRepository):
     """File-based implementation of driver repository."""
 
+    _preload = True
+
     def __init__(self, data_dir: Path):
         super().__init__(data_dir, Driver, "drivers")
+        # (driver, lowercased searchable text); rebuilt lazily after writes
+        self._search_corpus: list[tuple[Driver, str]] | None = None
+        # Car number -> driver ID; rebuilt lazily from the preloaded drivers
+        self._number_to_id: dict[int, str] | None = None
 
     async def add(self, entity: Driver) -> Driver:
         """Add a driver and update indexes."""
-        result = await super().add(entity)
+        return (await self.add_many([entity]))[0]
 
-        # Update team index
-        await self._add_to_index(f"team_{entity.team_id}", entity.id)
+    async def add_many(self, entities: list[Driver]) -> list[Driver]:
+        """Add several drivers with one team index update per team."""
+        await self._add_many_raw(entities)
+        self._search_corpus = None
+        self._number_to_id = None
 
-        # Update number index (special - single driver per number)
-        await self._write_index(f"number_{entity.number}", [entity.id])
+        # Update team indexes
+        by_team: dict[str, list[str]] = defaultdict(list)
+        for driver in entities:
+            by_team[driver.team_id].append(driver.id)
+        for team_id, driver_ids in by_team.items():
+            await self._append_to_index(f"team_{team_id}", driver_ids)
 
-        return result
+        return entities
 
     async def get_by_session(self, session_id: str) -> list[Driver]:
         """Get all drivers who participated in a session."""
         # Session-driver mapping is stored as an index
         driver_ids = await self._read_index(f"session_{session_id}")
-        drivers = []
-        for driver_id in driver_ids:
-            driver = await self.get_by_id(driver_id)
-            if driver:
-                drivers.append(driver)
+        drivers = await self._get_many(driver_ids)
         return sorted(drivers, key=lambda d: d.number)
 
     async def add_session_drivers(
@@ -45,11 +56,7 @@ class FileDriverRepository(FileRepository[Driver], IDriverRepository):
     async def get_by_team(self, team_id: str) -> list[Driver]:
         """Get all drivers for a team."""
         driver_ids = await self._read_index(f"team_{team_id}")
-        drivers = []
-        for driver_id in driver_ids:
-            driver = await self.get_by_id(driver_id)
-            if driver:
-                drivers.append(driver)
+        drivers = await self._get_many(driver_ids)
         return sorted(drivers, key=lambda d: d.number)
 
     async def get_by_year(self, year: int) -> list[Driver]:
@@ -58,36 +65,49 @@ class FileDriverRepository(FileRepository[Driver], IDriverRepository):
         if not driver_ids:
             # Fallback: get all drivers (simplified)
             return await self.get_all()
-        drivers = []
-        for driver_id in driver_ids:
-            driver = await self.get_by_id(driver_id)
-            if driver:
-                drivers.append(driver)
+        drivers = await self._get_many(driver_ids)
         return sorted(drivers, key=lambda d: d.number)
 
     async def add_year_drivers(self, year: int, driver_ids: list[str]) -> None:
         """Associate drivers with a year."""
-        existing = await self._read_index(f"year_{year}")
-        combined = list(set(existing + driver_ids))
-        await self._write_index(f"year_{year}", combined)
+        existing = set(await self._read_index(f"year_{year}"))
+        new_ids = [d for d in dict.fromkeys(driver_ids) if d not in existing]
+        if not new_ids:
+            return
+        await self._append_to_index(f"year_{year}", new_ids)
 
     async def get_by_number(self, number: int) -> Driver | None:
         """Get a driver by their car number."""
-        driver_ids = await self._read_index(f"number_{number}")
-        if not driver_ids:
-            return None
-        return await self.get_by_id(driver_ids[0])
+        await self._ensure_loaded()
+        if self._number_to_id is None:
+            # Later additions win, matching the old overwrite semantics
+            self._number_to_id = {
+                driver.number: driver.id for driver in self._by_id.values()
+            }
+        driver_id = self._number_to_id.get(number)
+        return self._by_id.get(driver_id) if driver_id else None
+
+    async def delete(self, entity_id: str) -> bool:
+        """Delete a driver."""
+        self._search_corpus = None
+        self._number_to_id = None
+        return await super().delete(entity_id)
 
     async def search(self, query: str) -> list[Driver]:
         """Search drivers by name or abbreviation."""
-        query_lower = query.lower()
-        all_drivers = await self.get_all()
+        if self._search_corpus is None:
+            self._search_corpus = [
+                (
+                    driver,
+                    "\n".join([
+                        driver.id, driver.full_name,
+                        driver.first_name, driver.last_name,
+                    ]).lower(),
+                )
+                for driver in await self.get_all()
+            ]
+        pattern = re.compile(re.escape(query.lower()))
         return [
-            driver for driver in all_drivers
-            if (
-                query_lower in driver.id.lower()
-                or query_lower in driver.full_name.lower()
-                or query_lower in driver.first_name.lower()
-                or query_lower in driver.last_name.lower()
-            )
+            driver for driver, text in self._search_corpus
+            if pattern.search(text)
         ]
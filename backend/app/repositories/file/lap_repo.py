@@ -1,159 +1,290 @@
 """File-based lap repository implementation."""
 
+import asyncio
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
+
 from app.domain.enums import TireCompound
 from app.domain.models import Lap
 from app.repositories.interfaces import ILapRepository
 from app.repositories.file.base import FileRepository
+from app.repositories.request_cache import request_cached
+
+# Sessions whose derived lap views are kept; each holds the session's full
+# lap list, so the least recently used is dropped beyond this
+MAX_CACHED_SESSION_ANALYTICS = 8
+
+
+def lap_id_sort_key(lap_id: str) -> tuple[str, int]:
+    """
+    Sort key (driver_id, lap_number) derived from a lap ID.
+
+    Relies on the Lap.create_id format: {session_id}_{driver_id}_{lap:03d}.
+    """
+    head, _, lap_number = lap_id.rpartition("_")
+    driver_id = head.rpartition("_")[2]
+    return driver_id, int(lap_number) if lap_number.isdigit() else 0
+
+
+@dataclass
+class _SessionAnalytics:
+    """Per-session lap views derived in a single pass."""
+
+    index_mtime: int
+    laps: list[Lap]
+    valid: list[Lap]
+    pb_by_driver: dict[str, Lap]
+    # Lap times of `valid` in seconds, same order
+    valid_seconds: np.ndarray
 
 
 class FileLapRepository(FileRepository[Lap], ILapRepository):
-    """File-based implementation of lap repository."""
+    """
+    File-based implementation of lap repository.
+
+    Lap indexes are kept ordered by (driver_id, lap_number) at write time,
+    so queries can return laps in index order without sorting models.
+    """
 
     def __init__(self, data_dir: Path):
         super().__init__(data_dir, Lap, "laps")
+        self._analytics: OrderedDict[str, _SessionAnalytics] = OrderedDict()
 
-    async def add(self, entity: Lap) -> Lap:
-        """Add a lap and update indexes."""
-        result = await super().add(entity)
+    async def _insert_sorted(self, index_name: str, lap_ids: list[str]) -> None:
+        """Add lap IDs to an index, keeping it in sort-key order."""
+        new_ids = sorted(lap_ids, key=lap_id_sort_key)
+        existing = await self._read_index(index_name)
+        if not existing or lap_id_sort_key(existing[-1]) < lap_id_sort_key(new_ids[0]):
+            # Common case while ingesting: everything sorts after the tail
+            await self._append_to_index(index_name, new_ids)
+        else:
+            merged = sorted(dict.fromkeys(existing + new_ids), key=lap_id_sort_key)
+            await self._write_index(index_name, merged)
 
-        # Update session index
-        await self._add_to_index(f"session_{entity.session_id}", entity.id)
+    async def _read_sorted_index(self, index_name: str) -> list[str]:
+        """Read a lap index in (driver_id, lap_number) order."""
+        lap_ids = await self._read_index(index_name)
+        # Indexes are written presorted; this only reorders legacy indexes
+        # and is a linear pass otherwise.
+        lap_ids.sort(key=lap_id_sort_key)
+        return lap_ids
 
-        # Update driver index
-        driver_key = f"driver_{entity.session_id}_{entity.driver_id}"
-        await self._add_to_index(driver_key, entity.id)
+    async def _scan_personal_best(
+        self, session_id: str, driver_id: str
+    ) -> Lap | None:
+        """Find a driver's fastest lap from their full lap index."""
+        best = None
+        for lap in await self.get_by_session_and_driver(session_id, driver_id):
+            if lap.lap_time is None or not lap.is_valid_for_analysis:
+                continue
+            if best is None or lap.lap_time < best.lap_time:
+                best = lap
+        return best
 
-        # Update compound index
-        compound_key = f"compound_{entity.session_id}_{entity.compound.value}"
-        await self._add_to_index(compound_key, entity.id)
+    async def _update_personal_bests(self, laps: list[Lap]) -> None:
+        """Maintain the pb_{session_id} index of each driver's fastest lap."""
+        by_session: dict[str, list[Lap]] = defaultdict(list)
+        for lap in laps:
+            by_session[lap.session_id].append(lap)
+
+        for session_id, session_laps in by_session.items():
+            index_name = f"pb_{session_id}"
+            pb_ids = set(await self._read_index(index_name))
+            bests = {lap.driver_id: lap for lap in await self._get_many(list(pb_ids))}
 
-        return result
+            # A rewritten PB lap may now be slower or invalid, so those
+            # drivers are rescanned instead of compared incrementally
+            rescan = {lap.driver_id for lap in session_laps if lap.id in pb_ids}
+            for driver_id in rescan:
+                best = await self._scan_personal_best(session_id, driver_id)
+                if best is None:
+                    bests.pop(driver_id, None)
+                else:
+                    bests[driver_id] = best
+
+            changed = bool(rescan)
+            for lap in session_laps:
+                if lap.driver_id in rescan:
+                    continue
+                if lap.lap_time is None or not lap.is_valid_for_analysis:
+                    continue
+                current = bests.get(lap.driver_id)
+                if current is None or lap.lap_time < current.lap_time:
+                    bests[lap.driver_id] = lap
+                    changed = True
+            if changed:
+                await self._write_index(
+                    index_name, [lap.id for lap in bests.values()]
+                )
+
+    async def add(self, entity: Lap) -> Lap:
+        """Add a lap and update indexes."""
+        return (await self.add_many([entity]))[0]
 
     async def add_many(self, entities: list[Lap]) -> list[Lap]:
         """Add multiple laps with batch index updates."""
-        # Group by session for efficient index updates
-        by_session: dict[str, list[Lap]] = {}
+        await self._add_many_raw(entities)
+
+        # Coalesce index updates into one write per key
+        index_updates: dict[str, list[str]] = defaultdict(list)
         for lap in entities:
-            if lap.session_id not in by_session:
-                by_session[lap.session_id] = []
-            by_session[lap.session_id].append(lap)
+            index_updates[f"session_{lap.session_id}"].append(lap.id)
+            index_updates[f"driver_{lap.session_id}_{lap.driver_id}"].append(lap.id)
+            index_updates[
+                f"compound_{lap.session_id}_{lap.compound.value}"
+            ].append(lap.id)
+            index_updates[
+                f"stint_{lap.session_id}_{lap.driver_id}_{lap.stint}"
+            ].append(lap.id)
 
-        for session_id, laps in by_session.items():
-            session_ids = []
-            driver_ids: dict[str, list[str]] = {}
-            compound_ids: dict[str, list[str]] = {}
-
-            for lap in laps:
-                await super().add(lap)
-                session_ids.append(lap.id)
-
-                # Group driver indexes
-                driver_key = f"driver_{session_id}_{lap.driver_id}"
-                if driver_key not in driver_ids:
-                    driver_ids[driver_key] = []
-                driver_ids[driver_key].append(lap.id)
-
-                # Group compound indexes
-                compound_key = f"compound_{session_id}_{lap.compound.value}"
-                if compound_key not in compound_ids:
-                    compound_ids[compound_key] = []
-                compound_ids[compound_key].append(lap.id)
-
-            # Batch write indexes
-            existing_session_ids = await self._read_index(f"session_{session_id}")
-            await self._write_index(
-                f"session_{session_id}",
-                existing_session_ids + session_ids
-            )
-
-            for driver_key, ids in driver_ids.items():
-                existing = await self._read_index(driver_key)
-                await self._write_index(driver_key, existing + ids)
-
-            for compound_key, ids in compound_ids.items():
-                existing = await self._read_index(compound_key)
-                await self._write_index(compound_key, existing + ids)
+        for index_key, ids in index_updates.items():
+            await self._insert_sorted(index_key, ids)
 
+        await self._update_personal_bests(entities)
+        for session_id in {lap.session_id for lap in entities}:
+            self._analytics.pop(session_id, None)
         return entities
 
+    async def delete(self, entity_id: str) -> bool:
+        """Delete a lap, replacing it in the pb_ index if it was a PB."""
+        lap = await self.get_by_id(entity_id)
+        deleted = await super().delete(entity_id)
+        if lap is None:
+            return deleted
+        self._analytics.pop(lap.session_id, None)
+
+        index_name = f"pb_{lap.session_id}"
+        pb_ids = await self._read_index(index_name)
+        if entity_id in pb_ids:
+            pb_ids.remove(entity_id)
+            best = await self._scan_personal_best(lap.session_id, lap.driver_id)
+            if best is not None:
+                pb_ids.append(best.id)
+            await self._write_index(index_name, pb_ids)
+        return deleted
+
+    @request_cached
     async def get_by_session(self, session_id: str) -> list[Lap]:
         """Get all laps for a session."""
-        lap_ids = await self._read_index(f"session_{session_id}")
-        laps = []
-        for lap_id in lap_ids:
-            lap = await self.get_by_id(lap_id)
-            if lap:
-                laps.append(lap)
-        return sorted(laps, key=lambda l: (l.driver_id, l.lap_number))
+        lap_ids = await self._read_sorted_index(f"session_{session_id}")
+        return await self._get_many(lap_ids)
 
+    @request_cached
     async def get_by_session_and_driver(
         self, session_id: str, driver_id: str
     ) -> list[Lap]:
         """Get all laps for a driver in a session."""
         driver_key = f"driver_{session_id}_{driver_id}"
-        lap_ids = await self._read_index(driver_key)
-        laps = []
-        for lap_id in lap_ids:
-            lap = await self.get_by_id(lap_id)
-            if lap:
-                laps.append(lap)
-        return sorted(laps, key=lambda l: l.lap_number)
+        lap_ids = await self._read_sorted_index(driver_key)
+        return await self._get_many(lap_ids)
 
+    @request_cached
     async def get_by_compound(
         self, session_id: str, compound: TireCompound
     ) -> list[Lap]:
         """Get all laps on a specific compound."""
         compound_key = f"compound_{session_id}_{compound.value}"
-        lap_ids = await self._read_index(compound_key)
-        laps = []
-        for lap_id in lap_ids:
-            lap = await self.get_by_id(lap_id)
-            if lap:
-                laps.append(lap)
-        return sorted(laps, key=lambda l: (l.driver_id, l.lap_number))
+        lap_ids = await self._read_sorted_index(compound_key)
+        return await self._get_many(lap_ids)
+
+    async def _session_analytics(self, session_id: str) -> _SessionAnalytics:
+        """
+        Load a session's laps once and derive the common views in one pass.
+
+        Results are cached for the most recently used sessions and keyed by
+        the session index's mtime, so they are recomputed whenever laps are
+        written.
+        """
+        index_path = self._index_path(f"session_{session_id}")
+
+        def index_mtime() -> int:
+            try:
+                return index_path.stat().st_mtime_ns
+            except FileNotFoundError:
+                return 0
+
+        loop = asyncio.get_running_loop()
+        mtime = await loop.run_in_executor(self._io_pool, index_mtime)
+        cached = self._analytics.get(session_id)
+        if cached is not None and cached.index_mtime == mtime:
+            self._analytics.move_to_end(session_id)
+            return cached
+
+        laps = await self.get_by_session(session_id)
+        valid: list[Lap] = []
+        pb_by_driver: dict[str, Lap] = {}
+        for lap in laps:
+            if not lap.is_valid_for_analysis:
+                continue
+            valid.append(lap)
+            best = pb_by_driver.get(lap.driver_id)
+            if best is None or lap.lap_time < best.lap_time:
+                pb_by_driver[lap.driver_id] = lap
+
+        analytics = _SessionAnalytics(
+            index_mtime=mtime,
+            laps=laps,
+            valid=valid,
+            pb_by_driver=pb_by_driver,
+            valid_seconds=np.fromiter(
+                (lap.lap_time_seconds for lap in valid),
+                dtype=np.float64,
+                count=len(valid),
+            ),
+        )
+        self._analytics[session_id] = analytics
+        self._analytics.move_to_end(session_id)
+        while len(self._analytics) > MAX_CACHED_SESSION_ANALYTICS:
+            self._analytics.popitem(last=False)
+        return analytics
 
     async def get_fastest_laps(
         self, session_id: str, top_n: int = 10
     ) -> list[Lap]:
         """Get fastest laps in a session."""
-        all_laps = await self.get_by_session(session_id)
-        valid_laps = [
-            lap for lap in all_laps
-            if lap.lap_time is not None and lap.is_valid_for_analysis
-        ]
-        sorted_laps = sorted(valid_laps, key=lambda l: l.lap_time)
-        return sorted_laps[:top_n]
+        analytics = await self._session_analytics(session_id)
+        times = analytics.valid_seconds
+        if top_n <= 0 or len(times) == 0:
+            return []
+        if top_n < len(times):
+            candidates = np.argpartition(times, top_n - 1)[:top_n]
+        else:
+            candidates = np.arange(len(times))
+        order = candidates[np.argsort(times[candidates], kind="stable")]
+        return [analytics.valid[i] for i in order]
 
     async def get_valid_laps(self, session_id: str) -> list[Lap]:
         """Get all valid laps for analysis."""
-        all_laps = await self.get_by_session(session_id)
-        return [lap for lap in all_laps if lap.is_valid_for_analysis]
+        analytics = await self._session_analytics(session_id)
+        return list(analytics.valid)
 
     async def get_personal_bests(self, session_id: str) -> list[Lap]:
         """Get personal best lap for each driver."""
-        all_laps = await self.get_by_session(session_id)
-
-        # Group by driver and find fastest
-        best_by_driver: dict[str, Lap] = {}
-        for lap in all_laps:
-            if lap.lap_time is None or not lap.is_valid_for_analysis:
-                continue
-            driver_id = lap.driver_id
-            if driver_id not in best_by_driver:
-                best_by_driver[driver_id] = lap
-            elif lap.lap_time < best_by_driver[driver_id].lap_time:
-                best_by_driver[driver_id] = lap
+        pb_ids = await self._read_index(f"pb_{session_id}")
+        if pb_ids:
+            bests = await self._get_many(pb_ids)
+        else:
+            # Sessions stored before the pb_ index existed
+            analytics = await self._session_analytics(session_id)
+            bests = list(analytics.pb_by_driver.values())
 
         return sorted(
-            best_by_driver.values(),
+            bests,
             key=lambda l: l.lap_time if l.lap_time else float("inf")
         )
 
+    @request_cached
     async def get_by_stint(
         self, session_id: str, driver_id: str, stint_number: int
     ) -> list[Lap]:
         """Get all laps in a specific stint."""
+        stint_key = f"stint_{session_id}_{driver_id}_{stint_number}"
+        lap_ids = await self._read_sorted_index(stint_key)
+        if lap_ids:
+            return await self._get_many(lap_ids)
+        # Sessions stored before the stint index existed
         driver_laps = await self.get_by_session_and_driver(session_id, driver_id)
         return [lap for lap in driver_laps if lap.stint == stint_number]
@@ -11,6 +11,8 @@ from app.repositories.file.base import FileRepository
 class FileSessionRepository(FileRepository[Session], ISessionRepository):
     """File-based implementation of session repository."""
 
+    _preload = True
+
     def __init__(self, data_dir: Path):
         super().__init__(data_dir, Session, "sessions")
 
@@ -34,33 +36,15 @@ class FileSessionRepository(FileRepository[Session], ISessionRepository):
     async def get_by_year(self, year: int) -> list[Session]:
         """Get all sessions for a year."""
         session_ids = await self._read_index(f"year_{year}")
-        sessions = []
-        for session_id in session_ids:
-            session = await self.get_by_id(session_id)
-            if session:
-                sessions.append(session)
+        sessions = await self._get_many(session_ids)
         return sorted(sessions, key=lambda s: (s.round_number, s.session_type.value))
 
     async def get_by_event(self, year: int, round_number: int) -> list[Session]:
         """Get all sessions for a specific event."""
         event_key = f"event_{year}_{round_number:02d}"
         session_ids = await self._read_index(event_key)
-        sessions = []
-        for session_id in session_ids:
-            session = await self.get_by_id(session_id)
-            if session:
-                sessions.append(session)
-        # Sort by session type order
-        type_order = {
-            SessionType.PRACTICE_1: 1,
-            SessionType.PRACTICE_2: 2,
-            SessionType.PRACTICE_3: 3,
-            SessionType.SPRINT_SHOOTOUT: 4,
-            SessionType.SPRINT: 5,
-            SessionType.QUALIFYING: 6,
-            SessionType.RACE: 7,
-        }
-        return sorted(sessions, key=lambda s: type_order.get(s.session_type, 99))
+        sessions = await self._get_many(session_ids)
+        return sorted(sessions, key=lambda s: s.session_type.order)
 
     async def get_by_type(
         self, year: int, session_type: SessionType
@@ -68,11 +52,7 @@ class FileSessionRepository(FileRepository[Session], ISessionRepository):
         """Get all sessions of a specific type in a year."""
         type_key = f"type_{year}_{session_type.value}"
         session_ids = await self._read_index(type_key)
-        sessions = []
-        for session_id in session_ids:
-            session = await self.get_by_id(session_id)
-            if session:
-                sessions.append(session)
+        sessions = await self._get_many(session_ids)
         return sorted(sessions, key=lambda s: s.round_number)
 
     async def get_latest(self, limit: int = 10) -> list[Session]:
@@ -1,5 +1,6 @@
 """File-based stint repository implementation."""
 
+from collections import defaultdict
 from pathlib import Path
 
 from app.domain.enums import TireCompound
@@ -12,34 +13,69 @@ from app.repositories.file.base import FileRepository
 class FileStintRepository(FileRepository[TireStint], IStintRepository):
     """File-based implementation of stint repository."""
 
+    _preload = True
+
     def __init__(self, data_dir: Path):
         super().__init__(data_dir, TireStint, "stints")
+        # Kept outside the entity directory so preloading doesn't parse them
+        self._summary_dir = data_dir / "summaries" / "stints"
 
     async def add(self, entity: TireStint) -> TireStint:
         """Add a stint and update indexes."""
-        result = await super().add(entity)
-
-        # Update session index
-        await self._add_to_index(f"session_{entity.session_id}", entity.id)
-
-        # Update driver index
-        driver_key = f"driver_{entity.session_id}_{entity.driver_id}"
-        await self._add_to_index(driver_key, entity.id)
-
-        # Update compound index
-        compound_key = f"compound_{entity.session_id}_{entity.compound.value}"
-        await self._add_to_index(compound_key, entity.id)
-
-        return result
+        return (await self.add_many([entity]))[0]
+
+    async def add_many(self, entities: list[TireStint]) -> list[TireStint]:
+        """Add multiple stints with one index write per key."""
+        await self._add_many_raw(entities)
+
+        index_updates: dict[str, list[str]] = defaultdict(list)
+        for stint in entities:
+            index_updates[f"session_{stint.session_id}"].append(stint.id)
+            index_updates[
+                f"driver_{stint.session_id}_{stint.driver_id}"
+            ].append(stint.id)
+            index_updates[
+                f"compound_{stint.session_id}_{stint.compound.value}"
+            ].append(stint.id)
+
+        for index_key, ids in index_updates.items():
+            await self._append_to_index(index_key, ids)
+
+        # Stored summaries no longer match these sessions' stints
+        for session_id in {stint.session_id for stint in entities}:
+            await self._delete_file(self._summary_path(session_id))
+
+        return entities
+
+    async def delete(self, entity_id: str) -> bool:
+        """Delete a stint and its session's stored summary."""
+        stint = await self.get_by_id(entity_id)
+        deleted = await super().delete(entity_id)
+        if stint is not None:
+            await self._delete_file(self._summary_path(stint.session_id))
+        return deleted
+
+    def _summary_path(self, session_id: str) -> Path:
+        """Path of a session's stored strategy summary."""
+        self._validate_entity_id(session_id)
+        return self._summary_dir / f"{session_id}.json"
+
+    async def get_summary(self, session_id: str) -> list[dict] | None:
+        """Get the stored strategy summary for a session."""
+        data = await self._read_file(self._summary_path(session_id))
+        return data["summaries"] if data else None
+
+    async def save_summary(self, session_id: str, summaries: list[dict]) -> None:
+        """Store a precomputed strategy summary for a session."""
+        await self._write_file(
+            self._summary_path(session_id),
+            {"session_id": session_id, "summaries": summaries},
+        )
 
     async def get_by_session(self, session_id: str) -> list[TireStint]:
         """Get all stints for a session."""
         stint_ids = await self._read_index(f"session_{session_id}")
-        stints = []
-        for stint_id in stint_ids:
-            stint = await self.get_by_id(stint_id)
-            if stint:
-                stints.append(stint)
+        stints = await self._get_many(stint_ids)
         return sorted(stints, key=lambda s: (s.driver_id, s.stint_number))
 
     async def get_by_driver(
@@ -48,11 +84,7 @@ class FileStintRepository(FileRepository[TireStint], IStintRepository):
         """Get all stints for a driver in a session."""
         driver_key = f"driver_{session_id}_{driver_id}"
         stint_ids = await self._read_index(driver_key)
-        stints = []
-        for stint_id in stint_ids:
-            stint = await self.get_by_id(stint_id)
-            if stint:
-                stints.append(stint)
+        stints = await self._get_many(stint_ids)
         return sorted(stints, key=lambda s: s.stint_number)
 
     async def get_by_compound(
@@ -61,17 +93,45 @@ class FileStintRepository(FileRepository[TireStint], IStintRepository):
         """Get all stints on a specific compound."""
         compound_key = f"compound_{session_id}_{compound.value}"
         stint_ids = await self._read_index(compound_key)
-        stints = []
-        for stint_id in stint_ids:
-            stint = await self.get_by_id(stint_id)
-            if stint:
-                stints.append(stint)
+        stints = await self._get_many(stint_ids)
         return sorted(stints, key=lambda s: (s.driver_id, s.stint_number))
 
+    async def aggregate_by_compound(self, session_id: str) -> dict[str, dict]:
+        """Aggregate a session's stints per compound in one pass."""
+        stint_ids = await self._read_index(f"session_{session_id}")
+
+        # [stints, laps, lap time sum, lap time count, degradation sum,
+        #  degradation count]
+        totals: defaultdict[str, list] = defaultdict(lambda: [0, 0, 0.0, 0, 0.0, 0])
+        for stint in await self._get_many(stint_ids):
+            acc = totals[stint.compound.value]
+            acc[0] += 1
+            acc[1] += stint.total_laps
+            avg_lap_time = stint.avg_lap_time_seconds
+            if avg_lap_time is not None:
+                acc[2] += avg_lap_time
+                acc[3] += 1
+            if stint.degradation_rate is not None:
+                acc[4] += stint.degradation_rate
+                acc[5] += 1
+
+        return {
+            compound: {
+                "stint_count": count,
+                "total_laps": laps,
+                "avg_lap_time": time_sum / time_count if time_count else None,
+                "avg_degradation": deg_sum / deg_count if deg_count else None,
+            }
+            for compound, (count, laps, time_sum, time_count, deg_sum, deg_count)
+            in totals.items()
+        }
+
 
 class FilePitStopRepository(FileRepository[PitStop], IPitStopRepository):
     """File-based implementation of pit stop repository."""
 
+    _preload = True
+
     def __init__(self, data_dir: Path):
         super().__init__(data_dir, PitStop, "pitstops")
 
@@ -91,11 +151,7 @@ class FilePitStopRepository(FileRepository[PitStop], IPitStopRepository):
     async def get_by_session(self, session_id: str) -> list[PitStop]:
         """Get all pit stops for a session."""
         stop_ids = await self._read_index(f"session_{session_id}")
-        stops = []
-        for stop_id in stop_ids:
-            stop = await self.get_by_id(stop_id)
-            if stop:
-                stops.append(stop)
+        stops = await self._get_many(stop_ids)
         return sorted(stops, key=lambda s: (s.lap, s.driver_id))
 
     async def get_by_driver(
@@ -104,11 +160,7 @@ class FilePitStopRepository(FileRepository[PitStop], IPitStopRepository):
         """Get all pit stops for a driver."""
         driver_key = f"driver_{session_id}_{driver_id}"
         stop_ids = await self._read_index(driver_key)
-        stops = []
-        for stop_id in stop_ids:
-            stop = await self.get_by_id(stop_id)
-            if stop:
-                stops.append(stop)
+        stops = await self._get_many(stop_ids)
         return sorted(stops, key=lambda s: s.stop_number)
 
     async def get_fastest(
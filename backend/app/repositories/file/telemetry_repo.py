@@ -1,65 +1,138 @@
 """File-based telemetry repository implementation."""
 
+import asyncio
 import gzip
-import json
+import os
+import threading
+from collections import defaultdict
 from pathlib import Path
 
-from app.domain.models import TelemetryFrame
+import orjson
+import zstandard
+
+from app.domain.models import TelemetryFrame, TelemetryPoint
 from app.repositories.interfaces import ITelemetryRepository
-from app.repositories.file.base import FileRepository
+from app.repositories.file.base import MAX_CONCURRENT_WRITES, FileRepository, _tmp_path
+
+# zstd level 1: much faster than gzip at a slightly better ratio
+ZSTD_LEVEL = 1
+
+# Column order used when telemetry points are stored column-wise
+POINT_COLUMNS = tuple(TelemetryPoint.model_fields)
+
+
+def points_to_columns(points: list[dict]) -> dict[str, list]:
+    """Transpose a list of point dicts into one list per field."""
+    return {
+        column: [point.get(column) for point in points]
+        for column in POINT_COLUMNS
+    }
+
+
+def columns_to_points(columns: dict[str, list]) -> list[dict]:
+    """Rebuild point dicts from column-wise storage."""
+    names = list(columns)
+    return [
+        dict(zip(names, row, strict=True))
+        for row in zip(*columns.values(), strict=True)
+    ]
 
 
 class FileTelemetryRepository(FileRepository[TelemetryFrame], ITelemetryRepository):
     """
     File-based implementation of telemetry repository.
 
-    Telemetry data is compressed using gzip due to its size.
-    Each lap's telemetry is stored in a separate file.
+    Telemetry data is compressed using zstd due to its size (older
+    gzip files are still readable). Each lap's telemetry is stored in
+    a separate file, with points stored column-wise (one array per
+    field) rather than as a list of objects. Files written in the
+    older row-wise layout still load.
     """
 
     def __init__(self, data_dir: Path):
         super().__init__(data_dir, TelemetryFrame, "telemetry")
+        # Persisted frame count, maintained on add/delete
+        self._count_path = self._data_dir / ".count"
+        self._count_lock = asyncio.Lock()
+        # Makes "did this lap exist" and the file swap one step, so
+        # concurrent adds of the same lap count it as new only once
+        self._replace_lock = threading.Lock()
+        # Lap time headers are read, merged and rewritten as one step
+        self._lap_time_lock = asyncio.Lock()
 
     def _get_file_path(self, entity_id: str) -> Path:
-        """Get the file path for telemetry (uses .json.gz extension)."""
+        """Get the file path for telemetry (uses .json.zst extension)."""
         parts = entity_id.split("_")
         if len(parts) >= 3:
-            # session_driver_lap format -> session/driver/lap.json.gz
+            # session_driver_lap format -> session/driver/lap.json.zst
             session_id = "_".join(parts[:-2])
             driver_id = parts[-2]
-            return self._data_dir / session_id / driver_id / f"{entity_id}.json.gz"
-        return self._data_dir / f"{entity_id}.json.gz"
+            return self._data_dir / session_id / driver_id / f"{entity_id}.json.zst"
+        return self._data_dir / f"{entity_id}.json.zst"
 
-    async def _read_file(self, file_path: Path) -> dict | None:
-        """Read and decompress a gzipped JSON file."""
-        if not file_path.exists():
-            return None
+    @staticmethod
+    def _legacy_gzip_path(file_path: Path) -> Path:
+        """Path of the gzip file written by older versions."""
+        return file_path.with_name(file_path.name.removesuffix(".zst") + ".gz")
 
-        import asyncio
+    def _file_exists(self, file_path: Path) -> bool:
+        """Check for a telemetry file in either compression format."""
+        return file_path.exists() or self._legacy_gzip_path(file_path).exists()
+
+    async def _read_file(self, file_path: Path) -> dict | None:
+        """Read and decompress a telemetry JSON file, or return None."""
+        gzip_path = self._legacy_gzip_path(file_path)
 
         def read():
-            with gzip.open(file_path, "rt", encoding="utf-8") as f:
-                return json.load(f)
+            try:
+                with open(file_path, "rb") as f:
+                    raw = zstandard.ZstdDecompressor().decompress(f.read())
+            except FileNotFoundError:
+                try:
+                    with gzip.open(gzip_path, "rb") as f:
+                        raw = f.read()
+                except FileNotFoundError:
+                    return None
+            data = orjson.loads(raw)
+            if "columns" in data:
+                data["points"] = columns_to_points(data.pop("columns"))
+            return data
 
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, read)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_pool, read)
 
-    async def _write_file(self, file_path: Path, data: dict) -> None:
-        """Write data to a gzipped JSON file."""
-        import asyncio
+    async def _write_file(self, file_path: Path, data: dict) -> bool:
+        """
+        Write data to a zstd-compressed JSON file atomically.
 
+        Returns True if no file existed for the lap beforehand.
+        """
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
+        if "points" in data:
+            data = dict(data)
+            data["columns"] = points_to_columns(data.pop("points"))
+
         def write():
-            with gzip.open(file_path, "wt", encoding="utf-8") as f:
-                json.dump(data, f)
+            raw = orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+            compressed = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(raw)
+            # Swapped in from a temp file, so a crash can't leave a truncated
+            # file shadowing the gzip copy; the name is per thread so
+            # concurrent writes of one lap don't share a temp file
+            tmp_path = _tmp_path(file_path)
+            with open(tmp_path, "wb") as f:
+                f.write(compressed)
+            with self._replace_lock:
+                existed = self._file_exists(file_path)
+                os.replace(tmp_path, file_path)
+                self._legacy_gzip_path(file_path).unlink(missing_ok=True)
+            return not existed
 
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, write)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_pool, write)
 
-    async def add(self, entity: TelemetryFrame) -> TelemetryFrame:
-        """Add telemetry and update indexes."""
-        # Create a unique ID if not present
+    async def _write_frame(self, entity: TelemetryFrame) -> bool:
+        """Write a frame file; returns True if the lap was new."""
         entity_id = TelemetryFrame.create_id(
             entity.session_id, entity.driver_id, entity.lap_number
         )
@@ -68,13 +141,63 @@ class FileTelemetryRepository(FileRepository[TelemetryFrame], ITelemetryReposito
         entity_dict["id"] = entity_id
 
         file_path = self._get_file_path(entity_id)
-        await self._write_file(file_path, entity_dict)
+        return await self._write_file(file_path, entity_dict)
+
+    async def add(self, entity: TelemetryFrame) -> TelemetryFrame:
+        """Add telemetry and update indexes."""
+        return (await self.add_many([entity]))[0]
+
+    async def add_many(
+        self, entities: list[TelemetryFrame]
+    ) -> list[TelemetryFrame]:
+        """Add several frames, writing files concurrently and indexes once."""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_WRITES)
 
-        # Update driver index for this session
-        driver_key = f"driver_{entity.session_id}_{entity.driver_id}"
-        await self._add_to_index(driver_key, str(entity.lap_number))
+        async def write(entity: TelemetryFrame) -> bool:
+            async with semaphore:
+                return await self._write_frame(entity)
 
-        return entity
+        created = await asyncio.gather(*(write(e) for e in entities))
+        if any(created):
+            await self._bump_count(sum(created))
+
+        index_updates: dict[str, list[str]] = defaultdict(list)
+        lap_time_updates: dict[str, dict[int, int]] = defaultdict(dict)
+        for entity in entities:
+            # Driver index for this session
+            index_updates[
+                f"driver_{entity.session_id}_{entity.driver_id}"
+            ].append(str(entity.lap_number))
+            # Lap time headers, so lap selection needs no decoding
+            if entity.lap_time_ms is not None:
+                lap_time_updates[
+                    f"laptime_{entity.session_id}_{entity.driver_id}"
+                ][entity.lap_number] = entity.lap_time_ms
+
+        for index_key, values in index_updates.items():
+            await self._append_to_index(index_key, values)
+        for index_key, lap_times in lap_time_updates.items():
+            await self._record_lap_times(index_key, lap_times)
+
+        return entities
+
+    async def _record_lap_times(
+        self, index_name: str, lap_times: dict[int, int]
+    ) -> None:
+        """Record lap time headers, keeping one entry per lap."""
+        new_entries = {
+            str(lap): f"{lap}:{time_ms}" for lap, time_ms in lap_times.items()
+        }
+        async with self._lap_time_lock:
+            entries = await self._read_index(index_name)
+            recorded = {entry.partition(":")[0]: entry for entry in entries}
+            if recorded.keys().isdisjoint(new_entries):
+                await self._append_to_index(index_name, list(new_entries.values()))
+            else:
+                # A re-ingested lap replaces its entry: index logs drop
+                # repeated entries, so an appended earlier time would be lost
+                recorded.update(new_entries)
+                await self._write_index(index_name, list(recorded.values()))
 
     async def get_by_lap(
         self, session_id: str, driver_id: str, lap_number: int
@@ -92,31 +215,51 @@ class FileTelemetryRepository(FileRepository[TelemetryFrame], ITelemetryReposito
     ) -> list[TelemetryFrame]:
         """Get telemetry for all laps by a driver."""
         available_laps = await self.get_available_laps(session_id, driver_id)
-        frames = []
-        for lap_number in available_laps:
-            frame = await self.get_by_lap(session_id, driver_id, lap_number)
-            if frame:
-                frames.append(frame)
+        frames = await self._get_many([
+            TelemetryFrame.create_id(session_id, driver_id, lap_number)
+            for lap_number in available_laps
+        ])
         return sorted(frames, key=lambda f: f.lap_number)
 
     async def get_fastest_lap_telemetry(
         self, session_id: str, driver_id: str
     ) -> TelemetryFrame | None:
-        """Get telemetry for a driver's fastest lap."""
-        # This would need lap data to determine fastest
-        # For now, return the first available lap
+        """
+        Get telemetry for a driver's fastest lap.
+
+        Uses the lap time headers recorded on add; if none were recorded
+        (no lap times, or older data) the first available lap is returned.
+        """
         available = await self.get_available_laps(session_id, driver_id)
         if not available:
             return None
+        lap_times = await self._get_lap_times(session_id, driver_id)
+        timed = [lap for lap in available if lap in lap_times]
+        if timed:
+            fastest = min(timed, key=lap_times.__getitem__)
+            return await self.get_by_lap(session_id, driver_id, fastest)
         return await self.get_by_lap(session_id, driver_id, available[0])
 
+    async def _get_lap_times(
+        self, session_id: str, driver_id: str
+    ) -> dict[int, int]:
+        """Map lap number to lap time (ms) from the recorded headers."""
+        entries = await self._read_index(f"laptime_{session_id}_{driver_id}")
+        lap_times: dict[int, int] = {}
+        for entry in entries:
+            lap, _, time_ms = entry.partition(":")
+            # Logs written before entries were replaced may hold several
+            # entries for a lap; the latest one kept in the log wins
+            lap_times[int(lap)] = int(time_ms)
+        return lap_times
+
     async def has_telemetry(
         self, session_id: str, driver_id: str, lap_number: int
     ) -> bool:
         """Check if telemetry exists for a specific lap."""
-        entity_id = TelemetryFrame.create_id(session_id, driver_id, lap_number)
-        file_path = self._get_file_path(entity_id)
-        return file_path.exists()
+        return await self.exists(
+            TelemetryFrame.create_id(session_id, driver_id, lap_number)
+        )
 
     async def get_available_laps(
         self, session_id: str, driver_id: str
@@ -142,12 +285,75 @@ class FileTelemetryRepository(FileRepository[TelemetryFrame], ITelemetryReposito
             "Use get_driver_laps() or get_by_lap() instead."
         )
 
+    async def exists(self, entity_id: str) -> bool:
+        """Check if telemetry exists for a full ID."""
+        file_path = self._get_file_path(entity_id)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._io_pool, self._file_exists, file_path
+        )
+
+    async def delete(self, entity_id: str) -> bool:
+        """Delete telemetry in either compression format."""
+        file_path = self._get_file_path(entity_id)
+        deleted = await self._delete_file(file_path)
+        deleted = await self._delete_file(self._legacy_gzip_path(file_path)) or deleted
+        if deleted:
+            await self._bump_count(-1)
+        return deleted
+
+    def _count_files(self) -> int:
+        """Count telemetry frames on disk (blocking, walks the tree)."""
+        # Frames are keyed by name without the compression suffix so a
+        # lap present in both formats is counted once
+        frames: set[str] = set()
+        stack = [self._data_dir]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(".json.zst"):
+                        frames.add(entry.name[:-4])
+                    elif entry.name.endswith(".json.gz"):
+                        frames.add(entry.name[:-3])
+        return len(frames)
+
+    def _write_count(self, value: int) -> None:
+        """Atomically persist the frame count (blocking)."""
+        tmp_path = self._count_path.with_suffix(".tmp")
+        tmp_path.write_text(str(value))
+        os.replace(tmp_path, self._count_path)
+
+    async def _bump_count(self, delta: int) -> None:
+        """Adjust the persisted count, if it has been initialised."""
+        def bump():
+            try:
+                value = int(self._count_path.read_text())
+            except FileNotFoundError:
+                # Not initialised yet; the next count() walks the tree
+                return
+            self._write_count(max(value + delta, 0))
+
+        async with self._count_lock:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._io_pool, bump)
+
     async def count(self) -> int:
-        """Count telemetry files."""
-        import asyncio
+        """
+        Count telemetry frames.
 
-        def count_files():
-            return len(list(self._data_dir.rglob("*.json.gz")))
+        Served from the persisted counter; the tree is only walked once,
+        the first time the counter is needed.
+        """
+        def read_count():
+            try:
+                return int(self._count_path.read_text())
+            except FileNotFoundError:
+                value = self._count_files()
+                self._write_count(value)
+                return value
 
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, count_files)
+        async with self._count_lock:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._io_pool, read_count)
@@ -59,6 +59,45 @@ class IStintRepository(IRepository[TireStint, str]):
         """
         pass
 
+    @abstractmethod
+    async def aggregate_by_compound(self, session_id: str) -> dict[str, dict]:
+        """
+        Aggregate a session's stints per compound.
+
+        Args:
+            session_id: The session identifier
+
+        Returns:
+            Mapping of compound to stint_count, total_laps, avg_lap_time
+            and avg_degradation (None when no stint had a value)
+        """
+        pass
+
+    @abstractmethod
+    async def get_summary(self, session_id: str) -> list[dict] | None:
+        """
+        Get the stored strategy summary for a session.
+
+        Args:
+            session_id: The session identifier
+
+        Returns:
+            The summary saved by save_summary, or None if there is none
+            (never saved, or dropped because the session's stints changed)
+        """
+        pass
+
+    @abstractmethod
+    async def save_summary(self, session_id: str, summaries: list[dict]) -> None:
+        """
+        Store a precomputed strategy summary for a session.
+
+        Args:
+            session_id: The session identifier
+            summaries: Per-driver strategy summaries
+        """
+        pass
+
 
 class IPitStopRepository(IRepository[PitStop, str]):
     """
@@ -0,0 +1,60 @@
+"""Per-request memoisation of repository reads."""
+
+import asyncio
+import functools
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+R = TypeVar("R")
+
+# Set to a fresh dict for the duration of each HTTP request
+_REQ_CACHE: ContextVar[dict | None] = ContextVar("repo_cache", default=None)
+
+
+def begin_request_cache() -> object:
+    """Start a request-scoped cache; returns a token for end_request_cache."""
+    return _REQ_CACHE.set({})
+
+
+def end_request_cache(token: object) -> None:
+    """Discard the request-scoped cache started by begin_request_cache."""
+    _REQ_CACHE.reset(token)
+
+
+def clear_request_cache() -> None:
+    """Drop memoised results for the current request (call after writes)."""
+    cache = _REQ_CACHE.get()
+    if cache:
+        cache.clear()
+
+
+def request_cached(
+    func: Callable[..., Awaitable[R]]
+) -> Callable[..., Awaitable[R]]:
+    """
+    Memoise a repository read for the lifetime of the current request.
+
+    Concurrent callers with the same arguments share one in-flight task.
+    Outside a request scope the call goes straight through. List results
+    are copied per caller so the shared result can't be mutated.
+    """
+    @functools.wraps(func)
+    async def wrapper(self, *args: Any, **kwargs: Any) -> R:
+        cache = _REQ_CACHE.get()
+        if cache is None:
+            return await func(self, *args, **kwargs)
+
+        key = (id(self), func.__qualname__, args, tuple(sorted(kwargs.items())))
+        task = cache.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func(self, *args, **kwargs))
+            cache[key] = task
+        try:
+            result = await asyncio.shield(task)
+        except Exception:
+            cache.pop(key, None)
+            raise
+        return list(result) if isinstance(result, list) else result
+
+    return wrapper
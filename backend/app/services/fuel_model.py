@@ -0,0 +1,42 @@
+"""Fuel load model used to normalise lap times across a race."""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class FuelModel:
+    """
+    Linear fuel-effect model.
+
+    A car starts with race_total_fuel_kg of fuel and each kilogram costs
+    s_per_kg seconds per lap; the fuel burns evenly over the race, so a
+    lap is worth a fixed amount of time per lap of fuel burned.
+    """
+
+    race_total_fuel_kg: float = 110.0
+    s_per_kg: float = 0.03
+    # Race distance assumed when the session's lap count is unknown
+    race_distance_laps: int = 56
+
+    @property
+    def total_effect(self) -> float:
+        """Lap time difference between a full and an empty tank (s)."""
+        return self.race_total_fuel_kg * self.s_per_kg
+
+    def s_per_lap(self, total_laps: int) -> float:
+        """Seconds gained per lap of fuel burned over total_laps."""
+        laps = total_laps if total_laps > 0 else self.race_distance_laps
+        return self.total_effect / laps
+
+    def correction(self, lap_numbers: np.ndarray, total_laps: int) -> np.ndarray:
+        """
+        Time to add back to each lap to normalise to start-of-race fuel.
+
+        Laps burned = lap_number - 1 (lap 1 has full fuel).
+        """
+        return (lap_numbers - 1) * self.s_per_lap(total_laps)
+
+
+DEFAULT_FUEL_MODEL = FuelModel()
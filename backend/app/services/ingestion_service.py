@@ -1,9 +1,11 @@
 """Ingestion service - orchestrates data fetching and storage."""
 
+import asyncio
 import logging
 from pathlib import Path
 
-from app.domain.models import Session
+from app.domain.enums import SessionType
+from app.domain.models import Session, TelemetryFrame
 from app.ingestion import FastF1Fetcher
 from app.repositories.interfaces import (
     ISessionRepository,
@@ -12,9 +14,23 @@ from app.repositories.interfaces import (
     IStintRepository,
     ITelemetryRepository,
 )
+from app.services.lap_service import LapService
+from app.services.strategy_service import StrategyService
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on sessions ingested concurrently by event/season ingestion.
+# The fetcher's FastF1 loads take FASTF1_LOCK and run one at a time, so the
+# concurrency only overlaps one session's load with other sessions'
+# transforms and repository writes; a few slots keep that pipeline full
+MAX_CONCURRENT_SESSIONS = 3
+
+# Pending sessions buffered ahead of the season ingestion workers
+SESSION_QUEUE_SIZE = 32
+
+# Telemetry frames saved per write batch while streaming a driver's laps
+TELEMETRY_BATCH_SIZE = 8
+
 
 class IngestionService:
     """
@@ -32,6 +48,8 @@ class IngestionService:
         driver_repo: IDriverRepository,
         stint_repo: IStintRepository,
         telemetry_repo: ITelemetryRepository,
+        lap_service: LapService | None = None,
+        strategy_service: StrategyService | None = None,
     ):
         """
         Initialize with all required dependencies.
@@ -43,6 +61,10 @@ class IngestionService:
             driver_repo: Driver repository
             stint_repo: Stint repository
             telemetry_repo: Telemetry repository
+            lap_service: Lap service whose cached results are dropped
+                when a session is re-ingested
+            strategy_service: Strategy service used to save stints, so
+                their summary is precomputed and stale cached ones dropped
         """
         self._fetcher = fetcher
         self._session_repo = session_repo
@@ -50,6 +72,22 @@ class IngestionService:
         self._driver_repo = driver_repo
         self._stint_repo = stint_repo
         self._telemetry_repo = telemetry_repo
+        self._lap_service = lap_service
+        self._strategy_service = strategy_service
+        self._session_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SESSIONS)
+
+    async def _sem_ingest(
+        self,
+        year: int,
+        event: str | int,
+        session_type: str,
+        include_telemetry: bool = False
+    ) -> Session:
+        """Ingest a session while holding a concurrency slot."""
+        async with self._session_semaphore:
+            return await self.ingest_session(
+                year, event, session_type, include_telemetry
+            )
 
     async def ingest_session(
         self,
@@ -82,22 +120,24 @@ class IngestionService:
         logger.info(f"Saved session: {session.id}")
 
         # Save drivers
-        driver_ids = []
-        for driver in drivers:
-            await self._driver_repo.add(driver)
-            driver_ids.append(driver.id)
+        driver_ids = [driver.id for driver in drivers]
+        await self._driver_repo.add_many(drivers)
         await self._driver_repo.add_session_drivers(session.id, driver_ids)
         await self._driver_repo.add_year_drivers(year, driver_ids)
         logger.info(f"Saved {len(drivers)} drivers")
 
         # Save laps
         await self._lap_repo.add_many(laps)
+        if self._lap_service is not None:
+            self._lap_service.invalidate(session.id)
         logger.info(f"Saved {len(laps)} laps")
 
         # Calculate and save stints
         stints = await self._fetcher.fetch_stints(session.id, laps)
-        for stint in stints:
-            await self._stint_repo.add(stint)
+        if self._strategy_service is not None:
+            await self._strategy_service.save_stints(stints)
+        else:
+            await self._stint_repo.add_many(stints)
         logger.info(f"Saved {len(stints)} stints")
 
         logger.info(f"Ingestion complete: {session.id}")
@@ -130,23 +170,32 @@ class IngestionService:
 
         if lap_numbers:
             # Fetch specific laps
-            count = 0
+            frames = []
             for lap_number in lap_numbers:
                 frame = await self._fetcher.fetch_telemetry(
                     year, event, session_type, driver_id, lap_number
                 )
                 if frame:
-                    await self._telemetry_repo.add(frame)
-                    count += 1
-            return count
+                    frames.append(frame)
+            await self._telemetry_repo.add_many(frames)
+            return len(frames)
         else:
-            # Fetch all laps
-            frames = await self._fetcher.fetch_all_telemetry_for_driver(
+            # Stream all laps, saving in small batches so only a few
+            # frames are held in memory at a time
+            count = 0
+            batch: list[TelemetryFrame] = []
+            async for frame in self._fetcher.iter_all_telemetry_for_driver(
                 year, event, session_type, driver_id
-            )
-            for frame in frames:
-                await self._telemetry_repo.add(frame)
-            return len(frames)
+            ):
+                batch.append(frame)
+                if len(batch) >= TELEMETRY_BATCH_SIZE:
+                    await self._telemetry_repo.add_many(batch)
+                    count += len(batch)
+                    batch = []
+            if batch:
+                await self._telemetry_repo.add_many(batch)
+                count += len(batch)
+            return count
 
     async def ingest_event(
         self,
@@ -163,21 +212,38 @@ class IngestionService:
             include_telemetry: Whether to include telemetry
 
         Returns:
-            List of ingested sessions
+            List of ingested sessions (already ingested sessions are
+            skipped and not returned)
         """
         logger.info(f"Ingesting event: {year} {event}")
 
-        available_sessions = self._fetcher.get_available_sessions(year, event)
-        sessions = []
+        if isinstance(event, int):
+            round_number = event
+        else:
+            event_obj = await asyncio.to_thread(self._fetcher.get_event, year, event)
+            round_number = int(event_obj["RoundNumber"])
 
-        for session_type in available_sessions:
-            try:
-                session = await self.ingest_session(
-                    year, event, session_type, include_telemetry
-                )
-                sessions.append(session)
-            except Exception as e:
-                logger.error(f"Failed to ingest {session_type}: {e}")
+        available_sessions = [
+            session_type
+            for session_type in await asyncio.to_thread(
+                self._fetcher.get_available_sessions, year, event
+            )
+            if not await self._skip_ingested(year, round_number, session_type)
+        ]
+        results = await asyncio.gather(
+            *(
+                self._sem_ingest(year, event, session_type, include_telemetry)
+                for session_type in available_sessions
+            ),
+            return_exceptions=True,
+        )
+
+        sessions = []
+        for session_type, result in zip(available_sessions, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to ingest {session_type}: {result}")
+            else:
+                sessions.append(result)
 
         return sessions
 
@@ -198,14 +264,21 @@ class IngestionService:
         """
         logger.info(f"Ingesting season: {year}")
 
-        schedule = self._fetcher.get_schedule(year)
-        count = 0
+        schedule = await asyncio.to_thread(self._fetcher.get_schedule, year)
 
         types_to_fetch = session_types or ["R", "Q"]  # Default: Race and Qualifying
 
-        for _, event_row in schedule.iterrows():
-            round_number = event_row["RoundNumber"]
-            for session_type in types_to_fetch:
+        # Sessions are fed through a bounded queue to a fixed pool of
+        # workers, so only a handful of fetches are in flight at once
+        queue: asyncio.Queue[tuple[int, str]] = asyncio.Queue(
+            maxsize=SESSION_QUEUE_SIZE
+        )
+        count = 0
+
+        async def worker() -> None:
+            nonlocal count
+            while True:
+                round_number, session_type = await queue.get()
                 try:
                     await self.ingest_session(year, round_number, session_type)
                     count += 1
@@ -213,15 +286,43 @@ class IngestionService:
                     logger.warning(
                         f"Failed {year} R{round_number} {session_type}: {e}"
                     )
+                finally:
+                    queue.task_done()
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(MAX_CONCURRENT_SESSIONS)
+        ]
+        try:
+            for round_number in schedule["RoundNumber"]:
+                for session_type in types_to_fetch:
+                    if await self._skip_ingested(year, round_number, session_type):
+                        continue
+                    await queue.put((int(round_number), session_type))
+            await queue.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
 
         logger.info(f"Season ingestion complete: {count} sessions")
         return count
 
+    async def _skip_ingested(
+        self, year: int, round_number: int, session_type: str
+    ) -> bool:
+        """Check whether a session is already stored, logging the skip."""
+        if await self.is_session_ingested(year, round_number, session_type):
+            logger.info(
+                f"Skipping {year} R{round_number} {session_type}: already ingested"
+            )
+            return True
+        return False
+
     async def is_session_ingested(
         self, year: int, round_number: int, session_type: str
     ) -> bool:
         """Check if a session has already been ingested."""
-        from app.domain.enums import SessionType
         session_id = Session.create_id(
             year, round_number, SessionType.from_fastf1(session_type)
         )
@@ -231,7 +332,6 @@ class IngestionService:
         self, year: int, round_number: int, session_type: str
     ) -> str | None:
         """Get session ID if it exists, otherwise None."""
-        from app.domain.enums import SessionType
         session_id = Session.create_id(
             year, round_number, SessionType.from_fastf1(session_type)
         )
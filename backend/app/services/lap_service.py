@@ -1,10 +1,17 @@
 """Lap service - business logic for lap operations."""
 
+import asyncio
+import heapq
+from collections import defaultdict
 from datetime import timedelta
 
+import numpy as np
+
 from app.domain.enums import TireCompound
 from app.domain.models import Lap
 from app.repositories.interfaces import ILapRepository
+from app.services.fuel_model import DEFAULT_FUEL_MODEL, FuelModel
+from app.services.result_cache import ResultCache
 
 
 class LapService:
@@ -14,14 +21,28 @@ class LapService:
     Implements business logic for querying and analyzing lap data.
     """
 
-    def __init__(self, lap_repo: ILapRepository):
+    def __init__(
+        self,
+        lap_repo: ILapRepository,
+        result_cache: ResultCache | None = None,
+        fuel_model: FuelModel = DEFAULT_FUEL_MODEL,
+    ):
         """
         Initialize the service with repository.
 
         Args:
             lap_repo: Lap repository implementation
+            result_cache: Cache for per-session analysis results; share one
+                across service instances to reuse results between requests
+            fuel_model: Fuel-effect model used for fuel-corrected times
         """
         self._lap_repo = lap_repo
+        self._results = result_cache if result_cache is not None else ResultCache()
+        self._fuel_model = fuel_model
+
+    def invalidate(self, session_id: str) -> None:
+        """Drop cached analysis results for a session (e.g. on re-ingest)."""
+        self._results.invalidate(session_id)
 
     async def get_session_laps(self, session_id: str) -> list[Lap]:
         """Get all laps for a session."""
@@ -45,7 +66,12 @@ class LapService:
         self, session_id: str, top_n: int = 10
     ) -> list[Lap]:
         """Get the fastest laps in a session."""
-        return await self._lap_repo.get_fastest_laps(session_id, top_n)
+        key = (session_id, "fastest_laps", top_n)
+        laps = self._results.get(key)
+        if laps is None:
+            laps = await self._lap_repo.get_fastest_laps(session_id, top_n)
+            self._results.put(key, laps)
+        return list(laps)
 
     async def get_valid_laps(self, session_id: str) -> list[Lap]:
         """Get all valid laps for analysis."""
@@ -53,7 +79,12 @@ class LapService:
 
     async def get_personal_bests(self, session_id: str) -> list[Lap]:
         """Get personal best lap for each driver."""
-        return await self._lap_repo.get_personal_bests(session_id)
+        key = (session_id, "personal_bests")
+        laps = self._results.get(key)
+        if laps is None:
+            laps = await self._lap_repo.get_personal_bests(session_id)
+            self._results.put(key, laps)
+        return list(laps)
 
     async def get_stint_laps(
         self, session_id: str, driver_id: str, stint_number: int
@@ -75,17 +106,26 @@ class LapService:
 
         Returns dict mapping driver_id to list of lap times in seconds.
         """
+        key = (session_id, "lap_time_distribution")
+        distribution = self._results.get(key)
+        if distribution is None:
+            distribution = await self._compute_lap_time_distribution(session_id)
+            self._results.put(key, distribution)
+        return distribution
+
+    async def _compute_lap_time_distribution(
+        self, session_id: str
+    ) -> dict[str, list[float]]:
+        """Build the lap time distribution from the session's valid laps."""
         laps = await self._lap_repo.get_valid_laps(session_id)
 
-        distribution: dict[str, list[float]] = {}
+        distribution: defaultdict[str, list[float]] = defaultdict(list)
         for lap in laps:
-            if lap.lap_time is None:
-                continue
-            if lap.driver_id not in distribution:
-                distribution[lap.driver_id] = []
-            distribution[lap.driver_id].append(lap.lap_time.total_seconds())
+            lap_time = lap.lap_time_seconds
+            if lap_time is not None:
+                distribution[lap.driver_id].append(lap_time)
 
-        return distribution
+        return dict(distribution)
 
     async def get_compound_performance(
         self, session_id: str
@@ -98,13 +138,26 @@ class LapService:
         - Fuel-corrected times (normalized to start-of-race fuel)
         - Degradation-adjusted times (normalized to fresh tire)
 
-        Fuel correction assumes:
+        Fuel correction uses the service's FuelModel, by default:
         - 110kg fuel at race start, ~0.03s/lap/kg fuel effect
         - Total fuel effect ~3.3s from full to empty over race distance
 
         Degradation is estimated by averaging first 3 laps of each stint
         to get the "fresh tire" baseline for each compound.
+
+        Results are cached per session until it is re-ingested.
         """
+        key = (session_id, "compound_performance")
+        performance = self._results.get(key)
+        if performance is None:
+            performance = await self._compute_compound_performance(session_id)
+            self._results.put(key, performance)
+        return performance
+
+    async def _compute_compound_performance(
+        self, session_id: str
+    ) -> dict[str, dict]:
+        """Compute the compound statistics described in get_compound_performance."""
         all_laps = await self._lap_repo.get_valid_laps(session_id)
 
         if not all_laps:
@@ -113,73 +166,62 @@ class LapService:
         # Determine total race laps (max lap number in session)
         total_laps = max(lap.lap_number for lap in all_laps)
 
-        # Fuel correction constant (seconds saved per lap of fuel burned)
-        # Approximately 3.3s total over a 56 lap race = ~0.059s per lap
-        fuel_effect_per_lap = 3.3 / total_laps if total_laps > 0 else 0.059
+        # Group laps by compound in a single pass, then reduce each group
+        # as arrays
+        by_compound: dict[TireCompound, list[Lap]] = {}
+        for lap in all_laps:
+            if lap.lap_time_seconds is not None:
+                by_compound.setdefault(lap.compound, []).append(lap)
 
+        # Only compounds actually used are visited, in declaration order
+        compound_order = list(TireCompound)
         performance: dict[str, dict] = {}
-        for compound in TireCompound:
-            compound_laps = [
-                lap for lap in all_laps
-                if lap.compound == compound and lap.lap_time is not None
-            ]
-            if not compound_laps:
-                continue
-
-            times = [lap.lap_time.total_seconds() for lap in compound_laps]
+        for compound in sorted(by_compound, key=compound_order.index):
+            compound_laps = by_compound[compound]
+
+            n = len(compound_laps)
+            times = np.fromiter(
+                (lap.lap_time_seconds for lap in compound_laps),
+                dtype=np.float64, count=n,
+            )
+            lap_numbers = np.fromiter(
+                (lap.lap_number for lap in compound_laps),
+                dtype=np.float64, count=n,
+            )
+            tyre_life = np.fromiter(
+                (lap.tyre_life for lap in compound_laps),
+                dtype=np.int64, count=n,
+            )
 
-            # Calculate fuel-corrected times
             # Normalize all laps to "start of race" fuel load
-            # Correction = (total_laps - lap_number) * fuel_effect_per_lap
             # A lap at the end of race is faster due to less fuel, so we ADD time
-            fuel_corrected_times = []
-            for lap in compound_laps:
-                raw_time = lap.lap_time.total_seconds()
-                # Laps burned = lap_number - 1 (lap 1 has full fuel)
-                laps_of_fuel_burned = lap.lap_number - 1
-                # Time benefit from burned fuel that we need to add back
-                fuel_correction = laps_of_fuel_burned * fuel_effect_per_lap
-                corrected_time = raw_time + fuel_correction
-                fuel_corrected_times.append(corrected_time)
-
-            # Calculate degradation-adjusted times
-            # Use fresh tire baseline (average of tyre_life 1-3 laps) for each compound
-            fresh_tire_laps = [
-                lap for lap in compound_laps
-                if lap.tyre_life <= 3 and lap.tyre_life >= 1
-            ]
-
-            # Get baseline pace on fresh tires (fuel-corrected)
-            if fresh_tire_laps:
-                fresh_times = []
-                for lap in fresh_tire_laps:
-                    raw_time = lap.lap_time.total_seconds()
-                    fuel_correction = (lap.lap_number - 1) * fuel_effect_per_lap
-                    fresh_times.append(raw_time + fuel_correction)
-                fresh_baseline = sum(fresh_times) / len(fresh_times)
+            fuel_corrected_times = times + self._fuel_model.correction(
+                lap_numbers, total_laps
+            )
+
+            # Fresh tire baseline: average of tyre_life 1-3 laps (fuel-corrected)
+            fresh_times = fuel_corrected_times[(tyre_life >= 1) & (tyre_life <= 3)]
+            if fresh_times.size:
+                fresh_baseline = float(fresh_times.mean())
             else:
                 # Fallback: use fastest fuel-corrected time as baseline
-                fresh_baseline = min(fuel_corrected_times)
+                fresh_baseline = float(fuel_corrected_times.min())
 
-            # Find the fastest lap info
-            fastest_lap = min(compound_laps, key=lambda l: l.lap_time.total_seconds())
+            fastest_lap = compound_laps[int(np.argmin(times))]
             fastest_lap_info = {
                 "driver": fastest_lap.driver_id,
                 "lap_number": fastest_lap.lap_number,
-                "time": fastest_lap.lap_time.total_seconds(),
+                "time": fastest_lap.lap_time_seconds,
                 "tyre_life": fastest_lap.tyre_life,
             }
 
-            # Calculate fastest fuel-corrected time
-            fastest_fuel_corrected = min(fuel_corrected_times)
-
             performance[compound.value] = {
-                "count": len(times),
-                "fastest": min(times),
-                "average": sum(times) / len(times),
-                "slowest": max(times),
-                "fastest_fuel_corrected": fastest_fuel_corrected,
-                "average_fuel_corrected": sum(fuel_corrected_times) / len(fuel_corrected_times),
+                "count": n,
+                "fastest": float(times.min()),
+                "average": float(times.mean()),
+                "slowest": float(times.max()),
+                "fastest_fuel_corrected": float(fuel_corrected_times.min()),
+                "average_fuel_corrected": float(fuel_corrected_times.mean()),
                 "fresh_tire_pace": fresh_baseline,
                 "fastest_lap": fastest_lap_info,
             }
@@ -197,19 +239,22 @@ class LapService:
 
         Returns comparison metrics.
         """
-        driver1_laps = await self.get_driver_laps(session_id, driver1_id)
-        driver2_laps = await self.get_driver_laps(session_id, driver2_id)
+        driver1_laps, driver2_laps = await asyncio.gather(
+            self.get_driver_laps(session_id, driver1_id),
+            self.get_driver_laps(session_id, driver2_id),
+        )
 
         def get_stats(laps: list[Lap]) -> dict | None:
             valid = [l for l in laps if l.lap_time and l.is_valid_for_analysis]
             if not valid:
                 return None
-            times = [l.lap_time.total_seconds() for l in valid]
+            times = [l.lap_time_seconds for l in valid]
             return {
                 "lap_count": len(times),
                 "fastest": min(times),
                 "average": sum(times) / len(times),
-                "median": sorted(times)[len(times) // 2],
+                # Upper median via partial selection rather than a full sort
+                "median": heapq.nsmallest(len(times) // 2 + 1, times)[-1],
             }
 
         return {
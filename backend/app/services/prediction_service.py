@@ -1,7 +1,10 @@
 """Race prediction service - ML-based race finishing order prediction."""
 
+import asyncio
 import json
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from pathlib import Path
 from typing import Any
@@ -12,13 +15,52 @@ import pandas as pd
 import fastf1
 from sklearn.ensemble import GradientBoostingRegressor
 from sklearn.preprocessing import StandardScaler
-from xgboost import XGBRegressor
+from xgboost import Booster, XGBRegressor
 import joblib
+import orjson
 
 from app.config import get_settings
+from app.ingestion.fastf1_lock import FASTF1_LOCK
 
 logger = logging.getLogger(__name__)
 
+# Events processed concurrently while collecting training data. FastF1
+# loads are serialized (see FASTF1_LOCK), so a second worker only overlaps
+# one event's feature extraction with the next event's load
+TRAINING_WORKERS = 2
+
+# Bump whenever _extract_event_features changes what it produces, so
+# features cached by an older version are re-extracted
+FEATURE_CACHE_VERSION = 2
+
+# XGBoost hyperparameters; also applied when loading a saved model so that
+# get_model_info reports them (the native format only stores the booster)
+MODEL_PARAMS = {
+    "n_estimators": 200,
+    "max_depth": 6,
+    "learning_rate": 0.1,
+    "subsample": 0.8,
+    "colsample_bytree": 0.8,
+    "random_state": 42,
+    "objective": "reg:squarederror",
+    # Histogram training over 64 bins; ~15 features and a few hundred rows
+    # gain nothing from finer split candidates
+    "tree_method": "hist",
+    "max_bin": 64,
+}
+
+# Practice lap columns read by feature extraction
+PRACTICE_LAP_COLUMNS = [
+    "Driver", "LapTime", "Stint", "IsAccurate", "PitOutTime", "PitInTime",
+]
+
+# Practice sessions and their names in the FastF1 event schedule
+PRACTICE_SESSION_NAMES = {
+    "FP1": "Practice 1",
+    "FP2": "Practice 2",
+    "FP3": "Practice 3",
+}
+
 # Driver to team mapping (2023-2024 seasons)
 DRIVER_TEAMS = {
     "VER": "Red Bull", "PER": "Red Bull",
@@ -47,7 +89,9 @@ class RacePredictionService:
     def __init__(self, cache_dir: Path | None = None):
         """Initialize the prediction service."""
         settings = get_settings()
-        self._cache_dir = cache_dir or Path(settings.data_dir) / "fastf1_cache"
+        # Share the ingestion fetcher's FastF1 cache, so sessions already
+        # downloaded for the dashboard aren't fetched again for training
+        self._cache_dir = cache_dir or settings.fastf1_cache_dir
         self._cache_dir.mkdir(parents=True, exist_ok=True)
         fastf1.Cache.enable_cache(str(self._cache_dir))
 
@@ -55,40 +99,115 @@ class RacePredictionService:
         self._model_dir.mkdir(parents=True, exist_ok=True)
 
         self._model: XGBRegressor | None = None
+        # Booster used for inference, bypassing the sklearn wrapper
+        self._booster: Booster | None = None
         self._scaler: StandardScaler | None = None
+        # Scaler statistics, applied inline at prediction time
+        self._scaler_mean: np.ndarray | None = None
+        self._scaler_scale: np.ndarray | None = None
         self._feature_columns: list[str] = []
+        # Immutable copy of the feature columns for building feature rows
+        self._feature_keys: tuple[str, ...] = ()
         self._boosters: dict = {"drivers": {}, "teams": {}}
+        # Combined driver + team booster per driver, built when boosters load
+        self._booster_totals: dict[str, float] = {}
+        self._default_booster: float = 0.0
         self._use_boosters: bool = False  # Disabled - outlier removal made model accurate enough
 
+        # Practice features of completed events by "{year}_{round}", so
+        # retraining skips the FastF1 loads for events seen before
+        self._feature_cache_path = self._model_dir / "practice_features.json"
+        self._feature_cache: dict[str, dict[str, dict[str, float]]] = {}
+
+        # Collected training rows, pickled so reloading keeps dtypes and
+        # skips CSV parsing; older installs may still have the CSV
+        self._training_data_path = self._model_dir / "training_data.pkl"
+        self._legacy_training_data_path = self._model_dir / "training_data.csv"
+
         # Try to load existing model and boosters
         self._load_model()
         self._load_boosters()
+        self._load_feature_cache()
 
     def _load_model(self) -> bool:
-        """Load trained model from disk."""
-        model_path = self._model_dir / "race_predictor.joblib"
+        """
+        Load trained model from disk.
+
+        The model is stored in XGBoost's native UBJSON format with the
+        feature list as JSON; models pickled by older versions still load.
+        """
+        model_path = self._model_dir / "race_predictor.ubj"
         scaler_path = self._model_dir / "scaler.joblib"
-        features_path = self._model_dir / "features.joblib"
+        features_path = self._model_dir / "features.json"
+        legacy_model_path = self._model_dir / "race_predictor.joblib"
+        legacy_features_path = self._model_dir / "features.joblib"
 
         if model_path.exists() and scaler_path.exists() and features_path.exists():
             try:
-                self._model = joblib.load(model_path)
+                self._model = XGBRegressor(**MODEL_PARAMS)
+                self._model.load_model(str(model_path))
                 self._scaler = joblib.load(scaler_path)
-                self._feature_columns = joblib.load(features_path)
+                with open(features_path) as f:
+                    self._feature_columns = json.load(f)
+                self._init_predictor()
                 logger.info("Loaded existing prediction model")
                 return True
             except Exception as e:
                 logger.warning(f"Failed to load model: {e}")
+        elif (
+            legacy_model_path.exists()
+            and scaler_path.exists()
+            and legacy_features_path.exists()
+        ):
+            try:
+                self._model = joblib.load(legacy_model_path)
+                self._scaler = joblib.load(scaler_path)
+                self._feature_columns = joblib.load(legacy_features_path)
+                self._init_predictor()
+                logger.info("Loaded existing prediction model (legacy format)")
+                return True
+            except Exception as e:
+                logger.warning(f"Failed to load model: {e}")
         return False
 
+    def _init_scaler(self) -> None:
+        """Cache the fitted scaler's statistics for _scale."""
+        self._scaler_mean = self._scaler.mean_.copy()
+        self._scaler_scale = self._scaler.scale_.copy()
+
+    def _init_predictor(self) -> None:
+        """Prepare the trained model and scaler for inference."""
+        self._init_scaler()
+        self._booster = self._model.get_booster()
+        # Prediction batches are one race's drivers; thread fan-out only
+        # adds dispatch overhead at that size
+        self._booster.set_param({"nthread": 1})
+        self._feature_keys = tuple(self._feature_columns)
+
+    def _scale(self, features: np.ndarray) -> np.ndarray:
+        """
+        Standardize feature rows without going through sklearn.
+
+        The arithmetic runs in float64 and is rounded once to the float32
+        XGBoost evaluates in, so rows land on the same side of a split
+        threshold as they did in training (including for models trained
+        before the float32 hand-off).
+        """
+        return ((features - self._scaler_mean) / self._scaler_scale).astype(np.float32)
+
+    def _predict(self, scaled: np.ndarray) -> np.ndarray:
+        """Predict raw positions for scaled feature rows."""
+        # inplace_predict reads the array directly, without building a DMatrix
+        return self._booster.inplace_predict(scaled)
+
     def _load_boosters(self) -> bool:
         """Load booster coefficients from disk."""
         boosters_path = self._model_dir / "boosters.json"
 
         if boosters_path.exists():
             try:
-                with open(boosters_path) as f:
-                    self._boosters = json.load(f)
+                self._boosters = orjson.loads(boosters_path.read_bytes())
+                self._init_booster_totals()
                 logger.info(f"Loaded boosters: {len(self._boosters.get('drivers', {}))} drivers, "
                            f"{len(self._boosters.get('teams', {}))} teams")
                 return True
@@ -96,6 +215,47 @@ class RacePredictionService:
                 logger.warning(f"Failed to load boosters: {e}")
         return False
 
+    def _init_booster_totals(self) -> None:
+        """Precompute each driver's combined booster for _get_booster."""
+        driver_boosts = self._boosters.get("drivers", {})
+        team_boosts = self._boosters.get("teams", {})
+
+        # Driver booster takes priority, team is a fallback/additional adjustment
+        # Team contributes 30%
+        self._booster_totals = {
+            driver: driver_boosts.get(driver, 0.0)
+            + team_boosts.get(DRIVER_TEAMS.get(driver, "Unknown"), 0.0) * 0.3
+            for driver in DRIVER_TEAMS.keys() | driver_boosts.keys()
+        }
+        self._default_booster = team_boosts.get("Unknown", 0.0) * 0.3
+
+    def _load_feature_cache(self) -> bool:
+        """Load cached practice features of completed events from disk."""
+        if self._feature_cache_path.exists():
+            try:
+                with open(self._feature_cache_path) as f:
+                    cached = json.load(f)
+                if cached.get("version") != FEATURE_CACHE_VERSION:
+                    logger.info("Discarding feature cache from an older feature version")
+                    return False
+                self._feature_cache = cached["events"]
+                logger.info(f"Loaded cached features for {len(self._feature_cache)} events")
+                return True
+            except Exception as e:
+                logger.warning(f"Failed to load feature cache: {e}")
+        return False
+
+    def _save_feature_cache(self):
+        """Persist cached practice features to disk."""
+        tmp_path = self._feature_cache_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            # default=float converts NumPy scalars from the pandas reductions
+            json.dump(
+                {"version": FEATURE_CACHE_VERSION, "events": self._feature_cache},
+                f, default=float,
+            )
+        os.replace(tmp_path, self._feature_cache_path)
+
     def _get_booster(self, driver: str) -> float:
         """
         Get total booster adjustment for a driver.
@@ -103,38 +263,110 @@ class RacePredictionService:
         The booster adjusts the predicted position to correct for systematic biases.
         Positive booster = push prediction down (worse position)
         Negative booster = push prediction up (better position)
-        """
-        if not self._use_boosters:
-            return 0.0
-
-        driver_boost = self._boosters.get("drivers", {}).get(driver, 0.0)
-        team = DRIVER_TEAMS.get(driver, "Unknown")
-        team_boost = self._boosters.get("teams", {}).get(team, 0.0)
 
-        # Combine driver and team boosters
-        # Driver booster takes priority, team is a fallback/additional adjustment
-        total_boost = driver_boost + team_boost * 0.3  # Team contributes 30%
-
-        return total_boost
+        Callers decide whether boosters are applied at all.
+        """
+        return self._booster_totals.get(driver, self._default_booster)
 
     def _save_model(self):
         """Save trained model to disk."""
         if self._model is None:
             return
 
-        joblib.dump(self._model, self._model_dir / "race_predictor.joblib")
+        self._model.save_model(str(self._model_dir / "race_predictor.ubj"))
         joblib.dump(self._scaler, self._model_dir / "scaler.joblib")
-        joblib.dump(self._feature_columns, self._model_dir / "features.joblib")
+        with open(self._model_dir / "features.json", "w") as f:
+            json.dump(self._feature_columns, f)
         logger.info("Saved prediction model")
 
-    def _extract_practice_features(
+    @staticmethod
+    def _get_event_schedule(year: int) -> pd.DataFrame:
+        """Fetch a season's event schedule (blocking)."""
+        with FASTF1_LOCK:
+            return fastf1.get_event_schedule(year)
+
+    def _load_session_laps(
         self,
         year: int,
         event: str | int,
-        driver: str
-    ) -> dict[str, float] | None:
+        session_type: str
+    ) -> pd.DataFrame:
+        """Load the laps of a session (without telemetry)."""
+        with FASTF1_LOCK:
+            session = fastf1.get_session(year, event, session_type)
+            session.load(laps=True, telemetry=False, weather=False, messages=False)
+        return session.laps
+
+    def _filter_practice_laps(self, laps: pd.DataFrame) -> pd.DataFrame | None:
         """
-        Extract features from practice sessions for a driver.
+        Select a practice session's representative laps.
+
+        Pit and inaccurate laps are dropped, then outliers are removed with
+        the 107% rule and an IQR bound. Returns None if no laps remain.
+        """
+        if laps.empty:
+            return None
+
+        # Only these columns are used, so drop the rest before filtering
+        laps = laps[PRACTICE_LAP_COLUMNS]
+
+        # Filter to valid quick laps (exclude pit laps, in/out laps)
+        valid_laps = laps.loc[
+            (laps["IsAccurate"] == True) &
+            (laps["LapTime"].notna()) &
+            (laps["PitOutTime"].isna()) &
+            (laps["PitInTime"].isna())
+        ].copy()
+
+        if valid_laps.empty:
+            return None
+
+        # Convert lap times to seconds for outlier detection
+        valid_laps["LapTimeSeconds"] = valid_laps["LapTime"].dt.total_seconds()
+
+        # Both outlier filters are built as one mask over the raw array
+        times = valid_laps["LapTimeSeconds"].to_numpy()
+
+        # Remove outliers using 107% rule (common F1 threshold)
+        # Laps > 107% of fastest are likely traffic/issues
+        keep = times <= times.min() * 1.07
+
+        # Also remove outliers using IQR method for remaining laps
+        remaining = times[keep]
+        if len(remaining) > 4:
+            q1, q3 = np.percentile(remaining, [25, 75])
+            iqr = q3 - q1
+            keep &= times <= q3 + 1.5 * iqr
+
+        # A handful of drivers label every lap; as a categorical the
+        # per-driver groupbys bucket by integer code instead of hashing
+        valid_laps = valid_laps[keep].astype({"Driver": "category"})
+
+        if valid_laps.empty:
+            return None
+
+        return valid_laps
+
+    def _extract_event_features(
+        self,
+        year: int,
+        event: str | int,
+        drivers: list[str],
+        session_laps: dict[str, pd.DataFrame] | None = None,
+        failed_sessions: list[str] | None = None,
+        scheduled_sessions: list[str] | None = None
+    ) -> dict[str, dict[str, float]]:
+        """
+        Extract features from practice sessions for every driver of an event.
+
+        Each practice session is loaded and filtered once and its laps are
+        grouped by driver, rather than reloading it for every driver.
+        Sessions already loaded by the caller can be passed in session_laps;
+        a session missing from it is treated as unavailable. Sessions that
+        fail to load get penalty defaults and are appended to failed_sessions.
+        If scheduled_sessions is given, practice sessions outside it (FP2 and
+        FP3 on sprint weekends) get the same defaults without being loaded
+        or reported as failed.
 
         Features include:
         - Best lap time in each practice session (normalized to session fastest)
@@ -142,129 +374,165 @@ class RacePredictionService:
         - Consistency (std dev of lap times)
         - Long run pace (average of 5+ lap stints)
         - Position in each session
+
+        Returns:
+            Features by driver; drivers without any practice data are omitted
         """
-        features = {}
+        features: dict[str, dict[str, float]] = {driver: {} for driver in drivers}
 
-        for session_type in ["FP1", "FP2", "FP3"]:
+        for session_type in PRACTICE_SESSION_NAMES:
+            if scheduled_sessions is not None and session_type not in scheduled_sessions:
+                self._set_missing_session_defaults(features, session_type)
+                continue
             try:
-                session = fastf1.get_session(year, event, session_type)
-                session.load(laps=True, telemetry=False, weather=False, messages=False)
-
-                laps = session.laps
-                if laps.empty:
-                    continue
-
-                # Filter to valid quick laps (exclude pit laps, in/out laps)
-                valid_laps = laps[
-                    (laps["IsAccurate"] == True) &
-                    (laps["LapTime"].notna()) &
-                    (laps["PitOutTime"].isna()) &
-                    (laps["PitInTime"].isna())
-                ].copy()
-
-                if valid_laps.empty:
-                    continue
-
-                # Convert lap times to seconds for outlier detection
-                valid_laps["LapTimeSeconds"] = valid_laps["LapTime"].apply(
-                    lambda x: x.total_seconds()
-                )
-
-                # Remove outliers using 107% rule (common F1 threshold)
-                # Laps > 107% of fastest are likely traffic/issues
-                session_fastest_raw = valid_laps["LapTimeSeconds"].min()
-                max_valid_time = session_fastest_raw * 1.07
-                valid_laps = valid_laps[valid_laps["LapTimeSeconds"] <= max_valid_time]
-
-                # Also remove outliers using IQR method for remaining laps
-                if len(valid_laps) > 4:
-                    q1 = valid_laps["LapTimeSeconds"].quantile(0.25)
-                    q3 = valid_laps["LapTimeSeconds"].quantile(0.75)
-                    iqr = q3 - q1
-                    upper_bound = q3 + 1.5 * iqr
-                    valid_laps = valid_laps[valid_laps["LapTimeSeconds"] <= upper_bound]
-
-                if valid_laps.empty:
+                if session_laps is None:
+                    laps = self._load_session_laps(year, event, session_type)
+                else:
+                    laps = session_laps[session_type]
+                valid_laps = self._filter_practice_laps(laps)
+                if valid_laps is None:
                     continue
 
                 # Session fastest time for normalization (after outlier removal)
                 session_fastest = valid_laps["LapTimeSeconds"].min()
 
-                # Get driver's laps
-                driver_laps = valid_laps[valid_laps["Driver"] == driver]
+                # Position in session (rank by best lap), looked up per driver
+                driver_bests = valid_laps.groupby("Driver", observed=True)["LapTimeSeconds"].min().sort_values()
+                positions = {d: i for i, d in enumerate(driver_bests.index, start=1)}
+
+                # Long run pace: laps 3-end (avoiding the fuel effect at the
+                # start) of stints on the same tyre of >= 5 laps
+                stints = valid_laps.groupby(["Driver", "Stint"], observed=True)["LapTimeSeconds"]
+                long_mask = (stints.transform("size") >= 5) & (stints.cumcount() >= 2)
+                long_run_means = (
+                    valid_laps.loc[long_mask]
+                    .groupby("Driver", observed=True)["LapTimeSeconds"].mean().to_dict()
+                )
 
-                if driver_laps.empty:
-                    # No data for this driver in this session
-                    features[f"{session_type}_best_delta"] = 2.0  # Penalty for missing
-                    features[f"{session_type}_avg_delta"] = 2.0
-                    features[f"{session_type}_consistency"] = 1.0
-                    features[f"{session_type}_position"] = 20
-                    continue
+                laps_by_driver = dict(tuple(valid_laps.groupby("Driver", observed=True)))
 
-                # Use pre-computed lap times in seconds
-                driver_times = driver_laps["LapTimeSeconds"]
+                for driver in drivers:
+                    driver_features = features[driver]
+                    driver_laps = laps_by_driver.get(driver)
 
-                # Best lap delta to session fastest
-                best_time = driver_times.min()
-                features[f"{session_type}_best_delta"] = best_time - session_fastest
+                    if driver_laps is None or driver_laps.empty:
+                        # No data for this driver in this session
+                        driver_features[f"{session_type}_best_delta"] = 2.0  # Penalty for missing
+                        driver_features[f"{session_type}_avg_delta"] = 2.0
+                        driver_features[f"{session_type}_consistency"] = 1.0
+                        driver_features[f"{session_type}_position"] = 20
+                        continue
 
-                # Average lap delta
-                avg_time = driver_times.mean()
-                features[f"{session_type}_avg_delta"] = avg_time - session_fastest
+                    # Use pre-computed lap times in seconds
+                    driver_times = driver_laps["LapTimeSeconds"]
 
-                # Consistency (std dev)
-                features[f"{session_type}_consistency"] = driver_times.std() if len(driver_times) > 1 else 0.5
+                    # Best lap delta to session fastest
+                    best_time = driver_times.min()
+                    driver_features[f"{session_type}_best_delta"] = best_time - session_fastest
 
-                # Position in session (rank by best lap)
-                driver_bests = valid_laps.groupby("Driver")["LapTimeSeconds"].min().sort_values()
-                position = list(driver_bests.index).index(driver) + 1 if driver in driver_bests.index else 20
-                features[f"{session_type}_position"] = position
+                    # Average lap delta
+                    avg_time = driver_times.mean()
+                    driver_features[f"{session_type}_avg_delta"] = avg_time - session_fastest
 
-                # Long run pace (laps on same tyre >= 5 laps)
-                long_run_laps = []
-                for stint in driver_laps["Stint"].unique():
-                    stint_laps = driver_laps[driver_laps["Stint"] == stint]
-                    if len(stint_laps) >= 5:
-                        # Take laps 3-end to avoid fuel effect at start
-                        long_run_times = stint_laps["LapTimeSeconds"].iloc[2:]
-                        long_run_laps.extend(long_run_times.tolist())
+                    # Consistency (std dev)
+                    driver_features[f"{session_type}_consistency"] = driver_times.std() if len(driver_times) > 1 else 0.5
 
-                if long_run_laps:
-                    features[f"{session_type}_long_run_delta"] = np.mean(long_run_laps) - session_fastest
-                else:
-                    features[f"{session_type}_long_run_delta"] = features.get(f"{session_type}_avg_delta", 2.0)
+                    driver_features[f"{session_type}_position"] = positions.get(driver, 20)
+
+                    long_run_mean = long_run_means.get(driver)
+                    if long_run_mean is not None:
+                        driver_features[f"{session_type}_long_run_delta"] = long_run_mean - session_fastest
+                    else:
+                        driver_features[f"{session_type}_long_run_delta"] = driver_features.get(f"{session_type}_avg_delta", 2.0)
 
             except Exception as e:
                 logger.warning(f"Failed to extract features from {session_type}: {e}")
-                # Set default values for missing session
-                features[f"{session_type}_best_delta"] = 2.0
-                features[f"{session_type}_avg_delta"] = 2.0
-                features[f"{session_type}_consistency"] = 1.0
-                features[f"{session_type}_position"] = 20
-                features[f"{session_type}_long_run_delta"] = 2.0
-
-        if not features:
-            return None
-
-        return features
+                if failed_sessions is not None:
+                    failed_sessions.append(session_type)
+                self._set_missing_session_defaults(features, session_type)
+
+        return {driver: f for driver, f in features.items() if f}
+
+    @staticmethod
+    def _set_missing_session_defaults(
+        features: dict[str, dict[str, float]], session_type: str
+    ) -> None:
+        """Give every driver penalty defaults for an unavailable session."""
+        for driver_features in features.values():
+            driver_features[f"{session_type}_best_delta"] = 2.0
+            driver_features[f"{session_type}_avg_delta"] = 2.0
+            driver_features[f"{session_type}_consistency"] = 1.0
+            driver_features[f"{session_type}_position"] = 20
+            driver_features[f"{session_type}_long_run_delta"] = 2.0
+
+    @staticmethod
+    def _scheduled_practice_sessions(event: pd.Series) -> list[str]:
+        """Practice sessions held at an event, from its schedule entry."""
+        session_names = {event.get(f"Session{i}") for i in range(1, 6)}
+        return [
+            session_type
+            for session_type, name in PRACTICE_SESSION_NAMES.items()
+            if name in session_names
+        ]
+
+    def _race_positions(self, results: pd.DataFrame) -> dict[str, int]:
+        """Map each classified driver to their race finishing position."""
+        positions = results.set_index("Abbreviation")["Position"].dropna()
+        return {driver: int(position) for driver, position in positions.items()}
+
+    def _process_event_sync(
+        self,
+        year: int,
+        round_num: int,
+        event_name: str
+    ) -> list[dict[str, Any]]:
+        """Build the training rows for one event (blocking)."""
+        logger.info(f"Processing {year} {event_name}")
 
-    def _get_race_result(self, year: int, event: str | int, driver: str) -> int | None:
-        """Get race finishing position for a driver."""
+        rows = []
         try:
-            session = fastf1.get_session(year, event, "R")
-            session.load(laps=False, telemetry=False, weather=False, messages=False)
+            # Get race session to find drivers
+            with FASTF1_LOCK:
+                race = fastf1.get_session(year, round_num, "R")
+                race.load(laps=False, telemetry=False, weather=False, messages=False)
+
+            cache_key = f"{year}_{round_num}"
+            event_features = self._feature_cache.get(cache_key)
+            if event_features is None:
+                drivers = [d for d in race.results["Abbreviation"].tolist() if d]
+                failed_sessions: list[str] = []
+                event_features = self._extract_event_features(
+                    year,
+                    round_num,
+                    drivers,
+                    failed_sessions=failed_sessions,
+                    scheduled_sessions=self._scheduled_practice_sessions(race.event),
+                )
+                # Penalty defaults from a failed load must not outlive it;
+                # sessions the event format doesn't have are not failures
+                if event_features and not failed_sessions:
+                    self._feature_cache[cache_key] = event_features
 
-            results = session.results
-            driver_result = results[results["Abbreviation"] == driver]
+            # Finishing positions come from the race session loaded above
+            race_positions = self._race_positions(race.results)
+
+            for driver, features in event_features.items():
+                race_position = race_positions.get(driver)
+                if race_position is None:
+                    continue
+
+                rows.append({
+                    **features,
+                    "year": year,
+                    "round": round_num,
+                    "driver": driver,
+                    "race_position": race_position,
+                })
 
-            if not driver_result.empty:
-                position = driver_result["Position"].iloc[0]
-                if pd.notna(position):
-                    return int(position)
         except Exception as e:
-            logger.warning(f"Failed to get race result: {e}")
+            logger.warning(f"Failed to process {year} {event_name}: {e}")
 
-        return None
+        return rows
 
     async def collect_training_data(
         self,
@@ -278,53 +546,36 @@ class RacePredictionService:
         """
         logger.info(f"Collecting training data from {start_year} to {end_year}")
 
-        all_data = []
-
-        for year in range(start_year, end_year + 1):
+        async def completed_events(year: int) -> list[tuple[int, int, str]]:
             try:
-                schedule = fastf1.get_event_schedule(year)
-                # Filter to events that have already happened
-                completed_events = schedule[schedule["EventDate"] < pd.Timestamp.now()]
-
-                for _, event in completed_events.iterrows():
-                    event_name = event["EventName"]
-                    round_num = event["RoundNumber"]
-
-                    logger.info(f"Processing {year} {event_name}")
-
-                    try:
-                        # Get race session to find drivers
-                        race = fastf1.get_session(year, round_num, "R")
-                        race.load(laps=False, telemetry=False, weather=False, messages=False)
-
-                        drivers = race.results["Abbreviation"].tolist()
-
-                        for driver in drivers:
-                            if not driver:
-                                continue
-
-                            features = self._extract_practice_features(year, round_num, driver)
-                            if features is None:
-                                continue
-
-                            race_position = self._get_race_result(year, round_num, driver)
-                            if race_position is None:
-                                continue
-
-                            features["year"] = year
-                            features["round"] = round_num
-                            features["driver"] = driver
-                            features["race_position"] = race_position
-
-                            all_data.append(features)
-
-                    except Exception as e:
-                        logger.warning(f"Failed to process {year} {event_name}: {e}")
-                        continue
-
+                schedule = await asyncio.to_thread(self._get_event_schedule, year)
             except Exception as e:
                 logger.warning(f"Failed to get schedule for {year}: {e}")
-                continue
+                return []
+            # Filter to events that have already happened
+            completed = schedule[schedule["EventDate"] < pd.Timestamp.now()]
+            return [
+                (year, int(round_num), event_name)
+                for round_num, event_name in zip(
+                    completed["RoundNumber"], completed["EventName"], strict=True
+                )
+            ]
+
+        # Gather every season's schedule, then process the completed events
+        # on the training workers
+        schedules = await asyncio.gather(*(
+            completed_events(year) for year in range(start_year, end_year + 1)
+        ))
+        events = [event for year_events in schedules for event in year_events]
+
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=TRAINING_WORKERS) as pool:
+            event_rows = await asyncio.gather(*(
+                loop.run_in_executor(pool, self._process_event_sync, *event)
+                for event in events
+            ))
+        all_data = [row for rows in event_rows for row in rows]
+        self._save_feature_cache()
 
         if not all_data:
             raise ValueError("No training data collected")
@@ -333,10 +584,27 @@ class RacePredictionService:
         logger.info(f"Collected {len(df)} training samples")
 
         # Save training data
-        df.to_csv(self._model_dir / "training_data.csv", index=False)
+        df.to_pickle(self._training_data_path)
 
         return df
 
+    def has_training_data(self) -> bool:
+        """Check whether collected training data is saved on disk."""
+        return (
+            self._training_data_path.exists()
+            or self._legacy_training_data_path.exists()
+        )
+
+    def _load_training_data(self) -> pd.DataFrame | None:
+        """Load saved training data, converting a legacy CSV copy."""
+        if self._training_data_path.exists():
+            return pd.read_pickle(self._training_data_path)
+        if self._legacy_training_data_path.exists():
+            df = pd.read_csv(self._legacy_training_data_path)
+            df.to_pickle(self._training_data_path)
+            return df
+        return None
+
     async def train_model(
         self,
         training_data: pd.DataFrame | None = None,
@@ -352,48 +620,48 @@ class RacePredictionService:
 
         # Collect or load training data
         if training_data is None:
-            data_path = self._model_dir / "training_data.csv"
-            if data_path.exists():
-                training_data = pd.read_csv(data_path)
-            else:
-                training_data = await self.collect_training_data(start_year, end_year)
+            training_data = self._load_training_data()
+        if training_data is None:
+            training_data = await self.collect_training_data(start_year, end_year)
 
         # Define feature columns (exclude metadata and target)
         metadata_cols = ["year", "round", "driver", "race_position"]
         self._feature_columns = [c for c in training_data.columns if c not in metadata_cols]
 
         # Prepare features and target
-        X = training_data[self._feature_columns].fillna(training_data[self._feature_columns].median())
+        X = training_data[self._feature_columns].fillna(
+            training_data[self._feature_columns].median()
+        ).to_numpy(dtype=np.float64)
         y = training_data["race_position"]
 
         # Scale features
         self._scaler = StandardScaler()
-        X_scaled = self._scaler.fit_transform(X)
+        self._scaler.fit(X)
+        self._init_scaler()
+        # Scale exactly as predict_race will
+        X_scaled = self._scale(X)
 
         # Train XGBoost model
-        self._model = XGBRegressor(
-            n_estimators=200,
-            max_depth=6,
-            learning_rate=0.1,
-            subsample=0.8,
-            colsample_bytree=0.8,
-            random_state=42,
-            objective="reg:squarederror"
-        )
+        self._model = XGBRegressor(**MODEL_PARAMS)
 
         self._model.fit(X_scaled, y)
+        self._init_predictor()
 
         # Calculate training metrics
         predictions = self._model.predict(X_scaled)
 
-        mae = np.mean(np.abs(predictions - y))
-        rmse = np.sqrt(np.mean((predictions - y) ** 2))
-        within_1 = np.mean(np.abs(predictions - y) <= 1) * 100
-        within_3 = np.mean(np.abs(predictions - y) <= 3) * 100
-        within_5 = np.mean(np.abs(predictions - y) <= 5) * 100
+        # One absolute-error array shared by every metric
+        err = np.abs(predictions - y.to_numpy(dtype=np.float64))
+        mae = err.mean()
+        rmse = np.sqrt((err * err).mean())
+        within_1 = (err <= 1).mean() * 100
+        within_3 = (err <= 3).mean() * 100
+        within_5 = (err <= 5).mean() * 100
 
         # Feature importance
-        importance = dict(zip(self._feature_columns, self._model.feature_importances_))
+        importance = dict(zip(
+            self._feature_columns, self._model.feature_importances_, strict=True
+        ))
         top_features = sorted(importance.items(), key=lambda x: x[1], reverse=True)[:10]
 
         metrics = {
@@ -417,61 +685,87 @@ class RacePredictionService:
     async def predict_race(
         self,
         year: int,
-        event: str | int
+        event: str | int,
+        use_boosters: bool | None = None
     ) -> list[dict[str, Any]]:
         """
         Predict race finishing order for an upcoming/current event.
 
+        use_boosters overrides the service's booster setting for this call.
+        The FastF1 loads and inference run in a worker thread.
+
         Returns list of predictions sorted by predicted position.
         """
         if self._model is None:
             raise ValueError("Model not trained. Call train_model() first.")
 
+        if use_boosters is None:
+            use_boosters = self._use_boosters
+        return await asyncio.to_thread(
+            self._predict_race_sync, year, event, use_boosters
+        )
+
+    def _predict_race_sync(
+        self,
+        year: int,
+        event: str | int,
+        use_boosters: bool
+    ) -> list[dict[str, Any]]:
+        """Predict race finishing order (blocking)."""
         logger.info(f"Predicting race order for {year} {event}")
 
-        # Get list of drivers from practice sessions
-        drivers = set()
+        # Load each practice session once; the laps serve both the driver
+        # list and feature extraction
+        session_laps: dict[str, pd.DataFrame] = {}
+        session_drivers: list[pd.Series] = []
         for session_type in ["FP1", "FP2", "FP3"]:
             try:
-                session = fastf1.get_session(year, event, session_type)
-                session.load(laps=True, telemetry=False, weather=False, messages=False)
-                drivers.update(session.laps["Driver"].unique())
+                laps = self._load_session_laps(year, event, session_type)
+                session_drivers.append(laps["Driver"])
             except Exception:
                 continue
+            session_laps[session_type] = laps
 
-        if not drivers:
+        all_drivers = (
+            pd.unique(pd.concat(session_drivers, ignore_index=True))
+            if session_drivers else []
+        )
+        if len(all_drivers) == 0:
             raise ValueError(f"No practice data available for {year} {event}")
+        drivers = all_drivers[pd.notna(all_drivers) & (all_drivers != "")].tolist()
 
         predictions = []
 
-        for driver in drivers:
-            if not driver or pd.isna(driver):
-                continue
-
-            features = self._extract_practice_features(year, event, driver)
-            if features is None:
-                continue
-
-            # Build feature vector
-            feature_vector = []
-            for col in self._feature_columns:
-                feature_vector.append(features.get(col, 0))
-
-            # Scale and predict
-            X = np.array([feature_vector])
-            X_scaled = self._scaler.transform(X)
-            raw_predicted_position = self._model.predict(X_scaled)[0]
-
+        event_features = self._extract_event_features(
+            year, event, drivers, session_laps
+        )
+        if not event_features:
+            return predictions
+
+        # Build one feature matrix, then scale and predict all drivers at once
+        feature_keys = self._feature_keys
+        X = np.empty((len(event_features), len(feature_keys)), dtype=np.float64)
+        for row, features in zip(X, event_features.values(), strict=True):
+            row[:] = np.fromiter(
+                (features.get(col, 0.0) for col in feature_keys),
+                dtype=np.float64, count=len(feature_keys),
+            )
+        X_scaled = self._scale(X)
+        raw_predicted_positions = self._predict(X_scaled)
+
+        for (driver, features), raw_predicted_position in zip(
+            event_features.items(), raw_predicted_positions, strict=True
+        ):
             # Apply booster coefficient to adjust for driver/team biases
-            booster = self._get_booster(driver)
+            booster = self._get_booster(driver) if use_boosters else 0.0
             adjusted_position = raw_predicted_position - booster
 
             # Get confidence based on practice consistency
-            consistency = np.mean([
-                features.get("FP1_consistency", 1),
-                features.get("FP2_consistency", 1),
-                features.get("FP3_consistency", 1)
-            ])
+            consistency = (
+                features.get("FP1_consistency", 1.0)
+                + features.get("FP2_consistency", 1.0)
+                + features.get("FP3_consistency", 1.0)
+            ) / 3
             confidence = max(0, min(100, 100 - consistency * 50))
 
             predictions.append({
@@ -491,40 +785,93 @@ class RacePredictionService:
                 "fp3_long_run": features.get("FP3_long_run_delta"),
             })
 
-        # Sort by predicted position and assign actual ranks
+        self._rank_predictions(predictions)
+        return predictions
+
+    @staticmethod
+    def _rank_predictions(predictions: list[dict[str, Any]]) -> None:
+        """Sort predictions by predicted position and assign actual ranks."""
         predictions.sort(key=lambda x: x["predicted_position"])
         for i, pred in enumerate(predictions, 1):
             pred["rank"] = i
 
-        return predictions
+    def _load_race_results(self, year: int, event: str | int) -> dict[str, Any]:
+        """Load a race's finishing positions by driver (blocking)."""
+        with FASTF1_LOCK:
+            race = fastf1.get_session(year, event, "R")
+            race.load(laps=False, telemetry=False, weather=False, messages=False)
+        return dict(zip(
+            race.results["Abbreviation"], race.results["Position"], strict=True
+        ))
 
     async def backtest(
         self,
         year: int,
-        event: str | int
+        event: str | int,
+        use_boosters: bool | None = None
     ) -> dict[str, Any]:
         """
         Backtest the model on a historical race.
 
+        use_boosters overrides the service's booster setting for this call.
+
         Returns predictions vs actual results comparison.
         """
         if self._model is None:
             raise ValueError("Model not trained. Call train_model() first.")
 
         # Get predictions
-        predictions = await self.predict_race(year, event)
+        predictions = await self.predict_race(year, event, use_boosters)
 
         # Get actual results
-        try:
-            race = fastf1.get_session(year, event, "R")
-            race.load(laps=False, telemetry=False, weather=False, messages=False)
+        results_dict = await self._get_race_results(year, event)
+
+        return self._score_backtest(predictions, results_dict)
+
+    async def backtest_boosters(
+        self,
+        year: int,
+        event: str | int
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """
+        Backtest a historical race with and without boosters.
+
+        The raw model output does not depend on boosters, so the race is
+        predicted once and re-ranked on the raw positions for the run
+        without them, loading each session only once.
 
-            results = race.results[["Abbreviation", "Position"]].copy()
-            results.columns = ["driver", "actual_position"]
-            results_dict = dict(zip(results["driver"], results["actual_position"]))
+        Returns the (with boosters, without boosters) backtest results.
+        """
+        if self._model is None:
+            raise ValueError("Model not trained. Call train_model() first.")
+
+        with_boosters = await self.predict_race(year, event, use_boosters=True)
+        without_boosters = [
+            {**pred, "predicted_position": pred["predicted_position_raw"], "booster": 0.0}
+            for pred in with_boosters
+        ]
+        self._rank_predictions(without_boosters)
+
+        results_dict = await self._get_race_results(year, event)
+
+        return (
+            self._score_backtest(with_boosters, results_dict),
+            self._score_backtest(without_boosters, results_dict),
+        )
+
+    async def _get_race_results(self, year: int, event: str | int) -> dict[str, Any]:
+        """Load a race's finishing positions without blocking the loop."""
+        try:
+            return await asyncio.to_thread(self._load_race_results, year, event)
         except Exception as e:
             raise ValueError(f"Failed to get race results: {e}")
 
+    def _score_backtest(
+        self,
+        predictions: list[dict[str, Any]],
+        results_dict: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Match ranked predictions with actual results and score them."""
         # Match predictions with actual results
         comparison = []
         for pred in predictions:
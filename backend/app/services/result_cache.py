@@ -0,0 +1,59 @@
+"""Small TTL + LRU cache for per-session analysis results."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+# Default lifetime of a cached result, in seconds
+DEFAULT_RESULT_TTL = 300.0
+
+# Default number of results kept before the least recently used is evicted
+DEFAULT_RESULT_CACHE_SIZE = 512
+
+
+class ResultCache:
+    """
+    Cache of complete analysis results keyed by (session_id, method, *args).
+
+    Session data is effectively immutable once ingested, so entries only
+    need to be dropped when a session is re-ingested; the TTL bounds how
+    long a result can outlive a write made by another process.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_RESULT_TTL,
+        maxsize: int = DEFAULT_RESULT_CACHE_SIZE,
+    ):
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._entries: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: tuple[Hashable, ...]) -> Any:
+        """Return a cached result, or None if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self._ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: tuple[Hashable, ...], value: Any) -> None:
+        """Store a (non-None) result, evicting the least recently used if full."""
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, session_id: str) -> None:
+        """Drop every cached result for a session."""
+        for key in [k for k in self._entries if k[0] == session_id]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
@@ -1,8 +1,14 @@
 """Strategy service - tire strategy analysis."""
 
+from itertools import groupby
+from operator import attrgetter
+
+import numpy as np
+
 from app.domain.enums import TireCompound
 from app.domain.models import TireStint, Lap
 from app.repositories.interfaces import IStintRepository, ILapRepository
+from app.services.result_cache import ResultCache
 
 
 class StrategyService:
@@ -16,7 +22,8 @@ class StrategyService:
     def __init__(
         self,
         stint_repo: IStintRepository,
-        lap_repo: ILapRepository
+        lap_repo: ILapRepository,
+        result_cache: ResultCache | None = None,
     ):
         """
         Initialize the service with repositories.
@@ -24,9 +31,16 @@ class StrategyService:
         Args:
             stint_repo: Stint repository implementation
             lap_repo: Lap repository implementation
+            result_cache: Cache for per-session strategy summaries; share one
+                across service instances to reuse results between requests
         """
         self._stint_repo = stint_repo
         self._lap_repo = lap_repo
+        self._results = result_cache if result_cache is not None else ResultCache()
+
+    def invalidate(self, session_id: str) -> None:
+        """Drop cached strategy summaries for a session (e.g. on re-ingest)."""
+        self._results.invalidate(session_id)
 
     async def get_session_stints(self, session_id: str) -> list[TireStint]:
         """Get all tire stints for a session."""
@@ -45,12 +59,14 @@ class StrategyService:
         return await self._stint_repo.get_by_compound(session_id, compound)
 
     async def save_stints(self, stints: list[TireStint]) -> list[TireStint]:
-        """Save multiple stints."""
-        result = []
-        for stint in stints:
-            saved = await self._stint_repo.add(stint)
-            result.append(saved)
-        return result
+        """Save multiple stints and store each session's new summary."""
+        saved = await self._stint_repo.add_many(stints)
+        for session_id in {stint.session_id for stint in stints}:
+            self.invalidate(session_id)
+            summaries = await self._compute_strategy_summary(session_id)
+            await self._stint_repo.save_summary(session_id, summaries)
+            self._results.put((session_id, "strategy_summary"), summaries)
+        return saved
 
     async def get_strategy_summary(
         self, session_id: str
@@ -59,35 +75,49 @@ class StrategyService:
         Get strategy summary for all drivers.
 
         Returns list of driver strategies with compounds used.
+        Results are cached per session until its stints change; the
+        summary stored at ingest is served when present, and is computed
+        and stored on first use otherwise.
         """
+        key = (session_id, "strategy_summary")
+        summaries = self._results.get(key)
+        if summaries is None:
+            summaries = await self._stint_repo.get_summary(session_id)
+            if summaries is None:
+                summaries = await self._compute_strategy_summary(session_id)
+                if summaries:
+                    await self._stint_repo.save_summary(session_id, summaries)
+            self._results.put(key, summaries)
+        return list(summaries)
+
+    async def _compute_strategy_summary(self, session_id: str) -> list[dict]:
+        """Build the per-driver summaries described in get_strategy_summary."""
         stints = await self._stint_repo.get_by_session(session_id)
 
-        # Group by driver
-        by_driver: dict[str, list[TireStint]] = {}
-        for stint in stints:
-            if stint.driver_id not in by_driver:
-                by_driver[stint.driver_id] = []
-            by_driver[stint.driver_id].append(stint)
+        # One sort (a linear pass when the repository already returns this
+        # order) lets groupby walk each driver's stints in sequence
+        stints.sort(key=attrgetter("driver_id", "stint_number"))
 
         summaries = []
-        for driver_id, driver_stints in by_driver.items():
-            sorted_stints = sorted(driver_stints, key=lambda s: s.stint_number)
+        for driver_id, group in groupby(stints, key=attrgetter("driver_id")):
+            sorted_stints = list(group)
+            compounds = [s.compound.value for s in sorted_stints]
             summaries.append({
                 "driver_id": driver_id,
                 "total_stints": len(sorted_stints),
-                "compounds": [s.compound.value for s in sorted_stints],
+                "compounds": compounds,
                 "pit_stops": len(sorted_stints) - 1,
                 "stints": [
                     {
                         "stint_number": s.stint_number,
-                        "compound": s.compound.value,
+                        "compound": compound,
                         "start_lap": s.start_lap,
                         "end_lap": s.end_lap,
                         "total_laps": s.total_laps,
                         "avg_lap_time": s.avg_lap_time_seconds,
                         "degradation_rate": s.degradation_rate,
                     }
-                    for s in sorted_stints
+                    for s, compound in zip(sorted_stints, compounds, strict=True)
                 ]
             })
 
@@ -100,34 +130,14 @@ class StrategyService:
         Analyze which compound performed best.
 
         Returns performance metrics by compound.
+        Results are cached per session until its stints change.
         """
-        stints = await self._stint_repo.get_by_session(session_id)
-
-        by_compound: dict[str, list[TireStint]] = {}
-        for stint in stints:
-            compound = stint.compound.value
-            if compound not in by_compound:
-                by_compound[compound] = []
-            by_compound[compound].append(stint)
-
-        analysis = {}
-        for compound, compound_stints in by_compound.items():
-            valid_times = [
-                s.avg_lap_time_seconds for s in compound_stints
-                if s.avg_lap_time_seconds is not None
-            ]
-            valid_deg = [
-                s.degradation_rate for s in compound_stints
-                if s.degradation_rate is not None
-            ]
-
-            analysis[compound] = {
-                "stint_count": len(compound_stints),
-                "total_laps": sum(s.total_laps for s in compound_stints),
-                "avg_lap_time": sum(valid_times) / len(valid_times) if valid_times else None,
-                "avg_degradation": sum(valid_deg) / len(valid_deg) if valid_deg else None,
-            }
-
+        key = (session_id, "optimal_compound")
+        analysis = self._results.get(key)
+        if analysis is None:
+            # The repository aggregates at the storage layer
+            analysis = await self._stint_repo.aggregate_by_compound(session_id)
+            self._results.put(key, analysis)
         return analysis
 
     async def calculate_stint_degradation(
@@ -144,30 +154,33 @@ class StrategyService:
         if not laps:
             return None
 
-        sorted_laps = sorted(laps, key=lambda l: l.lap_number)
-        valid_laps = [l for l in sorted_laps if l.is_valid_for_analysis and l.lap_time]
-
-        if len(valid_laps) < 2:
-            return None
+        sorted_laps = sorted(laps, key=attrgetter("lap_number"))
 
+        # Filter and build the per-lap rows in one pass
         lap_data = []
-        for i, lap in enumerate(valid_laps):
+        times = []
+        for lap in sorted_laps:
+            if not (lap.is_valid_for_analysis and lap.lap_time):
+                continue
+            lap_time = lap.lap_time_seconds
+            times.append(lap_time)
             lap_data.append({
                 "lap_number": lap.lap_number,
-                "lap_in_stint": i + 1,
-                "lap_time": lap.lap_time.total_seconds(),
+                "lap_in_stint": len(times),
+                "lap_time": lap_time,
                 "tyre_life": lap.tyre_life,
             })
 
-        # Calculate degradation
-        if len(lap_data) >= 3:
-            times = [l["lap_time"] for l in lap_data]
-            n = len(times)
-            x_mean = (n + 1) / 2
-            y_mean = sum(times) / n
-            numerator = sum((i + 1 - x_mean) * (t - y_mean) for i, t in enumerate(times))
-            denominator = sum((i + 1 - x_mean) ** 2 for i in range(n))
-            degradation = numerator / denominator if denominator > 0 else 0
+        n = len(lap_data)
+        if n < 2:
+            return None
+
+        # Calculate degradation: least-squares slope of lap time over lap in
+        # stint. With x = 1..n the centred x values sum to zero, so the
+        # numerator is a dot product and the denominator is n(n^2 - 1)/12.
+        if n >= 3:
+            x_centred = np.arange(1, n + 1, dtype=np.float64) - (n + 1) / 2
+            degradation = float(np.dot(x_centred, times)) / (n * (n * n - 1) / 12)
         else:
             degradation = 0
 
@@ -175,7 +188,7 @@ class StrategyService:
             "driver_id": driver_id,
             "stint_number": stint_number,
             "compound": sorted_laps[0].compound.value if sorted_laps else None,
-            "total_laps": len(valid_laps),
+            "total_laps": n,
             "degradation_per_lap": degradation,
             "laps": lap_data,
         }
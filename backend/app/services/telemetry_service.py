@@ -1,5 +1,10 @@
 """Telemetry service - car telemetry analysis."""
 
+import asyncio
+from collections.abc import Iterator
+
+import numpy as np
+
 from app.domain.models import TelemetryFrame
 from app.repositories.interfaces import ITelemetryRepository
 
@@ -89,34 +94,58 @@ class TelemetryService:
         Returns:
             List of telemetry data for comparison
         """
-        results = []
-        for driver_id, lap_number in comparisons:
-            frame = await self.get_lap_telemetry(
-                session_id, driver_id, lap_number
-            )
-            if frame:
-                results.append({
-                    "driver_id": driver_id,
-                    "lap_number": lap_number,
-                    "lap_time_ms": frame.lap_time_ms,
-                    "max_speed": frame.max_speed,
-                    "point_count": frame.point_count,
-                    "telemetry": [
-                        {
-                            "distance": p.distance,
-                            "speed": p.speed,
-                            "throttle": p.throttle,
-                            "brake": p.brake,
-                            "gear": p.gear,
-                            "drs": p.drs_open,
-                            "x": p.x,
-                            "y": p.y,
-                            "z": p.z,
-                        }
-                        for p in frame.points
-                    ]
-                })
-        return results
+        frames = await self.get_compare_frames(session_id, comparisons)
+        return list(self.iter_compare_laps(frames))
+
+    async def get_compare_frames(
+        self,
+        session_id: str,
+        comparisons: list[tuple[str, int]]
+    ) -> list[tuple[str, int, TelemetryFrame]]:
+        """Load the requested laps' telemetry, skipping laps without any."""
+        # Fetch every requested lap concurrently
+        frames = await asyncio.gather(*(
+            self.get_lap_telemetry(session_id, driver_id, lap_number)
+            for driver_id, lap_number in comparisons
+        ))
+        return [
+            (driver_id, lap_number, frame)
+            for (driver_id, lap_number), frame in zip(comparisons, frames, strict=True)
+            if frame
+        ]
+
+    def iter_compare_laps(
+        self,
+        frames: list[tuple[str, int, TelemetryFrame]]
+    ) -> Iterator[dict]:
+        """
+        Yield compare_laps entries for loaded frames one lap at a time.
+
+        Each lap's telemetry is emitted column-wise from the frame's column
+        arrays (missing coordinates become null), so no per-point dicts are
+        built; orjson serializes the numpy arrays directly.
+        """
+        for driver_id, lap_number, frame in frames:
+            columns = frame.columns
+            yield {
+                "driver_id": driver_id,
+                "lap_number": lap_number,
+                "lap_time_ms": frame.lap_time_ms,
+                "max_speed": frame.max_speed,
+                "point_count": frame.point_count,
+                "telemetry": {
+                    "distance": columns.distance,
+                    "speed": columns.speed,
+                    "throttle": columns.throttle,
+                    "brake": columns.brake,
+                    "gear": columns.gear,
+                    # DRS values: 0-1 = off, 8+ = eligible, 10-14 = active
+                    "drs": columns.drs >= 10,
+                    "x": columns.x,
+                    "y": columns.y,
+                    "z": columns.z,
+                },
+            }
 
     async def get_speed_trace(
         self,
@@ -133,15 +162,23 @@ class TelemetryService:
         if not frame:
             return None
 
+        columns = frame.columns
         return [
             {
-                "distance": p.distance,
-                "speed": p.speed,
-                "gear": p.gear,
-                "throttle": p.throttle,
-                "brake": p.brake,
+                "distance": distance,
+                "speed": speed,
+                "gear": gear,
+                "throttle": throttle,
+                "brake": brake,
             }
-            for p in frame.points
+            for distance, speed, gear, throttle, brake in zip(
+                columns.distance.tolist(),
+                columns.speed.tolist(),
+                columns.gear.tolist(),
+                columns.throttle.tolist(),
+                columns.brake.tolist(),
+                strict=True,
+            )
         ]
 
     async def get_gear_changes(
@@ -159,17 +196,19 @@ class TelemetryService:
         if not frame or not frame.points:
             return None
 
-        changes = []
-        prev_gear = frame.points[0].gear
+        columns = frame.columns
+        gears = columns.gear.tolist()
+        distances = columns.distance.tolist()
+        speeds = columns.speed.tolist()
 
-        for point in frame.points[1:]:
-            if point.gear != prev_gear:
-                changes.append({
-                    "distance": point.distance,
-                    "from_gear": prev_gear,
-                    "to_gear": point.gear,
-                    "speed": point.speed,
-                })
-                prev_gear = point.gear
-
-        return changes
+        # Index of each point whose gear differs from the point before it
+        change_idx = np.flatnonzero(np.diff(columns.gear)) + 1
+        return [
+            {
+                "distance": distances[i],
+                "from_gear": gears[i - 1],
+                "to_gear": gears[i],
+                "speed": speeds[i],
+            }
+            for i in change_idx.tolist()
+        ]
@@ -7,71 +7,63 @@ import asyncio
 import sys
 from pathlib import Path
 
-import pandas as pd
-import numpy as np
 import fastf1
+import pandas as pd
 
 sys.path.insert(0, str(Path(__file__).parent))
 
 from app.services.prediction_service import RacePredictionService
 
+# Rounds backtested at once; each loads its own FP1-3 and race sessions
+MAX_CONCURRENT_ROUNDS = 2
+
 
 async def compare_backtests(service: RacePredictionService, year: int, rounds: list[int]):
     """Run backtests with and without boosters and compare."""
 
-    results_with_boosters = []
-    results_without_boosters = []
+    schedule = await asyncio.to_thread(fastf1.get_event_schedule, year)
+    event_names = schedule.set_index("RoundNumber")["EventName"]
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_ROUNDS)
 
-    for round_num in rounds:
-        try:
-            schedule = fastf1.get_event_schedule(year)
-            event_row = schedule[schedule["RoundNumber"] == round_num]
-            if event_row.empty:
-                continue
-            event_name = event_row["EventName"].iloc[0]
-
-            print(f"\n{year} R{round_num} - {event_name}")
-            print("-" * 50)
-
-            # Test WITH boosters
-            service._use_boosters = True
-            result_with = await service.backtest(year, round_num)
-            metrics_with = result_with["metrics"]
-
-            # Test WITHOUT boosters
-            service._use_boosters = False
-            result_without = await service.backtest(year, round_num)
-            metrics_without = result_without["metrics"]
-
-            print(f"  With Boosters:    MAE={metrics_with['mae']:.2f}, "
-                  f"≤3pos={metrics_with['within_3_positions']:.0f}%, "
-                  f"Winner={'✓' if metrics_with['winner_correct'] else '✗'}")
-            print(f"  Without Boosters: MAE={metrics_without['mae']:.2f}, "
-                  f"≤3pos={metrics_without['within_3_positions']:.0f}%, "
-                  f"Winner={'✓' if metrics_without['winner_correct'] else '✗'}")
-
-            improvement = metrics_without['mae'] - metrics_with['mae']
-            print(f"  MAE Improvement: {improvement:+.2f} positions")
-
-            results_with_boosters.append({
-                "year": year,
-                "round": round_num,
-                "event": event_name,
-                **metrics_with
-            })
-            results_without_boosters.append({
-                "year": year,
-                "round": round_num,
-                "event": event_name,
-                **metrics_without
-            })
+    async def one_round(round_num: int) -> tuple[dict, dict] | None:
+        if round_num not in event_names.index:
+            return None
+        event_name = event_names.at[round_num]
 
+        header = f"\n{year} R{round_num} - {event_name}\n" + "-" * 50
+        try:
+            async with semaphore:
+                # Test WITH and WITHOUT boosters from one set of predictions
+                result_with, result_without = await service.backtest_boosters(
+                    year, round_num
+                )
         except Exception as e:
-            print(f"  Error: {e}")
-            continue
+            print(f"{header}\n  Error: {e}")
+            return None
+
+        metrics_with = result_with["metrics"]
+        metrics_without = result_without["metrics"]
+        improvement = metrics_without['mae'] - metrics_with['mae']
+
+        # Print each round as one block so concurrent rounds don't interleave
+        print(
+            f"{header}\n"
+            f"  With Boosters:    MAE={metrics_with['mae']:.2f}, "
+            f"≤3pos={metrics_with['within_3_positions']:.0f}%, "
+            f"Winner={'✓' if metrics_with['winner_correct'] else '✗'}\n"
+            f"  Without Boosters: MAE={metrics_without['mae']:.2f}, "
+            f"≤3pos={metrics_without['within_3_positions']:.0f}%, "
+            f"Winner={'✓' if metrics_without['winner_correct'] else '✗'}\n"
+            f"  MAE Improvement: {improvement:+.2f} positions"
+        )
+
+        event_info = {"year": year, "round": round_num, "event": event_name}
+        return {**event_info, **metrics_with}, {**event_info, **metrics_without}
+
+    round_results = await asyncio.gather(*(one_round(r) for r in rounds))
 
-    # Re-enable boosters
-    service._use_boosters = True
+    results_with_boosters = [r[0] for r in round_results if r is not None]
+    results_without_boosters = [r[1] for r in round_results if r is not None]
 
     return results_with_boosters, results_without_boosters
 
@@ -107,7 +99,7 @@ async def main():
     df_with = pd.DataFrame(results_with)
     df_without = pd.DataFrame(results_without)
 
-    print(f"\nWith Boosters:")
+    print("\nWith Boosters:")
     print(f"  Average MAE: {df_with['mae'].mean():.2f}")
     print(f"  Avg ≤1 position: {df_with['within_1_position'].mean():.1f}%")
     print(f"  Avg ≤3 positions: {df_with['within_3_positions'].mean():.1f}%")
@@ -115,7 +107,7 @@ async def main():
     print(f"  Winners correct: {df_with['winner_correct'].sum()}/{len(df_with)}")
     print(f"  Avg podium correct: {df_with['podium_correct'].mean():.1f}/3")
 
-    print(f"\nWithout Boosters:")
+    print("\nWithout Boosters:")
     print(f"  Average MAE: {df_without['mae'].mean():.2f}")
     print(f"  Avg ≤1 position: {df_without['within_1_position'].mean():.1f}%")
     print(f"  Avg ≤3 positions: {df_without['within_3_positions'].mean():.1f}%")
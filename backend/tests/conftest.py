@@ -1,35 +1,33 @@
 """Pytest configuration and fixtures."""
 
-import asyncio
 import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import AsyncGenerator, Generator
 
 import pytest
-from fastapi.testclient import TestClient
 from httpx import AsyncClient, ASGITransport
 
 from app.config import Settings
 from app.main import create_app
 from app.domain.enums import SessionType, TireCompound, TrackStatus
-from app.domain.models import Driver, Lap, Session, TireStint
+from app.domain.models import (
+    Driver,
+    Lap,
+    Session,
+    TelemetryFrame,
+    TelemetryPoint,
+    TireStint,
+)
 from app.repositories.file import (
     FileSessionRepository,
     FileLapRepository,
     FileDriverRepository,
     FileStintRepository,
+    FileTelemetryRepository,
 )
 
 
-@pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
-    """Create event loop for async tests."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
 @pytest.fixture
 def temp_data_dir() -> Generator[Path, None, None]:
     """Create a temporary data directory for tests."""
@@ -37,18 +35,24 @@ def temp_data_dir() -> Generator[Path, None, None]:
         yield Path(tmpdir)
 
 
-@pytest.fixture
-def test_settings(temp_data_dir: Path) -> Settings:
+@pytest.fixture(scope="session")
+def api_data_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create the data directory shared by the API tests."""
+    return tmp_path_factory.mktemp("api_data")
+
+
+@pytest.fixture(scope="session")
+def test_settings(api_data_dir: Path) -> Settings:
     """Create test settings with temporary directories."""
     return Settings(
         debug=True,
-        data_dir=temp_data_dir,
-        fastf1_cache_dir=temp_data_dir / "cache",
+        data_dir=api_data_dir,
+        fastf1_cache_dir=api_data_dir / "cache",
         storage_backend="file",
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def app(test_settings: Settings):
     """Create test FastAPI application."""
     from app.config import get_settings
@@ -62,26 +66,26 @@ def app(test_settings: Settings):
     return application
 
 
-@pytest.fixture
-def client(app) -> Generator[TestClient, None, None]:
-    """Create test client."""
-    with TestClient(app) as c:
-        yield c
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def async_client(app) -> AsyncGenerator[AsyncClient, None]:
-    """Create async test client."""
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test"
-    ) as ac:
+    """Create async test client, shared across the test session."""
+    # ASGITransport doesn't run the lifespan itself
+    async with (
+        app.router.lifespan_context(app),
+        AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://testserver"
+        ) as ac,
+    ):
         yield ac
 
 
 # Sample Data Fixtures
+#
+# Domain models are frozen, so one instance of each serves the whole run;
+# tests must not mutate the sample lists either.
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_session() -> Session:
     """Create a sample session for testing."""
     return Session(
@@ -99,7 +103,7 @@ def sample_session() -> Session:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_driver() -> Driver:
     """Create a sample driver for testing."""
     return Driver(
@@ -115,7 +119,7 @@ def sample_driver() -> Driver:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_laps(sample_session: Session) -> list[Lap]:
     """Create sample laps for testing."""
     laps = []
@@ -148,7 +152,7 @@ def sample_laps(sample_session: Session) -> list[Lap]:
     return laps
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_stint() -> TireStint:
     """Create a sample stint for testing."""
     return TireStint(
@@ -165,6 +169,33 @@ def sample_stint() -> TireStint:
     )
 
 
+@pytest.fixture(scope="session")
+def sample_telemetry() -> TelemetryFrame:
+    """Create a sample telemetry frame for testing."""
+    return TelemetryFrame(
+        session_id="2024_01_R",
+        driver_id="VER",
+        lap_number=1,
+        lap_time_ms=92_100,
+        points=[
+            TelemetryPoint(
+                time_ms=i * 250,
+                distance=i * 20.0,
+                speed=200.0 + i,
+                rpm=11000 + i * 10,
+                gear=6 + i % 2,
+                throttle=100.0 if i % 3 else 40.0,
+                brake=i % 3 == 0,
+                drs=12 if i > 5 else 0,
+                x=float(i),
+                y=float(-i),
+                z=None,
+            )
+            for i in range(10)
+        ],
+    )
+
+
 # Repository Fixtures
 
 @pytest.fixture
@@ -189,3 +220,9 @@ def driver_repo(temp_data_dir: Path) -> FileDriverRepository:
 def stint_repo(temp_data_dir: Path) -> FileStintRepository:
     """Create stint repository for testing."""
     return FileStintRepository(temp_data_dir)
+
+
+@pytest.fixture
+def telemetry_repo(temp_data_dir: Path) -> FileTelemetryRepository:
+    """Create telemetry repository for testing."""
+    return FileTelemetryRepository(temp_data_dir)
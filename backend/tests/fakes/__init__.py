@@ -0,0 +1,17 @@
+"""In-memory repository fakes.
+
+Dict-backed implementations of the repository interfaces, used by the
+service tests alongside the file repositories.
+"""
+
+from tests.fakes.driver_repo import MemoryDriverRepository
+from tests.fakes.lap_repo import MemoryLapRepository
+from tests.fakes.session_repo import MemorySessionRepository
+from tests.fakes.stint_repo import MemoryStintRepository
+
+__all__ = [
+    "MemoryDriverRepository",
+    "MemoryLapRepository",
+    "MemorySessionRepository",
+    "MemoryStintRepository",
+]
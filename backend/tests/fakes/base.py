@@ -0,0 +1,54 @@
+"""Base in-memory repository implementation."""
+
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class MemoryRepository(Generic[T]):
+    """
+    Base class for in-memory repository implementations.
+
+    Entities are kept in a dict keyed by ID, in insertion order. Models
+    are frozen, so the stored instances are returned directly.
+    """
+
+    def __init__(self) -> None:
+        self._by_id: dict[str, T] = {}
+
+    async def get_by_id(self, entity_id: str) -> T | None:
+        """Get an entity by ID."""
+        return self._by_id.get(entity_id)
+
+    async def get_all(self) -> list[T]:
+        """Get all entities."""
+        return list(self._by_id.values())
+
+    async def add(self, entity: T) -> T:
+        """Add an entity."""
+        self._by_id[entity.id] = entity
+        return entity
+
+    async def add_many(self, entities: list[T]) -> list[T]:
+        """Add multiple entities."""
+        for entity in entities:
+            await self.add(entity)
+        return entities
+
+    async def update(self, entity: T) -> T:
+        """Update an entity (same as add)."""
+        return await self.add(entity)
+
+    async def delete(self, entity_id: str) -> bool:
+        """Delete an entity."""
+        return self._by_id.pop(entity_id, None) is not None
+
+    async def exists(self, entity_id: str) -> bool:
+        """Check if an entity exists."""
+        return entity_id in self._by_id
+
+    async def count(self) -> int:
+        """Count all entities."""
+        return len(self._by_id)
@@ -0,0 +1,70 @@
+"""In-memory driver repository implementation."""
+
+from app.domain.models import Driver
+from app.repositories.interfaces import IDriverRepository
+from tests.fakes.base import MemoryRepository
+
+
+class MemoryDriverRepository(MemoryRepository[Driver], IDriverRepository):
+    """In-memory implementation of driver repository."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._session_drivers: dict[str, list[str]] = {}
+        self._year_drivers: dict[int, list[str]] = {}
+
+    def _lookup(self, driver_ids: list[str]) -> list[Driver]:
+        """Known drivers among driver_ids, sorted by car number."""
+        drivers = [self._by_id[d] for d in driver_ids if d in self._by_id]
+        return sorted(drivers, key=lambda d: d.number)
+
+    async def get_by_session(self, session_id: str) -> list[Driver]:
+        """Get all drivers who participated in a session."""
+        return self._lookup(self._session_drivers.get(session_id, []))
+
+    async def add_session_drivers(
+        self, session_id: str, driver_ids: list[str]
+    ) -> None:
+        """Associate drivers with a session."""
+        self._session_drivers[session_id] = list(driver_ids)
+
+    async def get_by_team(self, team_id: str) -> list[Driver]:
+        """Get all drivers for a team."""
+        drivers = [d for d in self._by_id.values() if d.team_id == team_id]
+        return sorted(drivers, key=lambda d: d.number)
+
+    async def get_by_year(self, year: int) -> list[Driver]:
+        """Get all drivers who participated in a season."""
+        driver_ids = self._year_drivers.get(year)
+        if not driver_ids:
+            # Same fallback as the file repository: every driver
+            return await self.get_all()
+        return self._lookup(driver_ids)
+
+    async def add_year_drivers(self, year: int, driver_ids: list[str]) -> None:
+        """Associate drivers with a year."""
+        existing = self._year_drivers.setdefault(year, [])
+        existing.extend(d for d in dict.fromkeys(driver_ids) if d not in existing)
+
+    async def get_by_number(self, number: int) -> Driver | None:
+        """Get a driver by their car number."""
+        # Later additions win, as in the file repository
+        match = None
+        for driver in self._by_id.values():
+            if driver.number == number:
+                match = driver
+        return match
+
+    async def search(self, query: str) -> list[Driver]:
+        """Search drivers by name or abbreviation."""
+        query = query.lower()
+        return [
+            driver for driver in self._by_id.values()
+            if any(
+                query in text.lower()
+                for text in (
+                    driver.id, driver.full_name,
+                    driver.first_name, driver.last_name,
+                )
+            )
+        ]
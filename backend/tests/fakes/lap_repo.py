@@ -0,0 +1,75 @@
+"""In-memory lap repository implementation."""
+
+import heapq
+from operator import attrgetter
+
+from app.domain.enums import TireCompound
+from app.domain.models import Lap
+from app.repositories.interfaces import ILapRepository
+from tests.fakes.base import MemoryRepository
+
+
+class MemoryLapRepository(MemoryRepository[Lap], ILapRepository):
+    """
+    In-memory implementation of lap repository.
+
+    Queries return laps in (driver_id, lap_number) order, like the file
+    repository.
+    """
+
+    def _select(self, session_id: str, predicate=None) -> list[Lap]:
+        """A session's laps matching predicate, in (driver, lap) order."""
+        laps = [
+            lap for lap in self._by_id.values()
+            if lap.session_id == session_id
+            and (predicate is None or predicate(lap))
+        ]
+        return sorted(laps, key=lambda lap: (lap.driver_id, lap.lap_number))
+
+    async def get_by_session(self, session_id: str) -> list[Lap]:
+        """Get all laps for a session."""
+        return self._select(session_id)
+
+    async def get_by_session_and_driver(
+        self, session_id: str, driver_id: str
+    ) -> list[Lap]:
+        """Get all laps for a driver in a session."""
+        return self._select(session_id, lambda lap: lap.driver_id == driver_id)
+
+    async def get_by_compound(
+        self, session_id: str, compound: TireCompound
+    ) -> list[Lap]:
+        """Get all laps on a specific compound."""
+        return self._select(session_id, lambda lap: lap.compound == compound)
+
+    async def get_fastest_laps(
+        self, session_id: str, top_n: int = 10
+    ) -> list[Lap]:
+        """Get fastest laps in a session."""
+        if top_n <= 0:
+            return []
+        valid = await self.get_valid_laps(session_id)
+        # Partial selection; ties keep (driver, lap) order as in the file repo
+        return heapq.nsmallest(top_n, valid, key=attrgetter("lap_time"))
+
+    async def get_valid_laps(self, session_id: str) -> list[Lap]:
+        """Get all valid laps for analysis."""
+        return self._select(session_id, lambda lap: lap.is_valid_for_analysis)
+
+    async def get_personal_bests(self, session_id: str) -> list[Lap]:
+        """Get personal best lap for each driver."""
+        bests: dict[str, Lap] = {}
+        for lap in await self.get_valid_laps(session_id):
+            best = bests.get(lap.driver_id)
+            if best is None or lap.lap_time < best.lap_time:
+                bests[lap.driver_id] = lap
+        return sorted(bests.values(), key=lambda lap: lap.lap_time)
+
+    async def get_by_stint(
+        self, session_id: str, driver_id: str, stint_number: int
+    ) -> list[Lap]:
+        """Get all laps in a specific stint."""
+        return self._select(
+            session_id,
+            lambda lap: lap.driver_id == driver_id and lap.stint == stint_number,
+        )
@@ -0,0 +1,62 @@
+"""In-memory session repository implementation."""
+
+from app.domain.enums import SessionType
+from app.domain.models import Session
+from app.repositories.interfaces import ISessionRepository
+from tests.fakes.base import MemoryRepository
+
+
+class MemorySessionRepository(MemoryRepository[Session], ISessionRepository):
+    """In-memory implementation of session repository."""
+
+    async def get_by_year(self, year: int) -> list[Session]:
+        """Get all sessions for a year."""
+        sessions = [s for s in self._by_id.values() if s.year == year]
+        return sorted(sessions, key=lambda s: (s.round_number, s.session_type.value))
+
+    async def get_by_event(self, year: int, round_number: int) -> list[Session]:
+        """Get all sessions for a specific event."""
+        sessions = [
+            s for s in self._by_id.values()
+            if s.year == year and s.round_number == round_number
+        ]
+        return sorted(sessions, key=lambda s: s.session_type.order)
+
+    async def get_by_type(
+        self, year: int, session_type: SessionType
+    ) -> list[Session]:
+        """Get all sessions of a specific type in a year."""
+        sessions = [
+            s for s in self._by_id.values()
+            if s.year == year and s.session_type == session_type
+        ]
+        return sorted(sessions, key=lambda s: s.round_number)
+
+    async def get_latest(self, limit: int = 10) -> list[Session]:
+        """Get the most recent sessions."""
+        return sorted(
+            self._by_id.values(), key=lambda s: s.session_date, reverse=True
+        )[:limit]
+
+    async def get_years(self) -> list[int]:
+        """Get list of available years."""
+        return sorted({s.year for s in self._by_id.values()}, reverse=True)
+
+    async def get_events_for_year(self, year: int) -> list[dict]:
+        """Get list of events for a year with basic info."""
+        events: dict[int, dict] = {}
+        for session in await self.get_by_year(year):
+            if session.round_number not in events:
+                events[session.round_number] = {
+                    "round_number": session.round_number,
+                    "event_name": session.event_name,
+                    "country": session.country,
+                    "location": session.location,
+                    "circuit_name": session.circuit_name,
+                    "session_types": [],
+                }
+            events[session.round_number]["session_types"].append(
+                session.session_type.value
+            )
+
+        return sorted(events.values(), key=lambda e: e["round_number"])
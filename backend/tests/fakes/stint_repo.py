@@ -0,0 +1,88 @@
+"""In-memory stint repository implementation."""
+
+from collections import defaultdict
+
+from app.domain.enums import TireCompound
+from app.domain.models import TireStint
+from app.repositories.interfaces import IStintRepository
+from tests.fakes.base import MemoryRepository
+
+
+def _mean(values: list[float]) -> float | None:
+    return sum(values) / len(values) if values else None
+
+
+class MemoryStintRepository(MemoryRepository[TireStint], IStintRepository):
+    """In-memory implementation of stint repository."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._summaries: dict[str, list[dict]] = {}
+
+    async def add(self, entity: TireStint) -> TireStint:
+        """Add a stint, dropping its session's stored summary."""
+        self._summaries.pop(entity.session_id, None)
+        return await super().add(entity)
+
+    async def delete(self, entity_id: str) -> bool:
+        """Delete a stint, dropping its session's stored summary."""
+        stint = self._by_id.get(entity_id)
+        if stint is not None:
+            self._summaries.pop(stint.session_id, None)
+        return await super().delete(entity_id)
+
+    async def get_by_session(self, session_id: str) -> list[TireStint]:
+        """Get all stints for a session."""
+        stints = [s for s in self._by_id.values() if s.session_id == session_id]
+        return sorted(stints, key=lambda s: (s.driver_id, s.stint_number))
+
+    async def get_by_driver(
+        self, session_id: str, driver_id: str
+    ) -> list[TireStint]:
+        """Get all stints for a driver in a session."""
+        stints = [
+            s for s in self._by_id.values()
+            if s.session_id == session_id and s.driver_id == driver_id
+        ]
+        return sorted(stints, key=lambda s: s.stint_number)
+
+    async def get_by_compound(
+        self, session_id: str, compound: TireCompound
+    ) -> list[TireStint]:
+        """Get all stints on a specific compound."""
+        stints = [
+            s for s in self._by_id.values()
+            if s.session_id == session_id and s.compound == compound
+        ]
+        return sorted(stints, key=lambda s: (s.driver_id, s.stint_number))
+
+    async def aggregate_by_compound(self, session_id: str) -> dict[str, dict]:
+        """Aggregate a session's stints per compound."""
+        by_compound: defaultdict[str, list[TireStint]] = defaultdict(list)
+        for stint in self._by_id.values():
+            if stint.session_id == session_id:
+                by_compound[stint.compound.value].append(stint)
+
+        return {
+            compound: {
+                "stint_count": len(stints),
+                "total_laps": sum(s.total_laps for s in stints),
+                "avg_lap_time": _mean([
+                    s.avg_lap_time_seconds for s in stints
+                    if s.avg_lap_time_seconds is not None
+                ]),
+                "avg_degradation": _mean([
+                    s.degradation_rate for s in stints
+                    if s.degradation_rate is not None
+                ]),
+            }
+            for compound, stints in by_compound.items()
+        }
+
+    async def get_summary(self, session_id: str) -> list[dict] | None:
+        """Get the stored strategy summary for a session."""
+        return self._summaries.get(session_id)
+
+    async def save_summary(self, session_id: str, summaries: list[dict]) -> None:
+        """Store a precomputed strategy summary for a session."""
+        self._summaries[session_id] = summaries
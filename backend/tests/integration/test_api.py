@@ -6,16 +6,18 @@ import pytest
 class TestHealthEndpoint:
     """Tests for health check endpoint."""
 
-    def test_health_check(self, client):
-        response = client.get("/health")
+    @pytest.mark.asyncio
+    async def test_health_check(self, async_client):
+        response = await async_client.get("/health")
         assert response.status_code == 200
 
         data = response.json()
         assert data["status"] == "healthy"
         assert "version" in data
 
-    def test_root_endpoint(self, client):
-        response = client.get("/")
+    @pytest.mark.asyncio
+    async def test_root_endpoint(self, async_client):
+        response = await async_client.get("/")
         assert response.status_code == 200
 
         data = response.json()
@@ -26,40 +28,46 @@ class TestHealthEndpoint:
 class TestSessionsAPI:
     """Tests for sessions API endpoints."""
 
-    def test_list_sessions_empty(self, client):
-        response = client.get("/api/v1/sessions")
+    @pytest.mark.asyncio
+    async def test_list_sessions_empty(self, async_client):
+        response = await async_client.get("/api/v1/sessions")
         assert response.status_code == 200
 
         data = response.json()
         assert data["count"] == 0
         assert data["sessions"] == []
 
-    def test_list_years_empty(self, client):
-        response = client.get("/api/v1/sessions/years")
+    @pytest.mark.asyncio
+    async def test_list_years_empty(self, async_client):
+        response = await async_client.get("/api/v1/sessions/years")
         assert response.status_code == 200
 
         data = response.json()
         assert "years" in data
 
-    def test_get_session_not_found(self, client):
-        response = client.get("/api/v1/sessions/id/nonexistent")
+    @pytest.mark.asyncio
+    async def test_get_session_not_found(self, async_client):
+        response = await async_client.get("/api/v1/sessions/id/nonexistent")
         assert response.status_code == 404
 
-    def test_get_event_sessions_not_found(self, client):
-        response = client.get("/api/v1/sessions/2024/1")
+    @pytest.mark.asyncio
+    async def test_get_event_sessions_not_found(self, async_client):
+        response = await async_client.get("/api/v1/sessions/2024/1")
         assert response.status_code == 404
 
 
 class TestLapsAPI:
     """Tests for laps API endpoints."""
 
-    def test_get_laps_session_not_found(self, client):
-        response = client.get("/api/v1/laps/nonexistent")
+    @pytest.mark.asyncio
+    async def test_get_laps_session_not_found(self, async_client):
+        response = await async_client.get("/api/v1/laps/nonexistent")
         assert response.status_code == 404
 
-    def test_get_fastest_laps_empty(self, client):
+    @pytest.mark.asyncio
+    async def test_get_fastest_laps_empty(self, async_client):
         # This will return empty since session doesn't exist
-        response = client.get("/api/v1/laps/2024_01_R/fastest")
+        response = await async_client.get("/api/v1/laps/2024_01_R/fastest")
         # The endpoint returns empty list, not 404
         assert response.status_code == 200
         data = response.json()
@@ -69,15 +77,17 @@ class TestLapsAPI:
 class TestStrategyAPI:
     """Tests for strategy API endpoints."""
 
-    def test_get_stints_empty(self, client):
-        response = client.get("/api/v1/strategy/2024_01_R/stints")
+    @pytest.mark.asyncio
+    async def test_get_stints_empty(self, async_client):
+        response = await async_client.get("/api/v1/strategy/2024_01_R/stints")
         assert response.status_code == 200
 
         data = response.json()
         assert data["count"] == 0
 
-    def test_get_strategy_summary_empty(self, client):
-        response = client.get("/api/v1/strategy/2024_01_R/summary")
+    @pytest.mark.asyncio
+    async def test_get_strategy_summary_empty(self, async_client):
+        response = await async_client.get("/api/v1/strategy/2024_01_R/summary")
         assert response.status_code == 200
 
         data = response.json()
@@ -87,8 +97,9 @@ class TestStrategyAPI:
 class TestIngestionAPI:
     """Tests for ingestion API endpoints."""
 
-    def test_check_ingestion_status(self, client):
-        response = client.get("/api/v1/ingest/status/2024/1/R")
+    @pytest.mark.asyncio
+    async def test_check_ingestion_status(self, async_client):
+        response = await async_client.get("/api/v1/ingest/status/2024/1/R")
         assert response.status_code == 200
 
         data = response.json()
@@ -5,7 +5,7 @@ from datetime import datetime, timedelta
 import pytest
 
 from app.domain.enums import SessionType, TireCompound, TrackStatus
-from app.domain.models import Driver, Lap, Session, TireStint
+from app.domain.models import Driver, Lap, Session, TelemetryFrame, TireStint
 from app.domain.models.lap import timedelta_to_lap_string
 
 
@@ -45,6 +45,11 @@ class TestSessionType:
         assert SessionType.RACE.display_name == "Race"
         assert SessionType.QUALIFYING.display_name == "Qualifying"
 
+    def test_order(self):
+        assert SessionType.PRACTICE_1.order < SessionType.QUALIFYING.order
+        assert SessionType.SPRINT.order < SessionType.QUALIFYING.order
+        assert SessionType.QUALIFYING.order < SessionType.RACE.order
+
     def test_is_race(self):
         assert SessionType.RACE.is_race is True
         assert SessionType.SPRINT.is_race is True
@@ -112,6 +117,12 @@ class TestLap:
         )
         assert lap.lap_time_seconds is None
 
+    def test_lap_time_seconds_follows_model_copy(self, sample_laps):
+        lap = sample_laps[0]
+        assert lap.lap_time_seconds is not None
+        copy = lap.model_copy(update={"lap_time": timedelta(seconds=90)})
+        assert copy.lap_time_seconds == 90.0
+
     def test_is_valid_for_analysis(self, sample_laps):
         # Regular lap should be valid
         assert sample_laps[0].is_valid_for_analysis is True
@@ -143,6 +154,10 @@ class TestTimedeltaFormatting:
         td = timedelta(seconds=45, milliseconds=123)
         assert timedelta_to_lap_string(td) == "0:45.123"
 
+    def test_format_rounds_into_next_minute(self):
+        td = timedelta(seconds=59, microseconds=999_600)
+        assert timedelta_to_lap_string(td) == "1:00.000"
+
 
 class TestTireStint:
     """Tests for TireStint model."""
@@ -158,6 +173,36 @@ class TestTireStint:
         assert stint_id == "2024_01_R_VER_stint_1"
 
 
+class TestTelemetryFrame:
+    """Tests for TelemetryFrame model."""
+
+    def test_columns(self, sample_telemetry):
+        columns = sample_telemetry.columns
+        assert columns.speed.tolist() == [p.speed for p in sample_telemetry.points]
+        assert columns.gear.tolist() == [p.gear for p in sample_telemetry.points]
+        assert not columns.distance.flags.writeable
+
+    def test_column_reductions(self, sample_telemetry):
+        assert sample_telemetry.max_speed == 209.0
+        assert sample_telemetry.track_length == 180.0
+        assert sample_telemetry.get_at_distance(47.0).distance == 40.0
+
+    def test_equality_ignores_cached_columns(self, sample_telemetry):
+        other = sample_telemetry.model_copy()
+        assert len(sample_telemetry.columns.speed) == sample_telemetry.point_count
+        assert sample_telemetry == TelemetryFrame(**sample_telemetry.model_dump())
+        assert sample_telemetry == other
+
+    def test_columns_follow_model_copy(self, sample_telemetry):
+        assert sample_telemetry.track_length == 180.0
+        shorter = sample_telemetry.model_copy(
+            update={"points": sample_telemetry.points[:5]}
+        )
+        assert len(shorter.columns.distance) == 5
+        assert shorter.track_length == shorter.points[-1].distance
+        assert sample_telemetry.track_length == 180.0
+
+
 class TestDriver:
     """Tests for Driver model."""
 
@@ -0,0 +1,22 @@
+"""Property-based tests for lap time formatting."""
+
+import re
+from datetime import timedelta
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from app.domain.models.lap import timedelta_to_lap_string
+
+LAP_STRING = re.compile(r"^(\d+):([0-5]\d)\.(\d{3})$")
+
+
+@settings(max_examples=50, deadline=None)
+@given(st.timedeltas(min_value=timedelta(0), max_value=timedelta(minutes=20)))
+def test_lap_string_round_trips_to_nearest_millisecond(td):
+    match = LAP_STRING.match(timedelta_to_lap_string(td))
+    assert match is not None
+
+    minutes, seconds, millis = map(int, match.groups())
+    formatted_ms = minutes * 60_000 + seconds * 1000 + millis
+    assert abs(formatted_ms - td / timedelta(milliseconds=1)) <= 0.5
@@ -1,48 +1,47 @@
 """Tests for repository implementations."""
 
+import asyncio
+import gzip
+import json
+from datetime import timedelta
+
 import pytest
 
 from app.domain.enums import TireCompound
-from app.domain.models import Session, Lap, Driver, TireStint
+from app.domain.models import Session, Lap, Driver, TelemetryFrame, TireStint
+from app.repositories.file import FileSessionRepository
+from app.repositories.file.lap_repo import MAX_CACHED_SESSION_ANALYTICS
+from app.repositories.request_cache import begin_request_cache, end_request_cache
 
 
 class TestFileSessionRepository:
     """Tests for FileSessionRepository."""
 
     @pytest.mark.asyncio
-    async def test_add_and_get(self, session_repo, sample_session):
-        # Add session
+    async def test_crud_round_trip(self, session_repo, sample_session):
+        # One repository walked through add/get/exists/count/delete, rather
+        # than a fresh temp directory per operation
+        assert await session_repo.get_by_id("nonexistent") is None
+        assert await session_repo.exists(sample_session.id) is False
+        assert await session_repo.count() == 0
+
         result = await session_repo.add(sample_session)
         assert result.id == sample_session.id
 
-        # Get session
         retrieved = await session_repo.get_by_id(sample_session.id)
         assert retrieved is not None
         assert retrieved.id == sample_session.id
         assert retrieved.year == sample_session.year
         assert retrieved.event_name == sample_session.event_name
-
-    @pytest.mark.asyncio
-    async def test_get_nonexistent(self, session_repo):
-        result = await session_repo.get_by_id("nonexistent")
-        assert result is None
-
-    @pytest.mark.asyncio
-    async def test_exists(self, session_repo, sample_session):
-        # Before adding
-        assert await session_repo.exists(sample_session.id) is False
-
-        # After adding
-        await session_repo.add(sample_session)
         assert await session_repo.exists(sample_session.id) is True
-
-    @pytest.mark.asyncio
-    async def test_get_by_year(self, session_repo, sample_session):
-        await session_repo.add(sample_session)
+        assert await session_repo.count() == 1
 
         sessions = await session_repo.get_by_year(2024)
-        assert len(sessions) == 1
-        assert sessions[0].id == sample_session.id
+        assert [s.id for s in sessions] == [sample_session.id]
+
+        assert await session_repo.delete(sample_session.id) is True
+        assert await session_repo.exists(sample_session.id) is False
+        assert await session_repo.count() == 0
 
     @pytest.mark.asyncio
     async def test_get_by_year_empty(self, session_repo):
@@ -50,22 +49,24 @@ class TestFileSessionRepository:
         assert len(sessions) == 0
 
     @pytest.mark.asyncio
-    async def test_delete(self, session_repo, sample_session):
+    async def test_update_invalidates_cache(self, session_repo, sample_session):
         await session_repo.add(sample_session)
+        assert await session_repo.get_by_id(sample_session.id) is not None
 
-        # Delete
-        result = await session_repo.delete(sample_session.id)
-        assert result is True
+        renamed = sample_session.model_copy(update={"event_name": "Renamed GP"})
+        await session_repo.update(renamed)
 
-        # Verify deleted
-        assert await session_repo.exists(sample_session.id) is False
+        retrieved = await session_repo.get_by_id(sample_session.id)
+        assert retrieved.event_name == "Renamed GP"
 
     @pytest.mark.asyncio
-    async def test_count(self, session_repo, sample_session):
-        assert await session_repo.count() == 0
-
+    async def test_preloads_existing_data(self, temp_data_dir, session_repo, sample_session):
         await session_repo.add(sample_session)
-        assert await session_repo.count() == 1
+
+        fresh_repo = FileSessionRepository(temp_data_dir)
+        sessions = await fresh_repo.get_by_event(2024, 1)
+        assert [s.id for s in sessions] == [sample_session.id]
+        assert await fresh_repo.count() == 1
 
 
 class TestFileLapRepository:
@@ -92,6 +93,15 @@ class TestFileLapRepository:
         count = await lap_repo.count()
         assert count == len(sample_laps)
 
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_of_one_lap(self, lap_repo, sample_laps):
+        lap = sample_laps[0]
+        await lap_repo.add_many([lap] * 8)
+        await asyncio.gather(*(lap_repo.add(lap) for _ in range(8)))
+
+        assert await lap_repo.count() == 1
+        assert (await lap_repo.get_by_id(lap.id)).lap_number == lap.lap_number
+
     @pytest.mark.asyncio
     async def test_get_by_session(self, lap_repo, sample_laps):
         await lap_repo.add_many(sample_laps)
@@ -99,6 +109,15 @@ class TestFileLapRepository:
         laps = await lap_repo.get_by_session(sample_laps[0].session_id)
         assert len(laps) == len(sample_laps)
 
+    @pytest.mark.asyncio
+    async def test_get_by_session_skips_missing(self, lap_repo, sample_laps):
+        await lap_repo.add_many(sample_laps)
+        await lap_repo.delete(sample_laps[0].id)
+
+        laps = await lap_repo.get_by_session(sample_laps[0].session_id)
+        assert len(laps) == len(sample_laps) - 1
+        assert [lap.lap_number for lap in laps] == list(range(2, 11))
+
     @pytest.mark.asyncio
     async def test_get_by_session_and_driver(self, lap_repo, sample_laps):
         await lap_repo.add_many(sample_laps)
@@ -124,6 +143,14 @@ class TestFileLapRepository:
         )
         assert len(hard_laps) == 5
 
+    @pytest.mark.asyncio
+    async def test_get_by_stint(self, lap_repo, sample_laps):
+        await lap_repo.add_many(sample_laps)
+
+        # Sample laps 1-5 are stint 1, 6-10 stint 2
+        laps = await lap_repo.get_by_stint(sample_laps[0].session_id, "VER", 2)
+        assert [lap.lap_number for lap in laps] == [6, 7, 8, 9, 10]
+
     @pytest.mark.asyncio
     async def test_get_fastest_laps(self, lap_repo, sample_laps):
         await lap_repo.add_many(sample_laps)
@@ -135,6 +162,30 @@ class TestFileLapRepository:
         # Should be sorted by lap time
         assert fastest[0].lap_time <= fastest[1].lap_time <= fastest[2].lap_time
 
+    @pytest.mark.asyncio
+    async def test_get_fastest_laps_sees_new_laps(self, lap_repo, sample_laps):
+        session_id = sample_laps[0].session_id
+        await lap_repo.add_many(sample_laps[1:])
+        fastest = await lap_repo.get_fastest_laps(session_id, top_n=1)
+        assert fastest[0].lap_number == 2
+
+        await lap_repo.add(sample_laps[0])
+        fastest = await lap_repo.get_fastest_laps(session_id, top_n=1)
+        assert fastest[0].lap_number == 1
+        assert len(await lap_repo.get_valid_laps(session_id)) == len(sample_laps)
+
+    @pytest.mark.asyncio
+    async def test_session_analytics_cache_is_bounded(self, lap_repo, sample_laps):
+        lap = sample_laps[0]
+        session_ids = [f"2024_{round_number:02d}_R" for round_number in range(1, 11)]
+        for session_id in session_ids:
+            await lap_repo.add(lap.model_copy(update={
+                "id": Lap.create_id(session_id, "VER", 1), "session_id": session_id,
+            }))
+            assert len(await lap_repo.get_valid_laps(session_id)) == 1
+
+        assert list(lap_repo._analytics) == session_ids[-MAX_CACHED_SESSION_ANALYTICS:]
+
     @pytest.mark.asyncio
     async def test_get_valid_laps(self, lap_repo, sample_laps):
         await lap_repo.add_many(sample_laps)
@@ -150,6 +201,88 @@ class TestFileLapRepository:
         assert len(bests) == 1  # Only one driver
         assert bests[0].driver_id == "VER"
 
+    @pytest.mark.asyncio
+    async def test_laps_added_out_of_order_are_returned_sorted(self, lap_repo, sample_laps):
+        await lap_repo.add_many(sample_laps[5:])
+        await lap_repo.add_many(sample_laps[:5])
+
+        laps = await lap_repo.get_by_session(sample_laps[0].session_id)
+        assert [lap.lap_number for lap in laps] == list(range(1, 11))
+
+    @pytest.mark.asyncio
+    async def test_personal_best_index_tracks_faster_laps(self, lap_repo, sample_laps):
+        # Sample lap times increase with lap number, so lap 1 is fastest
+        await lap_repo.add_many(sample_laps[1:])
+        bests = await lap_repo.get_personal_bests(sample_laps[0].session_id)
+        assert bests[0].lap_number == 2
+
+        await lap_repo.add(sample_laps[0])
+        bests = await lap_repo.get_personal_bests(sample_laps[0].session_id)
+        assert [lap.lap_number for lap in bests] == [1]
+
+    @pytest.mark.asyncio
+    async def test_personal_best_index_follows_deleted_and_slower_laps(
+        self, lap_repo, sample_laps
+    ):
+        session_id = sample_laps[0].session_id
+        await lap_repo.add_many(sample_laps)
+
+        await lap_repo.delete(sample_laps[0].id)
+        bests = await lap_repo.get_personal_bests(session_id)
+        assert [lap.lap_number for lap in bests] == [2]
+
+        # Re-ingesting the PB lap with a corrected, slower time
+        slower = sample_laps[1].model_copy(
+            update={"lap_time": sample_laps[9].lap_time + timedelta(seconds=1)}
+        )
+        await lap_repo.add(slower)
+        bests = await lap_repo.get_personal_bests(session_id)
+        assert [lap.lap_number for lap in bests] == [3]
+
+    @pytest.mark.asyncio
+    async def test_request_cache_memoises_until_write(self, lap_repo, sample_laps):
+        session_id = sample_laps[0].session_id
+        await lap_repo.add_many(sample_laps[:5])
+
+        token = begin_request_cache()
+        try:
+            first, second = await asyncio.gather(
+                lap_repo.get_by_session(session_id),
+                lap_repo.get_by_session(session_id),
+            )
+            assert first == second and first is not second
+
+            await lap_repo.add_many(sample_laps[5:])
+            assert len(await lap_repo.get_by_session(session_id)) == 10
+        finally:
+            end_request_cache(token)
+
+    @pytest.mark.asyncio
+    async def test_reads_and_migrates_legacy_json_index(self, lap_repo, sample_laps):
+        await lap_repo.add_many(sample_laps[:2])
+        session_id = sample_laps[0].session_id
+
+        # Rewrite the session index in the old JSON-list format
+        index_path = lap_repo._index_path(f"session_{session_id}")
+        index_path.unlink()
+        lap_repo._legacy_index_path(f"session_{session_id}").write_text(
+            json.dumps([lap.id for lap in sample_laps[:2]])
+        )
+        assert len(await lap_repo.get_by_session(session_id)) == 2
+
+        await lap_repo.add(sample_laps[2])
+        assert index_path.exists()
+        assert not lap_repo._legacy_index_path(f"session_{session_id}").exists()
+        assert len(await lap_repo.get_by_session(session_id)) == 3
+
+    @pytest.mark.asyncio
+    async def test_readding_lap_does_not_duplicate(self, lap_repo, sample_laps):
+        await lap_repo.add(sample_laps[0])
+        await lap_repo.add(sample_laps[0])
+
+        laps = await lap_repo.get_by_session(sample_laps[0].session_id)
+        assert len(laps) == 1
+
 
 class TestFileDriverRepository:
     """Tests for FileDriverRepository."""
@@ -171,6 +304,29 @@ class TestFileDriverRepository:
         assert retrieved is not None
         assert retrieved.id == "VER"
 
+    @pytest.mark.asyncio
+    async def test_add_many_indexes_by_team(self, driver_repo, sample_driver):
+        teammate = sample_driver.model_copy(update={
+            "id": "PER", "number": 11, "full_name": "Sergio Perez",
+            "first_name": "Sergio", "last_name": "Perez",
+        })
+        await driver_repo.add_many([sample_driver, teammate])
+
+        team = await driver_repo.get_by_team("red_bull_racing")
+        assert [d.id for d in team] == ["VER", "PER"]
+        assert (await driver_repo.get_by_number(11)).id == "PER"
+
+    @pytest.mark.asyncio
+    async def test_add_year_drivers_is_idempotent(self, driver_repo, sample_driver):
+        await driver_repo.add(sample_driver)
+        await driver_repo.add_year_drivers(2024, ["VER"])
+        index_path = driver_repo._index_path("year_2024")
+        contents = index_path.read_bytes()
+
+        await driver_repo.add_year_drivers(2024, ["VER", "VER"])
+        assert index_path.read_bytes() == contents
+        assert [d.id for d in await driver_repo.get_by_year(2024)] == ["VER"]
+
     @pytest.mark.asyncio
     async def test_search(self, driver_repo, sample_driver):
         await driver_repo.add(sample_driver)
@@ -184,6 +340,18 @@ class TestFileDriverRepository:
         results = await driver_repo.search("VER")
         assert len(results) == 1
 
+    @pytest.mark.asyncio
+    async def test_search_sees_new_drivers(self, driver_repo, sample_driver):
+        await driver_repo.add(sample_driver)
+        assert await driver_repo.search("perez") == []
+
+        await driver_repo.add(sample_driver.model_copy(update={
+            "id": "PER", "number": 11, "full_name": "Sergio Perez",
+            "first_name": "Sergio", "last_name": "Perez",
+        }))
+        results = await driver_repo.search("perez")
+        assert [d.id for d in results] == ["PER"]
+
 
 class TestFileStintRepository:
     """Tests for FileStintRepository."""
@@ -214,6 +382,19 @@ class TestFileStintRepository:
         assert len(stints) == 1
         assert stints[0].driver_id == "VER"
 
+    @pytest.mark.asyncio
+    async def test_add_many(self, stint_repo, sample_stint):
+        second = sample_stint.model_copy(update={
+            "id": "2024_01_R_VER_stint_2", "stint_number": 2,
+            "compound": TireCompound.HARD, "start_lap": 21, "end_lap": 57,
+        })
+        await stint_repo.add_many([sample_stint, second])
+
+        stints = await stint_repo.get_by_driver("2024_01_R", "VER")
+        assert [s.stint_number for s in stints] == [1, 2]
+        hard = await stint_repo.get_by_compound("2024_01_R", TireCompound.HARD)
+        assert [s.id for s in hard] == [second.id]
+
     @pytest.mark.asyncio
     async def test_get_by_compound(self, stint_repo, sample_stint):
         await stint_repo.add(sample_stint)
@@ -222,3 +403,114 @@ class TestFileStintRepository:
             sample_stint.session_id, TireCompound.MEDIUM
         )
         assert len(stints) == 1
+
+    @pytest.mark.asyncio
+    async def test_aggregate_by_compound(self, stint_repo, sample_stint):
+        second = sample_stint.model_copy(update={
+            "id": "2024_01_R_VER_stint_2", "stint_number": 2,
+            "start_lap": 21, "end_lap": 30,
+            "avg_lap_time": None, "degradation_rate": 0.07,
+        })
+        await stint_repo.add_many([sample_stint, second])
+
+        totals = await stint_repo.aggregate_by_compound("2024_01_R")
+        assert totals == {
+            "MEDIUM": {
+                "stint_count": 2,
+                "total_laps": 30,
+                "avg_lap_time": pytest.approx(93.5),
+                "avg_degradation": pytest.approx(0.06),
+            }
+        }
+
+    @pytest.mark.asyncio
+    async def test_summary_dropped_when_stints_added(self, stint_repo, sample_stint):
+        await stint_repo.add(sample_stint)
+        assert await stint_repo.get_summary("2024_01_R") is None
+
+        await stint_repo.save_summary("2024_01_R", [{"driver_id": "VER"}])
+        assert await stint_repo.get_summary("2024_01_R") == [{"driver_id": "VER"}]
+
+        await stint_repo.add(sample_stint.model_copy(update={
+            "id": "2024_01_R_VER_stint_2", "stint_number": 2,
+        }))
+        assert await stint_repo.get_summary("2024_01_R") is None
+
+    @pytest.mark.asyncio
+    async def test_summary_dropped_when_stint_deleted(self, stint_repo, sample_stint):
+        await stint_repo.add(sample_stint)
+        await stint_repo.save_summary("2024_01_R", [{"driver_id": "VER"}])
+
+        assert await stint_repo.delete(sample_stint.id) is True
+        assert await stint_repo.get_summary("2024_01_R") is None
+
+
+class TestFileTelemetryRepository:
+    """Tests for FileTelemetryRepository."""
+
+    @pytest.mark.asyncio
+    async def test_add_and_get_by_lap(self, telemetry_repo, sample_telemetry):
+        await telemetry_repo.add(sample_telemetry)
+
+        retrieved = await telemetry_repo.get_by_lap("2024_01_R", "VER", 1)
+        assert retrieved is not None
+        assert retrieved.points == sample_telemetry.points
+        assert await telemetry_repo.get_available_laps("2024_01_R", "VER") == [1]
+
+    @pytest.mark.asyncio
+    async def test_reads_legacy_gzip_files(self, telemetry_repo, sample_telemetry):
+        frame_id = TelemetryFrame.create_id("2024_01_R", "VER", 1)
+        file_path = telemetry_repo._legacy_gzip_path(
+            telemetry_repo._get_file_path(frame_id)
+        )
+        file_path.parent.mkdir(parents=True)
+        with gzip.open(file_path, "wt", encoding="utf-8") as f:
+            json.dump(sample_telemetry.model_dump(mode="json"), f)
+
+        assert await telemetry_repo.exists(frame_id)
+        assert await telemetry_repo.count() == 1
+        retrieved = await telemetry_repo.get_by_id(frame_id)
+        assert retrieved.points == sample_telemetry.points
+
+    @pytest.mark.asyncio
+    async def test_get_fastest_lap_telemetry(self, telemetry_repo, sample_telemetry):
+        for lap_number, lap_time_ms in [(1, 92_500), (2, 91_800), (3, 93_000)]:
+            await telemetry_repo.add(sample_telemetry.model_copy(
+                update={"lap_number": lap_number, "lap_time_ms": lap_time_ms}
+            ))
+
+        fastest = await telemetry_repo.get_fastest_lap_telemetry("2024_01_R", "VER")
+        assert fastest.lap_number == 2
+
+    @pytest.mark.asyncio
+    async def test_fastest_lap_follows_reingested_lap_times(
+        self, telemetry_repo, sample_telemetry
+    ):
+        await telemetry_repo.add(sample_telemetry.model_copy(
+            update={"lap_number": 2, "lap_time_ms": 92_000}
+        ))
+        # Lap 1 re-ingested with times A -> B -> A
+        for lap_time_ms in [91_000, 93_000, 91_000]:
+            await telemetry_repo.add(sample_telemetry.model_copy(
+                update={"lap_number": 1, "lap_time_ms": lap_time_ms}
+            ))
+
+        fastest = await telemetry_repo.get_fastest_lap_telemetry("2024_01_R", "VER")
+        assert fastest.lap_number == 1
+
+    @pytest.mark.asyncio
+    async def test_count_is_maintained(self, telemetry_repo, sample_telemetry):
+        assert await telemetry_repo.count() == 0
+
+        await telemetry_repo.add(sample_telemetry)
+        await telemetry_repo.add(sample_telemetry)
+        assert await telemetry_repo.count() == 1
+
+        # Concurrent adds of one lap still count it once
+        lap_2 = sample_telemetry.model_copy(update={"lap_number": 2})
+        await asyncio.gather(*(telemetry_repo.add(lap_2) for _ in range(4)))
+        assert await telemetry_repo.count() == 2
+
+        frame_id = TelemetryFrame.create_id("2024_01_R", "VER", 1)
+        assert await telemetry_repo.delete(frame_id) is True
+        assert await telemetry_repo.count() == 1
@@ -4,96 +4,149 @@ import pytest
 
 from app.domain.enums import TireCompound
 from app.services import SessionService, LapService, StrategyService
+from app.repositories.file import (
+    FileLapRepository,
+    FileSessionRepository,
+    FileStintRepository,
+)
+from app.services.fuel_model import FuelModel
+from tests.fakes import (
+    MemoryLapRepository,
+    MemorySessionRepository,
+    MemoryStintRepository,
+)
+
+
+# Services only see the repository interfaces, so each test runs against
+# the in-memory fakes and the file repositories; the file run covers the
+# index-backed paths (personal bests, stored summaries) end to end.
+
+@pytest.fixture(params=["memory", "file"])
+def backend(request) -> str:
+    """Repository backend the service tests run against."""
+    return request.param
+
+
+@pytest.fixture
+def session_repo(backend, temp_data_dir):
+    """Create session repository for testing."""
+    if backend == "memory":
+        return MemorySessionRepository()
+    return FileSessionRepository(temp_data_dir)
+
+
+@pytest.fixture
+def lap_repo(backend, temp_data_dir):
+    """Create lap repository for testing."""
+    if backend == "memory":
+        return MemoryLapRepository()
+    return FileLapRepository(temp_data_dir)
+
+
+@pytest.fixture
+def stint_repo(backend, temp_data_dir):
+    """Create stint repository for testing."""
+    if backend == "memory":
+        return MemoryStintRepository()
+    return FileStintRepository(temp_data_dir)
+
+
+@pytest.fixture
+def session_service(session_repo) -> SessionService:
+    """Create session service for testing."""
+    return SessionService(session_repo)
+
+
+@pytest.fixture
+def lap_service(lap_repo) -> LapService:
+    """Create lap service for testing."""
+    return LapService(lap_repo)
+
+
+@pytest.fixture
+def strategy_service(stint_repo, lap_repo) -> StrategyService:
+    """Create strategy service for testing."""
+    return StrategyService(stint_repo, lap_repo)
 
 
 class TestSessionService:
     """Tests for SessionService."""
 
     @pytest.mark.asyncio
-    async def test_get_session(self, session_repo, sample_session):
-        service = SessionService(session_repo)
-
+    async def test_get_session(self, session_service, session_repo, sample_session):
         # Save session first
         await session_repo.add(sample_session)
 
         # Get via service
-        result = await service.get_session(sample_session.id)
+        result = await session_service.get_session(sample_session.id)
         assert result is not None
         assert result.id == sample_session.id
 
     @pytest.mark.asyncio
-    async def test_get_session_not_found(self, session_repo):
-        service = SessionService(session_repo)
-
-        result = await service.get_session("nonexistent")
+    async def test_get_session_not_found(self, session_service):
+        result = await session_service.get_session("nonexistent")
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_get_sessions_by_year(self, session_repo, sample_session):
-        service = SessionService(session_repo)
+    async def test_get_sessions_by_year(
+        self, session_service, session_repo, sample_session
+    ):
         await session_repo.add(sample_session)
 
-        sessions = await service.get_sessions_by_year(2024)
+        sessions = await session_service.get_sessions_by_year(2024)
         assert len(sessions) == 1
 
     @pytest.mark.asyncio
-    async def test_session_exists(self, session_repo, sample_session):
-        service = SessionService(session_repo)
-
-        assert await service.session_exists(sample_session.id) is False
+    async def test_session_exists(self, session_service, session_repo, sample_session):
+        assert await session_service.session_exists(sample_session.id) is False
 
         await session_repo.add(sample_session)
-        assert await service.session_exists(sample_session.id) is True
+        assert await session_service.session_exists(sample_session.id) is True
 
 
 class TestLapService:
     """Tests for LapService."""
 
     @pytest.mark.asyncio
-    async def test_get_session_laps(self, lap_repo, sample_laps):
-        service = LapService(lap_repo)
+    async def test_get_session_laps(self, lap_service, lap_repo, sample_laps):
         await lap_repo.add_many(sample_laps)
 
-        laps = await service.get_session_laps(sample_laps[0].session_id)
+        laps = await lap_service.get_session_laps(sample_laps[0].session_id)
         assert len(laps) == len(sample_laps)
 
     @pytest.mark.asyncio
-    async def test_get_driver_laps(self, lap_repo, sample_laps):
-        service = LapService(lap_repo)
+    async def test_get_driver_laps(self, lap_service, lap_repo, sample_laps):
         await lap_repo.add_many(sample_laps)
 
-        laps = await service.get_driver_laps(
+        laps = await lap_service.get_driver_laps(
             sample_laps[0].session_id, "VER"
         )
         assert len(laps) == len(sample_laps)
 
     @pytest.mark.asyncio
-    async def test_get_fastest_laps(self, lap_repo, sample_laps):
-        service = LapService(lap_repo)
+    async def test_get_fastest_laps(self, lap_service, lap_repo, sample_laps):
         await lap_repo.add_many(sample_laps)
 
-        laps = await service.get_fastest_laps(
+        laps = await lap_service.get_fastest_laps(
             sample_laps[0].session_id, top_n=5
         )
         assert len(laps) == 5
 
     @pytest.mark.asyncio
-    async def test_get_lap_time_distribution(self, lap_repo, sample_laps):
-        service = LapService(lap_repo)
+    async def test_get_lap_time_distribution(self, lap_service, lap_repo, sample_laps):
         await lap_repo.add_many(sample_laps)
 
-        distribution = await service.get_lap_time_distribution(
+        distribution = await lap_service.get_lap_time_distribution(
             sample_laps[0].session_id
         )
         assert "VER" in distribution
         assert len(distribution["VER"]) == len(sample_laps)
 
     @pytest.mark.asyncio
-    async def test_get_compound_performance(self, lap_repo, sample_laps):
-        service = LapService(lap_repo)
+    async def test_get_compound_performance(self, lap_service, lap_repo, sample_laps):
         await lap_repo.add_many(sample_laps)
 
-        performance = await service.get_compound_performance(
+        performance = await lap_service.get_compound_performance(
             sample_laps[0].session_id
         )
         assert "MEDIUM" in performance
@@ -101,13 +154,46 @@ class TestLapService:
         assert performance["MEDIUM"]["count"] == 5
         assert performance["HARD"]["count"] == 5
 
+        medium = performance["MEDIUM"]
+        assert medium["fastest"] == pytest.approx(92.1)
+        assert medium["slowest"] == pytest.approx(92.5)
+        assert medium["fastest_lap"]["lap_number"] == 1
+        # 0.33s/lap fuel effect over 10 laps; fresh laps are tyre_life 1-3
+        assert medium["fresh_tire_pace"] == pytest.approx(92.53)
+
+    @pytest.mark.asyncio
+    async def test_compound_performance_uses_fuel_model(self, lap_repo, sample_laps):
+        service = LapService(lap_repo, fuel_model=FuelModel(race_total_fuel_kg=0))
+        await lap_repo.add_many(sample_laps)
+
+        performance = await service.get_compound_performance(
+            sample_laps[0].session_id
+        )
+        medium = performance["MEDIUM"]
+        assert medium["average_fuel_corrected"] == pytest.approx(medium["average"])
+
+    @pytest.mark.asyncio
+    async def test_compound_performance_cached_until_invalidated(
+        self, lap_service, lap_repo, sample_laps
+    ):
+        session_id = sample_laps[0].session_id
+        await lap_repo.add_many(sample_laps[:5])
+
+        first = await lap_service.get_compound_performance(session_id)
+        assert "HARD" not in first
+
+        await lap_repo.add_many(sample_laps[5:])
+        assert await lap_service.get_compound_performance(session_id) == first
+
+        lap_service.invalidate(session_id)
+        assert "HARD" in await lap_service.get_compound_performance(session_id)
+
     @pytest.mark.asyncio
-    async def test_compare_drivers(self, lap_repo, sample_laps):
-        service = LapService(lap_repo)
+    async def test_compare_drivers(self, lap_service, lap_repo, sample_laps):
         await lap_repo.add_many(sample_laps)
 
         # Compare VER with a non-existent driver
-        comparison = await service.compare_drivers(
+        comparison = await lap_service.compare_drivers(
             sample_laps[0].session_id, "VER", "HAM"
         )
         assert "VER" in comparison
@@ -120,31 +206,105 @@ class TestStrategyService:
     """Tests for StrategyService."""
 
     @pytest.mark.asyncio
-    async def test_get_session_stints(self, stint_repo, lap_repo, sample_stint):
-        service = StrategyService(stint_repo, lap_repo)
+    async def test_get_session_stints(self, strategy_service, stint_repo, sample_stint):
         await stint_repo.add(sample_stint)
 
-        stints = await service.get_session_stints(sample_stint.session_id)
+        stints = await strategy_service.get_session_stints(sample_stint.session_id)
         assert len(stints) == 1
 
     @pytest.mark.asyncio
-    async def test_get_driver_stints(self, stint_repo, lap_repo, sample_stint):
-        service = StrategyService(stint_repo, lap_repo)
+    async def test_get_driver_stints(self, strategy_service, stint_repo, sample_stint):
         await stint_repo.add(sample_stint)
 
-        stints = await service.get_driver_stints(
+        stints = await strategy_service.get_driver_stints(
             sample_stint.session_id, "VER"
         )
         assert len(stints) == 1
         assert stints[0].driver_id == "VER"
 
     @pytest.mark.asyncio
-    async def test_get_strategy_summary(self, stint_repo, lap_repo, sample_stint):
-        service = StrategyService(stint_repo, lap_repo)
+    async def test_get_strategy_summary(
+        self, strategy_service, stint_repo, sample_stint
+    ):
         await stint_repo.add(sample_stint)
 
-        summaries = await service.get_strategy_summary(sample_stint.session_id)
+        summaries = await strategy_service.get_strategy_summary(sample_stint.session_id)
         assert len(summaries) == 1
         assert summaries[0]["driver_id"] == "VER"
         assert summaries[0]["total_stints"] == 1
         assert "MEDIUM" in summaries[0]["compounds"]
+
+    @pytest.mark.asyncio
+    async def test_strategy_summary_cached_until_stints_saved(
+        self, strategy_service, stint_repo, sample_stint
+    ):
+        await stint_repo.add(sample_stint)
+
+        first = await strategy_service.get_strategy_summary(sample_stint.session_id)
+        assert first[0]["total_stints"] == 1
+
+        second_stint = sample_stint.model_copy(update={
+            "id": "2024_01_R_VER_stint_2",
+            "stint_number": 2,
+            "compound": TireCompound.HARD,
+            "start_lap": 21,
+            "end_lap": 50,
+        })
+        await stint_repo.add(second_stint)
+        assert await strategy_service.get_strategy_summary(sample_stint.session_id) == first
+
+        strategy_service.invalidate(sample_stint.session_id)
+        summaries = await strategy_service.get_strategy_summary(sample_stint.session_id)
+        assert summaries[0]["compounds"] == ["MEDIUM", "HARD"]
+
+        # Saving through the service drops the cached summary itself
+        await strategy_service.save_stints([second_stint.model_copy(update={
+            "id": "2024_01_R_VER_stint_3",
+            "stint_number": 3,
+            "start_lap": 51,
+            "end_lap": 57,
+        })])
+        summaries = await strategy_service.get_strategy_summary(sample_stint.session_id)
+        assert summaries[0]["total_stints"] == 3
+
+    @pytest.mark.asyncio
+    async def test_saved_stints_store_summary(
+        self, strategy_service, stint_repo, lap_repo, sample_stint
+    ):
+        await strategy_service.save_stints([sample_stint])
+
+        stored = await stint_repo.get_summary(sample_stint.session_id)
+        assert stored == await strategy_service.get_strategy_summary(sample_stint.session_id)
+        assert stored[0]["compounds"] == ["MEDIUM"]
+
+        # A fresh service serves the stored summary without the cache
+        fresh = StrategyService(stint_repo, lap_repo)
+        assert await fresh.get_strategy_summary(sample_stint.session_id) == stored
+
+    @pytest.mark.asyncio
+    async def test_get_optimal_compound(
+        self, strategy_service, stint_repo, sample_stint
+    ):
+        await stint_repo.add(sample_stint)
+
+        analysis = await strategy_service.get_optimal_compound(sample_stint.session_id)
+        assert analysis["MEDIUM"] == {
+            "stint_count": 1,
+            "total_laps": 20,
+            "avg_lap_time": pytest.approx(93.5),
+            "avg_degradation": pytest.approx(0.05),
+        }
+
+    @pytest.mark.asyncio
+    async def test_calculate_stint_degradation(
+        self, strategy_service, lap_repo, sample_laps
+    ):
+        await lap_repo.add_many(sample_laps)
+
+        # Stint 1 laps get 0.1s slower every lap
+        result = await strategy_service.calculate_stint_degradation(
+            sample_laps[0].session_id, "VER", 1
+        )
+        assert result is not None
+        assert result["compound"] == "MEDIUM"
+        assert result["degradation_per_lap"] == pytest.approx(0.1)
@@ -1,5 +1,11 @@
 #!/usr/bin/env python3
-"""Script to train the race prediction model on historical data."""
+"""
+Script to train the race prediction model on historical data.
+
+FastF1 downloads are cached in the configured F1_FASTF1_CACHE_DIR (shared
+with ingestion), so only the first run fetches from the network; CI can
+keep that directory between runs to train from a warm cache.
+"""
 
 import asyncio
 import logging
@@ -24,15 +30,13 @@ async def main():
     service = RacePredictionService()
 
     # Check if we have training data already
-    data_path = service._model_dir / "training_data.csv"
-
-    if not data_path.exists():
+    if not service.has_training_data():
         logger.info("Collecting training data from 2022-2024...")
         logger.info("This will take a while as it downloads data from FastF1...")
         df = await service.collect_training_data(start_year=2022, end_year=2024)
         logger.info(f"Collected {len(df)} training samples")
     else:
-        logger.info(f"Using existing training data from {data_path}")
+        logger.info(f"Using existing training data from {service._model_dir}")
 
     # Train the model
     logger.info("Training model...")
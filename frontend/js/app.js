@@ -692,6 +692,25 @@ class F1DashApp {
         }
     }
 
+    /**
+     * Turn column-wise telemetry ({distance: [...], speed: [...], ...})
+     * into the per-point objects the charts consume.
+     */
+    columnsToPoints(columns) {
+        if (!columns) return [];
+        const keys = Object.keys(columns);
+        const length = keys.length ? columns[keys[0]].length : 0;
+        const points = new Array(length);
+        for (let i = 0; i < length; i++) {
+            const point = {};
+            for (const key of keys) {
+                point[key] = columns[key][i];
+            }
+            points[i] = point;
+        }
+        return points;
+    }
+
     async loadTelemetryComparison(laps) {
         if (!this.currentSession || laps.length === 0) return;
 
@@ -709,7 +728,7 @@ class F1DashApp {
                 laps: data.laps.map(lap => ({
                     driver_id: lap.driver_id,
                     lap_number: lap.lap_number,
-                    telemetry: lap.telemetry,
+                    telemetry: this.columnsToPoints(lap.telemetry),
                 }))
             };
 